@@ -9,7 +9,14 @@ https://github.com/TrigonDev/apgorm
 from importlib import metadata
 
 from . import exceptions
-from .connection import Connection, Pool, PoolAcquireContext
+from .connection import (
+    Batch,
+    Connection,
+    Pool,
+    PoolAcquireContext,
+    PreparedStatement,
+    StatementStats,
+)
 from .constraints.check import Check
 from .constraints.constraint import Constraint
 from .constraints.exclude import Exclude
@@ -30,12 +37,14 @@ from .migrations.describe import (
 )
 from .migrations.migration import Migration
 from .model import Model
+from .session import Session
 from .sql.query_builder import (
     BaseQueryBuilder,
     DeleteQueryBuilder,
     FetchQueryBuilder,
     FilterQueryBuilder,
     InsertQueryBuilder,
+    Page,
     UpdateQueryBuilder,
 )
 from .sql.sql import (
@@ -54,7 +63,7 @@ from .sql.sql import (
     wrap,
 )
 from .undefined import UNDEF
-from .utils.lazy_list import LazyList
+from .utils.lazy_list import ConversionStats, LazyList
 
 __version__ = metadata.version(__name__)
 
@@ -62,6 +71,7 @@ __all__ = (
     "Converter",
     "Model",
     "Database",
+    "Session",
     "ManyToMany",
     "Constraint",
     "Check",
@@ -91,9 +101,14 @@ __all__ = (
     "FilterQueryBuilder",
     "InsertQueryBuilder",
     "UpdateQueryBuilder",
+    "Page",
     "LazyList",
+    "ConversionStats",
     "Connection",
+    "Batch",
     "Pool",
+    "PreparedStatement",
+    "StatementStats",
     "Field",
     "BaseField",
     "ConverterField",
@@ -1,6 +1,20 @@
 from __future__ import annotations
 
-from typing import Any, Coroutine, Iterable
+import asyncio
+import time
+from collections import OrderedDict
+from contextvars import ContextVar, Token
+from types import TracebackType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Coroutine,
+    Iterable,
+    Mapping,
+    Sequence,
+    Union,
+    cast,
+)
 
 import asyncpg
 from asyncpg.cursor import CursorFactory
@@ -8,40 +22,254 @@ from asyncpg.transaction import Transaction
 
 from .utils.lazy_list import LazyList
 
+if TYPE_CHECKING:  # pragma: no cover
+    from .database import Database
+    from .sql.query_builder import BaseQueryBuilder
+
+_BOUND: ContextVar[Mapping[Any, Connection | None]] = ContextVar(
+    "apgorm_bound_connections", default={}
+)
+"""The connection bound to each database by Database.transaction() in the
+current context. None means that binding was opted out of."""
+
+
+def _bound_connection(database: Any) -> Connection | None:
+    return _BOUND.get().get(database)
+
+
+def _bind_connection(
+    database: Any, con: Connection | None
+) -> Token[Mapping[Any, Connection | None]]:
+    return _BOUND.set({**_BOUND.get(), database: con})
+
+
+def _unwrap(con: asyncpg.Connection) -> asyncpg.Connection:
+    # asyncpg hands out a new proxy each time a connection is acquired from a
+    # pool, but prepared statements belong to the underlying connection.
+    return getattr(con, "_con", con)
+
+
+def _rebind(
+    con: asyncpg.Connection,
+    query: str,
+    stmt: asyncpg.prepared_stmt.PreparedStatement,
+) -> asyncpg.prepared_stmt.PreparedStatement | None:
+    # asyncpg invalidates PreparedStatement objects each time their
+    # connection is released back to a pool, even though the statement is
+    # still prepared on the server, and there is no public way to reuse it.
+    # This wraps its state again, which relies on asyncpg internals (the
+    # supported versions are pinned in pyproject.toml). If they change,
+    # return None so that the statement is prepared again instead.
+    try:
+        return asyncpg.prepared_stmt.PreparedStatement(con, query, stmt._state)
+    except (AttributeError, TypeError):
+        return None
+
+
+class StatementStats:
+    """Counters for the prepared statement caches of a Pool."""
+
+    __slots__: Iterable[str] = ("hits", "misses", "evictions", "prepare_time")
+
+    def __init__(self) -> None:
+        self.hits = 0
+        """The number of queries that reused a prepared statement."""
+        self.misses = 0
+        """The number of queries that had to be prepared."""
+        self.evictions = 0
+        """The number of prepared statements dropped to make room."""
+        self.prepare_time = 0.0
+        """The total time spent preparing statements, in seconds."""
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of queries that reused a prepared statement."""
+
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"StatementStats(hits={self.hits}, misses={self.misses}, "
+            f"evictions={self.evictions}, "
+            f"prepare_time={self.prepare_time:.6f})"
+        )
+
+
+class StatementCache:
+    """LRU cache of prepared statements for a single connection."""
+
+    __slots__: Iterable[str] = ("size", "stats", "_statements")
+
+    def __init__(self, size: int, stats: StatementStats) -> None:
+        self.size = size
+        self.stats = stats
+        self._statements: OrderedDict[
+            str, asyncpg.prepared_stmt.PreparedStatement
+        ] = OrderedDict()
+
+    async def get(
+        self, con: asyncpg.Connection, query: str
+    ) -> asyncpg.prepared_stmt.PreparedStatement:
+        """Return the prepared statement for the query, preparing it if it
+        isn't cached."""
+
+        raw_con = _unwrap(con)
+        stmt = self._statements.get(query)
+        if (
+            stmt is not None
+            and (rebound := _rebind(raw_con, query, stmt)) is not None
+        ):
+            self.stats.hits += 1
+            self._statements.move_to_end(query)
+            return rebound
+
+        self.stats.misses += 1
+        start = time.perf_counter()
+        stmt = await raw_con.prepare(query)
+        self.stats.prepare_time += time.perf_counter() - start
+
+        self._statements[query] = stmt
+        self._statements.move_to_end(query)
+        if len(self._statements) > self.size:
+            self._statements.popitem(last=False)
+            self.stats.evictions += 1
+        return stmt
+
+    def discard(self, query: str) -> None:
+        """Remove the statement for the query, if it is cached."""
+
+        self._statements.pop(query, None)
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
 
 class PoolAcquireContext:
-    __slots__: Iterable[str] = ("pac",)
+    __slots__: Iterable[str] = ("pac", "pool")
 
-    def __init__(self, pac: asyncpg.pool.PoolAcquireContext) -> None:
+    def __init__(
+        self, pac: asyncpg.pool.PoolAcquireContext, pool: Pool | None = None
+    ) -> None:
         self.pac = pac
+        self.pool = pool
 
     async def __aenter__(self) -> Connection:
-        return Connection(await self.pac.__aenter__())
+        con = await self.pac.__aenter__()
+        if self.pool is None:
+            return Connection(con)
+        return Connection(con, self.pool._statement_cache(con))
 
     async def __aexit__(self, *exc: Exception) -> None:
         await self.pac.__aexit__(*exc)
 
 
 class Pool:
-    __slots__: Iterable[str] = ("pool",)
+    __slots__: Iterable[str] = ("pool", "prepare_cache", "stats", "_caches")
 
-    def __init__(self, pool: asyncpg.Pool) -> None:
+    def __init__(self, pool: asyncpg.Pool, prepare_cache: int = 0) -> None:
         self.pool = pool
+        self.prepare_cache = prepare_cache
+        """The maximum number of prepared statements cached per connection.
+        If 0, queries are not explicitly prepared and rely on asyncpg's
+        statement cache instead."""
+        self.stats = StatementStats()
+        """Counters for the prepared statement caches of every connection in
+        the pool."""
+
+        self._caches: dict[asyncpg.Connection, StatementCache] = {}
 
     def acquire(self) -> PoolAcquireContext:
-        return PoolAcquireContext(self.pool.acquire())
+        return PoolAcquireContext(self.pool.acquire(), self)
 
     def close(self) -> Coroutine[Any, Any, None]:
         return self.pool.close()  # type: ignore
 
+    def _statement_cache(
+        self, con: asyncpg.Connection
+    ) -> StatementCache | None:
+        if self.prepare_cache <= 0:
+            return None
+
+        raw_con = _unwrap(con)
+        cache = self._caches.get(raw_con)
+        if cache is None:
+            cache = StatementCache(self.prepare_cache, self.stats)
+            self._caches[raw_con] = cache
+            raw_con.add_termination_listener(
+                lambda _: self._caches.pop(raw_con, None)
+            )
+        return cache
+
+
+class PreparedStatement:
+    """A reusable prepared statement, returned by Connection.prepare()."""
+
+    __slots__: Iterable[str] = ("stmt",)
+
+    def __init__(self, stmt: asyncpg.prepared_stmt.PreparedStatement) -> None:
+        self.stmt = stmt
+
+    async def execute(self, params: list[Any] | None = None) -> str:
+        """Execute the statement.
+
+        Returns:
+            str: The status of the command, for example "UPDATE 3".
+        """
+
+        await self.stmt.fetch(*(params or []))
+        status: str = self.stmt.get_statusmsg()
+        return status
+
+    async def fetchrow(
+        self, params: list[Any] | None = None
+    ) -> dict[str, Any] | None:
+        """Execute the statement and return a single row, if any."""
+
+        res = await self.stmt.fetchrow(*(params or []))
+        return None if res is None else dict(res)
+
+    async def fetchrecord(
+        self, params: list[Any] | None = None
+    ) -> asyncpg.Record | None:
+        """Execute the statement and return a single row as a record, if
+        any."""
+
+        return await self.stmt.fetchrow(*(params or []))
+
+    async def fetchmany(
+        self, params: list[Any] | None = None
+    ) -> LazyList[asyncpg.Record, dict[str, Any]]:
+        """Execute the statement, returning all found rows."""
+
+        return LazyList(await self.stmt.fetch(*(params or [])), dict)
+
+    async def fetchrecords(
+        self, params: list[Any] | None = None
+    ) -> list[asyncpg.Record]:
+        """Execute the statement, returning all found rows as records."""
+
+        return await self.stmt.fetch(*(params or []))  # type: ignore
+
+    async def fetchval(self, params: list[Any] | None = None) -> Any:
+        """Execute the statement, returning the first value of the first
+        row."""
+
+        return await self.stmt.fetchval(*(params or []))
+
 
 class Connection:
     """Wrapper around asyncpg.Connection."""
 
-    __slots__: Iterable[str] = ("con",)
+    __slots__: Iterable[str] = ("con", "statements")
 
-    def __init__(self, con: asyncpg.Connection) -> None:
+    def __init__(
+        self, con: asyncpg.Connection, statements: StatementCache | None = None
+    ) -> None:
         self.con = con
+        self.statements = statements
+        """The prepared statement cache used by this connection, if any. See
+        the `prepare_cache` argument of Database.connect()."""
 
     def transaction(self) -> Transaction:
         """Enter a transaction.
@@ -70,9 +298,45 @@ class Connection:
 
         return self.con.transaction()
 
+    async def prepare(self, query: str) -> PreparedStatement:
+        """Prepare a statement that can be executed many times with different
+        parameters.
+
+        If the connection has a statement cache, the statement is taken from
+        (or added to) the cache, so this can also be used to prepare hot
+        queries ahead of time.
+
+        ```
+        stmt = await con.prepare("SELECT * FROM users WHERE name = $1")
+        for name in names:
+            print(await stmt.fetchrow([name]))
+        ```
+
+        Returns:
+            PreparedStatement: The prepared statement.
+        """
+
+        if self.statements is None:
+            return PreparedStatement(await self.con.prepare(query))
+        return PreparedStatement(await self.statements.get(self.con, query))
+
+    async def _run_prepared(
+        self, method: str, query: str, params: list[Any] | None
+    ) -> Any:
+        assert self.statements is not None
+        stmt = await self.prepare(query)
+        try:
+            return await getattr(stmt, method)(params)
+        except asyncpg.InvalidCachedStatementError:
+            # the schema changed since the statement was prepared
+            self.statements.discard(query)
+            if self.con.is_in_transaction():
+                raise
+            return await getattr(await self.prepare(query), method)(params)
+
     async def execute(
         self, query: str, params: list[Any] | None = None
-    ) -> None:
+    ) -> str:
         """Execute SQL.
 
         Consider using Database.execute() unless you want to manage the
@@ -81,10 +345,44 @@ class Connection:
         Args:
             query (str): The raw SQL.
             params (list[Any], optional): List of parameters. Defaults to None.
+
+        Returns:
+            str: The status of the last command, for example "UPDATE 3".
         """
 
+        if self.statements is not None and params:
+            return cast(
+                str, await self._run_prepared("execute", query, params)
+            )
         params = params or []
-        await self.con.execute(query, *params)
+        return await self.con.execute(query, *params)  # type: ignore
+
+    async def executemany(
+        self, query: str, params: Iterable[Sequence[Any]]
+    ) -> None:
+        """Execute the same SQL once for each set of parameters. The
+        statements are pipelined, so they only wait for one round trip.
+
+        Consider using Database.executemany() unless you want to manage the
+        transaction flow.
+
+        Args:
+            query (str): The raw SQL.
+            params (Iterable[Sequence[Any]]): The parameters for each
+            execution.
+        """
+
+        await self.con.executemany(query, params)
+
+    def batch(self) -> Batch:
+        """Collect write queries and send them together on this connection.
+        See `Batch`.
+
+        Returns:
+            Batch: The batch.
+        """
+
+        return Batch(self)
 
     async def fetchrow(
         self, query: str, params: list[Any] | None = None
@@ -102,6 +400,11 @@ class Connection:
             dict | None: The row or None.
         """
 
+        if self.statements is not None:
+            return cast(
+                "dict[str, Any] | None",
+                await self._run_prepared("fetchrow", query, params),
+            )
         params = params or []
         res = await self.con.fetchrow(query, *params)
         if res is not None:
@@ -109,6 +412,30 @@ class Connection:
         assert res is None or isinstance(res, dict)
         return res
 
+    async def fetchrecord(
+        self, query: str, params: list[Any] | None = None
+    ) -> asyncpg.Record | None:
+        """Execute SQL and return a single row as an asyncpg.Record, if any.
+
+        Unlike `.fetchrow()`, the row isn't converted to a dict. See
+        `.fetchrecords()`.
+
+        Consider using Database.fetchrecord() unless you want to manage the
+        transaction flow.
+
+        Args:
+            query (str): The raw SQL.
+            params (list[Any], optional): List of parameters. Defaults to None.
+
+        Returns:
+            asyncpg.Record | None: The row or None.
+        """
+
+        if self.statements is not None:
+            return await self._run_prepared("fetchrecord", query, params)
+        params = params or []
+        return await self.con.fetchrow(query, *params)
+
     async def fetchmany(
         self, query: str, params: list[Any] | None = None
     ) -> LazyList[asyncpg.Record, dict[str, Any]]:
@@ -127,9 +454,41 @@ class Connection:
             LazyList[asyncpg.Record, dict[str, Any]]: [description]
         """
 
+        if self.statements is not None:
+            return cast(
+                "LazyList[asyncpg.Record, dict[str, Any]]",
+                await self._run_prepared("fetchmany", query, params),
+            )
         params = params or []
         return LazyList(await self.con.fetch(query, *params), dict)
 
+    async def fetchrecords(
+        self, query: str, params: list[Any] | None = None
+    ) -> list[asyncpg.Record]:
+        """Execute SQL, returning all found rows as asyncpg.Records.
+
+        Unlike `.fetchmany()`, the rows aren't converted to dicts, which is
+        how query builders create models without any intermediate mappings.
+
+        Consider using Database.fetchrecords() unless you want to manage the
+        transaction flow.
+
+        Args:
+            query (str): The raw SQL.
+            params (list[Any], optional): List of parameters. Defaults to None.
+
+        Returns:
+            list[asyncpg.Record]: The rows.
+        """
+
+        if self.statements is not None:
+            return cast(
+                "list[asyncpg.Record]",
+                await self._run_prepared("fetchrecords", query, params),
+            )
+        params = params or []
+        return await self.con.fetch(query, *params)  # type: ignore
+
     async def fetchval(
         self, query: str, params: list[Any] | None = None
     ) -> Any:
@@ -152,8 +511,42 @@ class Connection:
             Any: [description]
         """
 
+        if self.statements is not None:
+            return await self._run_prepared("fetchval", query, params)
         return await self.con.fetchval(query, *params)
 
+    async def copy_records_to_table(
+        self,
+        table: str,
+        records: Iterable[Sequence[Any]],
+        columns: Sequence[str],
+        *,
+        schema: str | None = None,
+    ) -> int:
+        """Insert records into a table using the COPY protocol, which is much
+        faster than INSERT for large amounts of rows.
+
+        Consider using Database.copy_records_to_table() unless you want to
+        manage the transaction flow.
+
+        Args:
+            table (str): The name of the table.
+            records (Iterable[Sequence[Any]]): The rows to insert, each with a
+            value for every column.
+            columns (Sequence[str]): The names of the columns, in the same
+            order as the values in each record.
+            schema (str, optional): The schema of the table. Defaults to the
+            first schema on the search path that has the table.
+
+        Returns:
+            int: The number of rows inserted.
+        """
+
+        status = await self.con.copy_records_to_table(
+            table, records=records, columns=columns, schema_name=schema
+        )
+        return int(status.split()[-1])
+
     def cursor(
         self, query: str, params: list[Any] | None = None
     ) -> CursorFactory:
@@ -178,3 +571,136 @@ class Connection:
 
         params = params or []
         return self.con.cursor(query, *params)
+
+
+_Statement = Union["BaseQueryBuilder[Any]", str]
+
+
+class Batch:
+    """Collects write queries (inserts, updates and deletes from the query
+    builders, or raw SQL) and sends them together when the batch is sent.
+    Use `Database.batch()` or `Connection.batch()` to create one.
+
+    The queries run in the order they were added, inside one transaction.
+    Consecutive queries with the same SQL are sent with a single
+    `executemany`, so a burst of small writes waits for one round trip
+    instead of one per query. Query builders are sent without a RETURNING
+    clause and rows returned by raw SQL are discarded, so an open session
+    (see `Database.session()`) doesn't see the changes the batch makes.
+
+    `.add()` returns a future that is resolved once the batch was sent, or
+    fails with the error that aborted the batch. `async with db.batch()`
+    sends the batch when the block exits without an error.
+
+    Usage:
+    ```
+    async with db.batch() as batch:
+        for user_id, name in renames:
+            batch.add(User.update_query().where(id_=user_id).set(name=name))
+        done = batch.add(Game.delete_query().where(finished=True))
+    await done
+    ```
+    """
+
+    __slots__: Iterable[str] = ("target", "_queries")
+
+    def __init__(self, target: Connection | Database) -> None:
+        self.target = target
+        """The connection or database the batch is sent on."""
+
+        self._queries: list[tuple[str, list[Any], asyncio.Future[None]]] = []
+
+    def add(
+        self, query: _Statement, params: list[Any] | None = None
+    ) -> asyncio.Future[None]:
+        """Add a query to the batch.
+
+        Args:
+            query (BaseQueryBuilder | str): An insert, update or delete query
+            builder, or raw SQL.
+            params (list[Any], optional): The parameters for raw SQL.
+
+        Raises:
+            BadArgument: The query builder can't be batched (fetch queries
+            can't, since their rows would be discarded).
+
+        Returns:
+            Future[None]: Resolved once the batch was sent.
+        """
+
+        if isinstance(query, str):
+            sql, values = query, params or []
+        else:
+            sql, values = query._render_batched()
+        future = asyncio.get_running_loop().create_future()
+        self._queries.append((sql, values, future))
+        return future
+
+    async def send(self) -> None:
+        """Send every query added since the batch was last sent."""
+
+        queries, self._queries = self._queries, []
+        if not queries:
+            return
+
+        try:
+            if isinstance(self.target, Connection):
+                async with self.target.transaction():
+                    await self._send(self.target, queries)
+            else:
+                async with self.target.transaction() as con:
+                    await self._send(con, queries)
+        except asyncio.CancelledError:
+            for _, _, future in queries:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, _, future in queries:
+                if not future.done():
+                    future.set_exception(e)
+                    # send() raises the error, so futures that aren't awaited
+                    # shouldn't log it again
+                    future.exception()
+            raise
+
+        for _, _, future in queries:
+            if not future.done():
+                future.set_result(None)
+
+    def __len__(self) -> int:
+        return len(self._queries)
+
+    async def __aenter__(self) -> Batch:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            await self.send()
+            return
+        for _, _, future in self._queries:
+            future.cancel()
+        self._queries = []
+
+    @staticmethod
+    async def _send(
+        con: Connection,
+        queries: list[tuple[str, list[Any], asyncio.Future[None]]],
+    ) -> None:
+        start = 0
+        while start < len(queries):
+            sql = queries[start][0]
+            end = start + 1
+            while end < len(queries) and queries[end][0] == sql:
+                end += 1
+            if end - start == 1:
+                await con.execute(sql, queries[start][1])
+            else:
+                await con.executemany(
+                    sql, [params for _, params, _ in queries[start:end]]
+                )
+            start = end
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from enum import IntEnum, IntFlag
-from typing import Generic, Iterable, Type, TypeVar, Union, cast
+from typing import Generic, Iterable, Sequence, Type, TypeVar, Union, cast
 
 _ORIG = TypeVar("_ORIG")
 _CONV = TypeVar("_CONV")
@@ -23,6 +23,23 @@ class Converter(ABC, Generic[_ORIG, _CONV]):
         """Take the type used by your code and convert it to the type
         used to store the value in the database."""
 
+    def from_stored_many(self, values: Sequence[_ORIG]) -> Sequence[_CONV]:
+        """Convert a whole column of values given by the database.
+
+        Used instead of `from_stored()` when many rows are converted at
+        once. Override it if the converter can do better than one call per
+        value (for example with a lookup table or NumPy)."""
+
+        return [self.from_stored(v) for v in values]
+
+    def to_stored_many(self, values: Sequence[_CONV]) -> Sequence[_ORIG]:
+        """Convert a whole column of values to be stored in the database.
+
+        Used instead of `to_stored()` when many rows are inserted or updated
+        at once."""
+
+        return [self.to_stored(v) for v in values]
+
 
 _INTEF = TypeVar("_INTEF", bound="Union[IntFlag, IntEnum]")
 
@@ -48,3 +65,12 @@ class IntEFConverter(Converter[int, _INTEF], Generic[_INTEF]):
 
     def to_stored(self, value: _INTEF) -> int:
         return cast(Union[IntEnum, IntFlag], value).value
+
+    def from_stored_many(self, values: Sequence[int]) -> list[_INTEF]:
+        # members are looked up by value, and only combinations of flags
+        # (which aren't in the lookup table yet) go through the constructor
+        lookup = cast("dict[int, _INTEF]", self._type._value2member_map_)
+        return [lookup[v] if v in lookup else self._type(v) for v in values]
+
+    def to_stored_many(self, values: Sequence[_INTEF]) -> list[int]:
+        return [cast(Union[IntEnum, IntFlag], v).value for v in values]
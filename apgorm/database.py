@@ -1,14 +1,21 @@
 from __future__ import annotations
 
 import asyncio
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, contextmanager
 from pathlib import Path
-from typing import Any, AsyncGenerator, Awaitable, Iterable, Sequence
+from typing import Any, AsyncGenerator, Awaitable, Iterable, Iterator, Sequence
 
 import asyncpg
 from asyncpg.cursor import CursorFactory
 
-from .connection import Connection, Pool
+from .connection import (
+    _BOUND,
+    Batch,
+    Connection,
+    Pool,
+    _bind_connection,
+    _bound_connection,
+)
 from .exceptions import NoMigrationsToCreate
 from .indexes import Index
 from .migrations import describe
@@ -17,6 +24,7 @@ from .migrations.apply_migration import apply_migration
 from .migrations.create_migration import create_next_migration
 from .migrations.migration import Migration
 from .model import Model
+from .session import Session
 from .utils.lazy_list import LazyList
 
 
@@ -39,6 +47,7 @@ class Database:
         "_migrations_folder",
         "pool",
         "default_padding",
+        "autocommit",
     )
 
     _migrations: type[AppliedMigration]
@@ -61,13 +70,22 @@ class Database:
             cls._all_models.append(model)
 
     def __init__(
-        self, migrations_folder: Path | str, padding: int = 4
+        self,
+        migrations_folder: Path | str,
+        padding: int = 4,
+        *,
+        autocommit: bool = False,
     ) -> None:
         """Initialize the database.
 
         Args:
             migrations_folder (pathlib.Path): The folder in which migrations
             are/will be stored.
+            autocommit (bool): If set, `.execute()`, `.fetchrow()`,
+            `.fetchmany()`, `.fetchval()` and `.copy_records_to_table()` run
+            their single statement without BEGIN/COMMIT, saving two round
+            trips. Each method also accepts `autocommit` to override this per
+            call. Defaults to False.
         """
 
         self._migrations_folder = (
@@ -80,6 +98,7 @@ class Database:
             model.database = self
 
         self.default_padding = padding
+        self.autocommit = autocommit
         self.pool: Pool | None = None
 
     # migration functions
@@ -198,12 +217,24 @@ class Database:
             await self._apply_migration(m)
 
     # database functions
-    async def connect(self, **connect_kwargs: Any) -> None:
+    async def connect(
+        self, *, prepare_cache: int = 0, **connect_kwargs: Any
+    ) -> None:
         """Connect to a database. Any kwargs that can be passed to
         asyncpg.create_pool() can be used here.
+
+        Args:
+            prepare_cache (int): If greater than 0, queries are explicitly
+            prepared and up to this many prepared statements are cached per
+            connection, with hit/miss/eviction counters available on
+            `Database.pool.stats`. If 0, asyncpg's own statement cache is
+            used. Defaults to 0.
         """
 
-        self.pool = Pool(await asyncpg.create_pool(**connect_kwargs))
+        self.pool = Pool(
+            await asyncpg.create_pool(**connect_kwargs),
+            prepare_cache=prepare_cache,
+        )
 
     async def cleanup(self, timeout: float = 30) -> None:
         """Close the connection.
@@ -218,16 +249,33 @@ class Database:
         if self.pool is not None:
             await asyncio.wait_for(self.pool.close(), timeout=timeout)
 
-    async def execute(self, query: str, params: list[Any]) -> None:
-        """Execute SQL within a transaction."""
+    async def execute(
+        self, query: str, params: list[Any], *, autocommit: bool | None = None
+    ) -> str:
+        """Execute SQL within a transaction, unless autocommit is enabled.
 
-        assert self.pool is not None
-        async with self.pool.acquire() as con:
-            async with con.transaction():
-                await con.execute(query, params)
+        Returns:
+            str: The status of the last command, for example "UPDATE 3".
+        """
+
+        async with self._acquire(autocommit) as con:
+            return await con.execute(query, params)
+
+    async def executemany(
+        self,
+        query: str,
+        params: Iterable[Sequence[Any]],
+        *,
+        autocommit: bool | None = None,
+    ) -> None:
+        """Execute SQL once for each set of parameters, within a transaction
+        unless autocommit is enabled."""
+
+        async with self._acquire(autocommit) as con:
+            await con.executemany(query, params)
 
     async def fetchrow(
-        self, query: str, params: list[Any]
+        self, query: str, params: list[Any], *, autocommit: bool | None = None
     ) -> dict[str, Any] | None:
         """Fetch the first matching row.
 
@@ -235,13 +283,23 @@ class Database:
             dict | None: The row, if any.
         """
 
-        assert self.pool is not None
-        async with self.pool.acquire() as con:
-            async with con.transaction():
-                return await con.fetchrow(query, params)
+        async with self._acquire(autocommit) as con:
+            return await con.fetchrow(query, params)
+
+    async def fetchrecord(
+        self, query: str, params: list[Any], *, autocommit: bool | None = None
+    ) -> asyncpg.Record | None:
+        """Fetch the first matching row, without converting it to a dict.
+
+        Returns:
+            asyncpg.Record | None: The row, if any.
+        """
+
+        async with self._acquire(autocommit) as con:
+            return await con.fetchrecord(query, params)
 
     async def fetchmany(
-        self, query: str, params: list[Any]
+        self, query: str, params: list[Any], *, autocommit: bool | None = None
     ) -> LazyList[asyncpg.Record, dict[str, Any]]:
         """Fetch all matching rows.
 
@@ -249,18 +307,162 @@ class Database:
             LazyList[asyncpg.Record, dict]: All matching rows.
         """
 
+        async with self._acquire(autocommit) as con:
+            return await con.fetchmany(query, params)
+
+    async def fetchrecords(
+        self, query: str, params: list[Any], *, autocommit: bool | None = None
+    ) -> list[asyncpg.Record]:
+        """Fetch all matching rows, without converting them to dicts.
+
+        Returns:
+            list[asyncpg.Record]: All matching rows.
+        """
+
+        async with self._acquire(autocommit) as con:
+            return await con.fetchrecords(query, params)
+
+    async def fetchval(
+        self, query: str, params: list[Any], *, autocommit: bool | None = None
+    ) -> Any:
+        """Fetch a single value."""
+
+        async with self._acquire(autocommit) as con:
+            return await con.fetchval(query, params)
+
+    async def copy_records_to_table(
+        self,
+        table: str,
+        records: Iterable[Sequence[Any]],
+        columns: Sequence[str],
+        *,
+        autocommit: bool | None = None,
+    ) -> int:
+        """Insert records using the COPY protocol, within a transaction unless
+        autocommit is enabled.
+
+        Returns:
+            int: The number of rows inserted.
+        """
+
+        async with self._acquire(autocommit) as con:
+            return await con.copy_records_to_table(table, records, columns)
+
+    @asynccontextmanager
+    async def _acquire(
+        self, autocommit: bool | None
+    ) -> AsyncGenerator[Connection, None]:
+        con = _bound_connection(self)
+        if con is not None:
+            yield con
+            return
+
         assert self.pool is not None
+        if autocommit is None:
+            autocommit = self.autocommit
+
         async with self.pool.acquire() as con:
-            async with con.transaction():
-                return await con.fetchmany(query, params)
+            if autocommit:
+                yield con
+            else:
+                async with con.transaction():
+                    yield con
 
-    async def fetchval(self, query: str, params: list[Any]) -> Any:
-        """Fetch a single value."""
+    @asynccontextmanager
+    async def transaction(self) -> AsyncGenerator[Connection, None]:
+        """Acquire a connection and start a transaction on it.
+
+        Inside the block, the connection is bound to the current context:
+        query builders and model methods that aren't given a connection, and
+        methods like `Database.fetchrow()`, all run on it. Nesting
+        `transaction()` creates a savepoint on the same connection.
+
+        Since the connection is shared, don't run queries concurrently (for
+        example with asyncio.gather) inside the block. Use `.detach()` to run
+        queries on their own connections instead.
+
+        Usage:
+        ```
+        async with db.transaction():
+            await User(username="Circuit").create()
+            async with db.transaction():  # savepoint
+                await Game(name="Chess").create()
+        ```
+        """
+
+        con = _bound_connection(self)
+        if con is not None:
+            async with con.transaction():
+                yield con
+            return
 
         assert self.pool is not None
         async with self.pool.acquire() as con:
             async with con.transaction():
-                return await con.fetchval(query, params)
+                token = _bind_connection(self, con)
+                try:
+                    yield con
+                finally:
+                    _BOUND.reset(token)
+
+    @contextmanager
+    def detach(self) -> Iterator[None]:
+        """Opt out of the connection bound by `.transaction()`, so that
+        queries inside the block acquire their own connections (and run
+        outside of the transaction).
+
+        Usage:
+        ```
+        async with db.transaction():
+            await user.save()
+            with db.detach():
+                await AuditLog(action="save").create()  # not rolled back
+        ```
+        """
+
+        token = _bind_connection(self, None)
+        try:
+            yield
+        finally:
+            _BOUND.reset(token)
+
+    def batch(self) -> Batch:
+        """Collect write queries and send them together, in one transaction.
+        Consecutive queries with the same SQL are sent with a single
+        `executemany`. See `Batch`.
+
+        Usage:
+        ```
+        async with db.batch() as batch:
+            for user in users:
+                batch.add(User.update_query().where(id_=user.id_).set(
+                    name=user.name
+                ))
+        ```
+
+        Returns:
+            Batch: The batch.
+        """
+
+        return Batch(self)
+
+    def session(self) -> Session:
+        """Create a session (an identity map) for the models of this
+        database. Use it as a context manager: models loaded inside the block
+        with the same primary key are the same object.
+
+        Usage:
+        ```
+        with db.session():
+            user = await User.fetch(username="Circuit")
+            ...
+        ```
+
+        Returns:
+            Session: The session.
+        """
+
+        return Session(self)
 
     @asynccontextmanager
     async def cursor(
@@ -276,6 +478,7 @@ class Database:
         ```
         """
 
+        con = con or _bound_connection(self)
         if con:
             yield con.cursor(query, params)
 
@@ -48,7 +48,9 @@ class ApgormException(ApgormBaseException):
 class UndefinedFieldValue(ApgormException):
     """Raised if you try to get the value for a field that is undefined.
 
-    Usually means that the model has not been created."""
+    Usually means that the model has not been created, or that the field was
+    not selected when the model was fetched (see `FetchQueryBuilder.only()`
+    and `FetchQueryBuilder.defer()`)."""
 
     __slots__: Iterable[str] = ("field",)
 
@@ -58,7 +60,7 @@ class UndefinedFieldValue(ApgormException):
         super().__init__(
             f"The field {field.full_name} is undefined. "
             "This usually means that the model has not been "
-            "created."
+            "created, or that the field was deferred."
         )
 
 
@@ -118,3 +120,22 @@ class ModelNotFound(SqlException):
             "No Model was found for the following parameters:\n - "
             + ("\n - ".join(f"{k!r} = {v!r}" for k, v in values.items()))
         )
+
+
+class InsertSkipped(SqlException):
+    """The row was not inserted because of `.on_conflict(do_nothing=True)`.
+
+    Use `InsertQueryBuilder.execute_or_none()` for inserts that may be
+    skipped."""
+
+    __slots__: Iterable[str] = ("model", "values")
+
+    def __init__(self, model: Type[Model], values: dict[str, Any]) -> None:
+        self.model = model
+        self.values = values
+
+        super().__init__(
+            "The row was skipped because it conflicts with an existing row:"
+            "\n - "
+            + ("\n - ".join(f"{k!r} = {v!r}" for k, v in values.items()))
+        )
@@ -36,6 +36,7 @@ class BaseField(Comparable, Generic[_F, _T, _C]):
     __slots__: Iterable[str] = (
         "name",
         "model",
+        "_index",
         "sql_type",
         "_default",
         "_default_factory",
@@ -49,6 +50,9 @@ class BaseField(Comparable, Generic[_F, _T, _C]):
     model: Type[Model]  # populated by Database
     """The model this field belongs to, populated when Database is
     initialized."""
+    _index: int  # populated by Model
+    """The position of the field on its model, used as its bit in
+    `Model._changed_fields`."""
 
     def __init__(
         self,
@@ -139,24 +143,34 @@ class Field(BaseField[_F, _T, _T]):
     if not TYPE_CHECKING:
 
         def __get__(self, inst, cls):
-            if not inst:
+            if inst is None:
                 return self
-            if self.name not in inst._raw_values:
-                raise UndefinedFieldValue(self)
-            return inst._raw_values[self.name]
+            try:
+                return inst._raw_values[self.name]
+            except KeyError:
+                raise UndefinedFieldValue(self) from None
 
         def __set__(self, inst, value):
             self._validate(value)
             inst._raw_values[self.name] = value
-            inst._changed_fields.add(self.name)
+            inst._changed_fields |= 1 << self._index
 
     def with_converter(
-        self, converter: Converter[_T, _C] | Type[Converter[_T, _C]]
+        self,
+        converter: Converter[_T, _C] | Type[Converter[_T, _C]],
+        *,
+        cache: bool = False,
     ) -> ConverterField[_F, _T, _C]:
         """Add a converter to the field.
 
         Args:
             converter (Converter | Type[Converter]): The converter.
+            cache (bool): Keep the converted value on the model after it's
+            first read, instead of calling `converter.from_stored()` on
+            every read. Setting the field clears it. Since the same object
+            is returned each time, changes made to a mutable value (like a
+            dict) are only saved once the field is set again. Defaults to
+            False.
 
         Returns:
             ConverterField: The new field with the converter.
@@ -165,20 +179,23 @@ class Field(BaseField[_F, _T, _T]):
         if isinstance(converter, type) and issubclass(converter, Converter):
             converter = converter()
         f: ConverterField[_F, _T, _C] = ConverterField(
-            **self._copy_kwargs(), converter=converter
+            **self._copy_kwargs(), converter=converter, cache=cache
         )
         if hasattr(self, "name"):
             f.name = self.name
         if hasattr(self, "model"):
             f.model = self.model
+        if hasattr(self, "_index"):
+            f._index = self._index
         return f
 
 
 class ConverterField(BaseField[_F, _T, _C]):
-    __slots__: Iterable[str] = ("converter",)
+    __slots__: Iterable[str] = ("converter", "cache")
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         self.converter: Converter[_T, _C] = kwargs.pop("converter")
+        self.cache: bool = kwargs.pop("cache", False)
         super().__init__(*args, **kwargs)
 
     if not TYPE_CHECKING:
@@ -186,13 +203,25 @@ class ConverterField(BaseField[_F, _T, _C]):
         def __get__(
             self, inst: Model | None, cls: Type[Model]
         ) -> ConverterField | Any:
-            if not inst:
+            if inst is None:
                 return self
-            if self.name not in inst._raw_values:
-                raise UndefinedFieldValue(self)
-            return self.converter.from_stored(inst._raw_values[self.name])
+            if self.cache:
+                if inst._converted is None:
+                    inst._converted = {}
+                elif self.name in inst._converted:
+                    return inst._converted[self.name]
+            try:
+                value = inst._raw_values[self.name]
+            except KeyError:
+                raise UndefinedFieldValue(self) from None
+            value = self.converter.from_stored(value)
+            if self.cache:
+                inst._converted[self.name] = value
+            return value
 
         def __set__(self, inst, value):
             self._validate(value)
             inst._raw_values[self.name] = self.converter.to_stored(value)
-            inst._changed_fields.add(self.name)
+            inst._changed_fields |= 1 << self._index
+            if inst._converted:
+                inst._converted.pop(self.name, None)
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Iterable, Type, TypeVar, cast
+from weakref import WeakKeyDictionary
+
+from .connection import _bound_connection
+from .exceptions import ModelNotFound
+from .session import _current_session
+from .sql.generators.query import in_rows
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .connection import Connection
+    from .model import Model
+
+_T = TypeVar("_T", bound="Model")
+
+_LOADERS: WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple[Any, ...], _Loader]
+] = WeakKeyDictionary()
+"""The loaders waiting to run on each event loop."""
+_RUNNING: set[asyncio.Task[None]] = set()
+"""Strong references to the running loaders."""
+
+
+def _load(
+    model: Type[_T], pk: tuple[Any, ...], con: Connection | None
+) -> asyncio.Future[_T]:
+    """Queue a primary key lookup. Lookups queued in the same iteration of
+    the event loop (for the same model, connection and session) are sent as
+    a single query."""
+
+    loop = asyncio.get_running_loop()
+    con = con or _bound_connection(model.database)
+    key = (model, con, _current_session(model.database))
+
+    loaders = _LOADERS.setdefault(loop, {})
+    loader = loaders.get(key)
+    if loader is None:
+        loader = loaders[key] = _Loader(model, con)
+        loop.call_soon(loader.dispatch, loaders, key)
+    return cast("asyncio.Future[_T]", loader.add(pk))
+
+
+class _Loader:
+    __slots__: Iterable[str] = ("model", "con", "_pending")
+
+    def __init__(self, model: Type[Model], con: Connection | None) -> None:
+        self.model = model
+        self.con = con
+        self._pending: dict[tuple[Any, ...], asyncio.Future[Model]] = {}
+
+    def add(self, pk: tuple[Any, ...]) -> asyncio.Future[Model]:
+        if (fut := self._pending.get(pk)) is None:
+            fut = asyncio.get_running_loop().create_future()
+            self._pending[pk] = fut
+        return fut
+
+    def dispatch(
+        self, loaders: dict[tuple[Any, ...], _Loader], key: tuple[Any, ...]
+    ) -> None:
+        del loaders[key]
+        task = asyncio.get_running_loop().create_task(self._run())
+        _RUNNING.add(task)
+        task.add_done_callback(_RUNNING.discard)
+
+    async def _run(self) -> None:
+        pending = self._pending
+        pks = list(pending)
+        columns = [[pk[x] for pk in pks] for x in range(len(pks[0]))]
+        try:
+            models = await (
+                self.model.fetch_query(con=self.con)
+                .where(in_rows(self.model.primary_key, columns))
+                .fetchmany()
+            )
+        except asyncio.CancelledError:
+            for fut in pending.values():
+                fut.cancel()
+            raise
+        except Exception as e:
+            for fut in pending.values():
+                if not fut.done():
+                    fut.set_exception(e)
+            return
+
+        found = {m._pk_tuple(): m for m in models}
+        fields = [f.name for f in self.model.primary_key]
+        for pk, fut in pending.items():
+            if fut.done():
+                continue
+            if (m := found.get(pk)) is not None:
+                fut.set_result(m)
+            else:
+                fut.set_exception(
+                    ModelNotFound(self.model, dict(zip(fields, pk)))
+                )
@@ -12,6 +12,8 @@ from typing import (
 )
 
 if TYPE_CHECKING:  # pragma: no cover
+    import asyncpg
+
     from .connection import Connection
     from .field import BaseField
     from .model import Model
@@ -198,11 +200,11 @@ class _RealManyToMany(Generic[_REF, _THROUGH]):
 
     async def fetchmany(
         self, con: Connection | None = None
-    ) -> LazyList[dict[str, Any], _REF]:
+    ) -> LazyList[asyncpg.Record, _REF]:
         """Fetch all rows from the final table that belong to this instance.
 
         Returns:
-            LazyList[dict, Model]: A lazy-list of returned Models.
+            LazyList[asyncpg.Record, Model]: A lazy-list of returned Models.
         """
 
         return (
@@ -239,7 +241,7 @@ class _RealManyToMany(Generic[_REF, _THROUGH]):
 
     async def clear(
         self, con: Connection | None = None
-    ) -> LazyList[dict[str, Any], _THROUGH]:
+    ) -> LazyList[asyncpg.Record, _THROUGH]:
         """Remove all instances of the other model from this instance.
 
         Both of these lines do the same thing:
@@ -251,8 +253,8 @@ class _RealManyToMany(Generic[_REF, _THROUGH]):
         ```
 
         Returns:
-            LazyList[dict, _THROUGH]: A lazy-list of deleted through models (in
-            the example, it would be a list of Player).
+            LazyList[asyncpg.Record, _THROUGH]: A lazy-list of deleted
+            through models (in the example, it would be a list of Player).
         """
 
         return (
@@ -286,7 +288,7 @@ class _RealManyToMany(Generic[_REF, _THROUGH]):
 
     async def remove(
         self, other: Model, con: Connection | None = None
-    ) -> LazyList[dict[str, Any], _THROUGH]:
+    ) -> LazyList[asyncpg.Record, _THROUGH]:
         """Remove one or models from this ManyToMany.
 
         Each of these lines does the exact same thing:
@@ -1,7 +1,18 @@
 from __future__ import annotations, print_function
 
+import asyncio
+from concurrent.futures import Executor
 from contextlib import suppress
-from typing import TYPE_CHECKING, Any, Iterable, Type, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Mapping,
+    Sequence,
+    Type,
+    TypeVar,
+)
 
 from .constraints.check import Check
 from .constraints.constraint import Constraint
@@ -9,28 +20,111 @@ from .constraints.exclude import Exclude
 from .constraints.foreign_key import ForeignKey
 from .constraints.primary_key import PrimaryKey
 from .constraints.unique import Unique
-from .exceptions import ModelNotFound, SpecifiedPrimaryKey
-from .field import BaseField
+from .converter import Converter
+from .exceptions import BadArgument, ModelNotFound, SpecifiedPrimaryKey
+from .field import BaseField, ConverterField
+from .loader import _load
 from .manytomany import ManyToMany
 from .migrations.describe import DescribeConstraint, DescribeTable
+from .session import _SESSIONS, Session, _current_session
 from .sql.query_builder import (
     DeleteQueryBuilder,
     FetchQueryBuilder,
     InsertQueryBuilder,
     UpdateQueryBuilder,
+    _atomic,
 )
 from .undefined import UNDEF
 from .utils.lazy_list import LazyList
 
 if TYPE_CHECKING:  # pragma: no cover
+    import asyncpg
+
     from .connection import Connection
     from .database import Database
 
 
 _SELF = TypeVar("_SELF", bound="Model")
-
-
-class Model:
+_MISSING: Any = object()
+
+
+def _from_stored_columns(
+    converters: Sequence[Converter[Any, Any]], columns: Sequence[Sequence[Any]]
+) -> list[Sequence[Any]]:
+    """Convert each column with its converter. Used by
+    `Model._from_records_in()`, so it must be picklable."""
+
+    return [c.from_stored_many(v) for c, v in zip(converters, columns)]
+
+
+class _ModelMeta(type):
+    # models without their own __slots__ get an empty one, so instances
+    # don't carry a __dict__ next to _raw_values. Models that define their
+    # own __init__ (which usually sets extra attributes) or pass slots=False
+    # keep their __dict__.
+    def __new__(
+        mcs,
+        name: str,
+        bases: tuple[type, ...],
+        ns: dict[str, Any],
+        *,
+        slots: bool = True,
+        **kwargs: Any,
+    ) -> _ModelMeta:
+        if slots and "__init__" not in ns:
+            ns.setdefault("__slots__", ())
+        return super().__new__(mcs, name, bases, ns, **kwargs)
+
+
+def _make_init(model: type[Model]) -> Callable[..., None]:
+    """Generate an `__init__` for the model, so that building an instance
+    is straight-line code instead of a loop over every field."""
+
+    # names are dunder-prefixed so they can't collide with field names
+    env: dict[str, Any] = {"__apgorm_missing__": _MISSING}
+    args: list[str] = []
+    lines: list[str] = ["__apgorm_raw__ = {}"]
+    for x, f in enumerate(model._all_fields.values()):
+        n = f.name
+        field = f"__apgorm_field_{x}__"
+        default = f"__apgorm_default_{x}__"
+        env[field] = f
+        args.append(f"{n}=__apgorm_missing__")
+        value = (
+            f"{field}.converter.to_stored({n})"
+            if isinstance(f, ConverterField)
+            else n
+        )
+        lines += [
+            f"if {n} is not __apgorm_missing__:",
+            f"    {field}._validate({n})",
+            f"    __apgorm_raw__[{n!r}] = {value}",
+        ]
+        if f._default is not UNDEF.UNDEF:
+            env[default] = f._default
+            lines += ["else:", f"    __apgorm_raw__[{n!r}] = {default}"]
+        elif f._default_factory is not None:
+            env[default] = f._default_factory
+            lines += ["else:", f"    __apgorm_raw__[{n!r}] = {default}()"]
+    lines += [
+        "__apgorm_self__._raw_values = __apgorm_raw__",
+        "__apgorm_self__._changed_fields = 0",
+        "__apgorm_self__._converted = None",
+    ]
+
+    src = "def __init__(__apgorm_self__, {}**__apgorm_extra__):\n{}".format(
+        "".join(f"{a}, " for a in ["*", *args]) if args else "",
+        "\n".join(f"    {line}" for line in lines),
+    )
+    exec(src, env)
+    init: Callable[..., None] = env["__init__"]
+    init.__qualname__ = f"{model.__qualname__}.__init__"
+    init.__module__ = model.__module__
+    init._apgorm_generated = True  # type: ignore
+    return init
+
+
+class Model(metaclass=_ModelMeta):
     """Base class for all models. To create a new model, subclass this class
     and add it to your database like this:
 
@@ -56,17 +150,39 @@ class Model:
 
     If you wish to fetch an existing model, please use `Model.fetch` or
     `Model.fetch_query`.
+
+    Models use `__slots__`, so instances can't have attributes other than
+    their fields. To store extra attributes, either list them in
+    `__slots__` or create the model with `slots=False`:
+
+    ```
+    class User(Model, slots=False):
+        ...
+    ```
+
+    Models that define their own `__init__` keep a `__dict__` as well.
     """
 
-    __slots__: Iterable[str] = ("_raw_values", "_changed_fields")
+    __slots__: Iterable[str] = (
+        "_raw_values",
+        "_changed_fields",
+        "_converted",
+        "__weakref__",
+    )
 
     _all_fields: dict[str, BaseField[Any, Any, Any]]
     _all_constraints: dict[str, Constraint]
     _all_mtm: dict[str, ManyToMany[Any, Any]]
-    _changed_fields: set[str]
+    _fields_by_index: tuple[BaseField[Any, Any, Any], ...]
+    _changed_fields: int
+    """Bitmask of changed fields, with one bit per `BaseField._index`."""
 
     _raw_values: dict[str, Any]
+    _converted: dict[str, Any] | None
+    """Converted values of fields using `with_converter(cache=True)`."""
     _columns: set[str]
+    _query_cache: dict[tuple[Any, ...], str]
+    """Rendered SQL, keyed by the shape of the query that produced it."""
 
     tablename: str  # populated by Database
     """The name of the table, populated by Database."""
@@ -76,16 +192,19 @@ class Model:
     primary_key: tuple[BaseField[Any, Any, Any], ...]
     """The primary key for the model. All models MUST have a primary key."""
 
-    def __init_subclass__(cls) -> None:
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
         cls._all_fields = {}
         cls._all_constraints = {}
         cls._all_mtm = {}
         cls._columns = set()
+        cls._query_cache = {}
 
         for key, value in cls.__dict__.items():
             if isinstance(value, BaseField):
                 value.name = key
                 value.model = cls
+                value._index = len(cls._all_fields)
                 cls._all_fields[key] = value
                 cls._columns.add(value.name)
 
@@ -101,16 +220,27 @@ class Model:
                 value._attribute_name = key
                 cls._all_mtm[key] = value
 
+        cls._fields_by_index = tuple(cls._all_fields.values())
+        # only replace the default or generated __init__, never a custom one
+        # defined on this class or inherited from a base class
+        init = cls.__init__
+        if init is Model.__init__ or getattr(init, "_apgorm_generated", False):
+            cls.__init__ = _make_init(cls)  # type: ignore
+
     def __init__(self, **values: Any) -> None:
+        # subclasses get a generated __init__ (see _make_init), this is
+        # only used by subclasses that define their own __init__ and call
+        # super().__init__()
         self._raw_values: dict[str, Any] = {}
-        self._changed_fields = set()
+        self._changed_fields = 0
+        self._converted = None
 
         for f in self._all_fields.values():
             if f.name in values:
                 f.__set__(self, values[f.name])
             elif (d := f._get_default()) is not UNDEF.UNDEF:
                 self._raw_values[f.name] = d
-        self._changed_fields.clear()
+        self._changed_fields = 0
 
     async def delete(self: _SELF, con: Connection | None = None) -> _SELF:
         """Delete the model. Does not update the values of this model,
@@ -138,9 +268,48 @@ class Model:
             return
         q = self.update_query(con=con).where(**self._pk_fields())
         q.set(**changed_fields)
+        q._merge = False
         result = await q.execute()
-        self._raw_values.update(result[0]._raw_values)
-        self._changed_fields.clear()
+        self._update_raw(result[0]._raw_values)
+        self._changed_fields = 0
+
+    @classmethod
+    async def save_many(
+        cls: Type[_SELF],
+        models: Iterable[_SELF],
+        con: Connection | None = None,
+    ) -> None:
+        """Save the changed fields of many models at once. Updates the values
+        of the models.
+
+        Models are grouped by which fields were changed, and each group is
+        saved with a single `UPDATE ... FROM unnest(...)` query.
+
+        Raises:
+            ModelNotFound: One of the models no longer exists. None of the
+            models are saved, and they all keep their changes.
+        """
+
+        models = [m for m in models if m._changed_fields]
+        if not models:
+            return
+
+        q = cls.update_query(con=con)._bulk_stored(
+            {**m._pk_fields(), **m._get_changed_fields()} for m in models
+        )
+        q._merge = False
+        async with _atomic(q.con) as tcon:
+            q.con = tcon
+            results = list(await q.execute_many())
+            for m, res in zip(models, results):
+                if res is None:
+                    # rolls back the models that were updated
+                    raise ModelNotFound(cls, m._pk_fields())
+
+        for m, res in zip(models, results):
+            assert res is not None
+            m._update_raw(res._raw_values)
+            m._changed_fields = 0
 
     async def create(self: _SELF, con: Connection | None = None) -> _SELF:
         """Insert the model into the database. Updates the values on this
@@ -159,16 +328,84 @@ class Model:
                 if f.name in self._raw_values
             }
         )
-        self._raw_values.update((await q.execute())._raw_values)
+        q._merge = False
+        self._update_raw((await q.execute())._raw_values)
+        if (session := self._session()) is not None:
+            session._add(self)
 
         return self
 
-    async def refetch(self: _SELF, con: Connection | None = None) -> None:
+    @classmethod
+    async def create_many(
+        cls: Type[_SELF],
+        models: Iterable[_SELF],
+        con: Connection | None = None,
+        *,
+        returning: bool = False,
+    ) -> list[_SELF]:
+        """Insert many models at once.
+
+        By default, the models are inserted using COPY, which is the fastest
+        way to insert rows but doesn't return anything, so values generated
+        by the database (like serials) won't be set on the models. If you
+        need those values, pass `returning=True` to use
+        `INSERT ... SELECT ... FROM unnest(...) RETURNING *` instead.
+
+        ```
+        users = await User.create_many(User(username=n) for n in names)
+        ```
+
+        Returns:
+            list[Model]: The models that were inserted.
+        """
+
+        models = list(models)
+        q = cls.insert_query(con=con)._bulk_stored(
+            m._raw_values for m in models
+        )
+        q._merge = False
+        if returning:
+            for m, res in zip(models, await q.execute_many()):
+                m._update_raw(res._raw_values)
+        else:
+            await q.copy()
+        if (session := cls._session()) is not None:
+            for m in models:
+                session._add(m)
+
+        return models
+
+    async def refetch(
+        self: _SELF, con: Connection | None = None, *, deferred: bool = False
+    ) -> None:
         """Updates the model instance by fetching changed values from the
-        database."""
+        database.
 
-        res = await self.fetch(con, **self._pk_fields())
-        self._raw_values.update(res._raw_values)
+        Args:
+            deferred (bool): Only fetch the fields that weren't selected when
+            this model was fetched (see `FetchQueryBuilder.only()` and
+            `FetchQueryBuilder.defer()`). Defaults to False.
+
+        Raises:
+            ModelNotFound: The model no longer exists.
+        """
+
+        q = self.fetch_query(con=con).where(**(pk := self._pk_fields()))
+        if deferred:
+            missing = [
+                f
+                for f in self._all_fields.values()
+                if f.name not in self._raw_values
+            ]
+            if not missing:
+                return
+            q.only(*missing)
+
+        q._merge = False
+        res = await q.fetchone()
+        if res is None:
+            raise ModelNotFound(self.__class__, pk)
+        self._update_raw(res._raw_values)
 
     @classmethod
     async def exists(
@@ -202,6 +439,10 @@ class Model:
         user = await User.fetch(username="Circuit")
         ```
 
+        If a session is open (see `Database.session()`) and the model is
+        fetched by its primary key, the model in the session is returned
+        without a query.
+
         Raises:
             ModelNotFound: No model for the given parameters were found.
 
@@ -209,19 +450,67 @@ class Model:
             Model: The model.
         """
 
+        session = cls._session()
+        if session is not None and len(values) == len(cls.primary_key):
+            with suppress(KeyError, TypeError):  # not a pk, or unhashable
+                pk = tuple(values[f.name] for f in cls.primary_key)
+                if (cached := session.get(cls, *pk)) is not None:
+                    return cached
+
         res = await cls.fetch_query(con=con).where(**values).fetchone()
         if res is None:
             raise ModelNotFound(cls, values)
         return res
 
+    @classmethod
+    async def load(
+        cls: Type[_SELF], *pk: Any, con: Connection | None = None
+    ) -> _SELF:
+        """Fetch a model by its primary key, batched with other loads.
+
+        Every `.load()` of the same model made in the same iteration of the
+        event loop (for example by tasks started with asyncio.gather) is sent
+        as a single `WHERE pk = ANY($1)` query, so loading many models
+        concurrently costs one query instead of one each.
+
+        ```
+        users = await asyncio.gather(*(User.load(id_) for id_ in ids))
+        player = await Player.load(user_id, game_id)  # composite key
+        ```
+
+        If a session is open, models already in it are returned without a
+        query.
+
+        Raises:
+            BadArgument: The wrong number of primary key values was given.
+            ModelNotFound: No model with this primary key exists.
+
+        Returns:
+            Model: The model.
+        """
+
+        if len(pk) != len(cls.primary_key):
+            raise BadArgument(
+                f"{cls.__name__} has {len(cls.primary_key)} primary key "
+                f"fields, got {len(pk)} values."
+            )
+
+        session = cls._session()
+        if session is not None and (cached := session.get(cls, *pk)):
+            return cached
+
+        # shielded so that cancelling one caller doesn't cancel the load for
+        # the other callers waiting on the same primary key
+        return await asyncio.shield(_load(cls, pk, con))
+
     @classmethod
     async def fetchmany(
         cls: Type[_SELF], con: Connection | None = None, /, **values: Any
-    ) -> LazyList[dict[str, Any], _SELF]:
+    ) -> LazyList[asyncpg.Record, _SELF]:
         """Fetch multiple models from the database.
 
         Returns:
-            LazyList[dict[str, Any], Model]: The list of models.
+            LazyList[asyncpg.Record, Model]: The list of models.
         """
 
         return await cls.fetch_query(con=con).where(**values).fetchmany()
@@ -272,11 +561,102 @@ class Model:
 
     @classmethod
     def _from_raw(cls: type[_SELF], **values: Any) -> _SELF:
-        n = super().__new__(cls)
+        n = object.__new__(cls)
         n._raw_values = values
-        n._changed_fields = set()
+        n._changed_fields = 0
+        n._converted = None
         return n
 
+    @classmethod
+    def _from_record(
+        cls: type[_SELF], record: Mapping[str, Any], merge: bool = True
+    ) -> _SELF:
+        # dict(record) is the only mapping created for the row
+        n = object.__new__(cls)
+        n._raw_values = dict(record)
+        n._changed_fields = 0
+        n._converted = None
+        if (
+            merge
+            and (sessions := _SESSIONS.get())
+            and (session := sessions.get(cls.database)) is not None
+        ):
+            return session._merge(n)
+        return n
+
+    @classmethod
+    def _session(cls) -> Session | None:
+        return _current_session(cls.database)
+
+    @classmethod
+    def _from_records(
+        cls: type[_SELF],
+        records: Sequence[Mapping[str, Any]],
+        merge: bool = True,
+    ) -> list[_SELF]:
+        models = [cls._from_record(r, merge) for r in records]
+        # fields with cached converters are converted column-by-column, so
+        # that converters can use from_stored_many()
+        for f in cls._all_fields.values():
+            if not isinstance(f, ConverterField) or not f.cache:
+                continue
+            present = [m for m in models if f.name in m._raw_values]
+            values = f.converter.from_stored_many(
+                [m._raw_values[f.name] for m in present]
+            )
+            for m, v in zip(present, values):
+                if m._converted is None:
+                    m._converted = {}
+                m._converted[f.name] = v
+        return models
+
+    @classmethod
+    async def _from_records_in(
+        cls: type[_SELF],
+        executor: Executor,
+        records: Sequence[Mapping[str, Any]],
+        chunk_size: int,
+    ) -> list[_SELF]:
+        # like _from_records(), but the cached converter columns of each
+        # chunk are converted in the executor, and chunks run concurrently
+        fields = [
+            f
+            for f in cls._all_fields.values()
+            if isinstance(f, ConverterField) and f.cache
+        ]
+        models = [cls._from_record(r) for r in records]
+        if not fields:
+            return models
+
+        loop = asyncio.get_running_loop()
+        converters = [f.converter for f in fields]
+        jobs = []
+        for start in range(0, len(models), chunk_size):
+            chunk = models[start : start + chunk_size]
+            present = [
+                [m for m in chunk if f.name in m._raw_values] for f in fields
+            ]
+            columns = [
+                [m._raw_values[f.name] for m in p]
+                for f, p in zip(fields, present)
+            ]
+            jobs.append(
+                (
+                    present,
+                    loop.run_in_executor(
+                        executor, _from_stored_columns, converters, columns
+                    ),
+                )
+            )
+
+        for present, job in jobs:
+            for f, p, values in zip(fields, present, await job):
+                for m, v in zip(p, values):
+                    if m._converted is None:
+                        m._converted = {}
+                    m._converted[f.name] = v
+        return models
+
     @classmethod
     def _primary_key(cls) -> PrimaryKey:
         pk = PrimaryKey(*cls.primary_key)
@@ -311,11 +691,41 @@ class Model:
             exclude_constraints=exclude,
         )
 
+    def _update_raw(self, values: Mapping[str, Any]) -> None:
+        self._raw_values.update(values)
+        self._converted = None
+
+    def _refresh(self, values: Mapping[str, Any]) -> None:
+        # like _update_raw(), but fields that were changed locally are kept
+        # columns the model doesn't declare (like extra columns from a
+        # `SELECT *`) are skipped
+        fields = self._all_fields
+        for name, value in values.items():
+            field = fields.get(name)
+            if field is None:
+                continue
+            if not self._changed_fields & 1 << field._index:
+                self._raw_values[name] = value
+        self._converted = None
+
+    def _pk_tuple(self) -> tuple[Any, ...] | None:
+        try:
+            return tuple(self._raw_values[f.name] for f in self.primary_key)
+        except KeyError:
+            return None
+
     def _pk_fields(self) -> dict[str, Any]:
         return {f.name: self._raw_values[f.name] for f in self.primary_key}
 
     def _get_changed_fields(self) -> dict[str, Any]:
-        return {n: self._raw_values[n] for n in self._changed_fields}
+        changed: dict[str, Any] = {}
+        mask = self._changed_fields
+        while mask:
+            low = mask & -mask
+            name = self._fields_by_index[low.bit_length() - 1].name
+            changed[name] = self._raw_values[name]
+            mask ^= low
+        return changed
 
     # magic methods
     def __repr__(self) -> str:
@@ -0,0 +1,335 @@
+from __future__ import annotations
+
+from contextvars import ContextVar, Token
+from types import TracebackType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterable,
+    Mapping,
+    Sequence,
+    Type,
+    TypeVar,
+    cast,
+)
+from weakref import WeakValueDictionary
+
+from .constraints.foreign_key import ForeignKey
+from .exceptions import BadArgument
+from .field import BaseField
+from .sql.generators.query import in_rows
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .database import Database
+    from .model import Model
+
+_T = TypeVar("_T", bound="Model")
+
+_SESSIONS: ContextVar[Mapping[Any, Session]] = ContextVar(
+    "apgorm_sessions", default={}
+)
+"""The session opened for each database in the current context."""
+
+
+def _current_session(database: Any) -> Session | None:
+    sessions = _SESSIONS.get()
+    return sessions.get(database) if sessions else None
+
+
+def _is_complete(model: Model) -> bool:
+    raw = model._raw_values
+    return all(name in raw for name in model._all_fields)
+
+
+def _dependency_order(database: Database) -> list[Type[Model]]:
+    """The models of the database, with each model after the models its
+    foreign keys reference. Models in a reference cycle keep the order they
+    were declared in."""
+
+    models = database._all_models
+    by_table = {m.tablename: m for m in models}
+    refs: dict[Type[Model], set[Type[Model]]] = {}
+    for m in models:
+        refs[m] = set()
+        for c in m._all_constraints.values():
+            if not isinstance(c, ForeignKey):
+                continue
+            ref = c.ref_fields[0]
+            if isinstance(ref, BaseField):
+                target: Type[Model] | None = ref.model
+            elif c.ref_table is not None:
+                target = by_table.get(c.ref_table.render_no_params())
+            else:
+                target = None
+            if target is not None and target is not m:
+                refs[m].add(target)
+
+    ordered: list[Type[Model]] = []
+    visiting: set[Type[Model]] = set()
+
+    def visit(m: Type[Model]) -> None:
+        if m in ordered or m in visiting:
+            return
+        visiting.add(m)
+        for r in sorted(refs.get(m, ()), key=models.index):
+            visit(r)
+        visiting.discard(m)
+        ordered.append(m)
+
+    for m in models:
+        visit(m)
+    return ordered
+
+
+class Session:
+    """An identity map for the models of a database. Use `Database.session()`
+    to create one.
+
+    While the session is open, every model loaded from the database (by
+    fetches, and by the results of inserts and updates) with the same primary
+    key is the same object. Loading a model that is already in the session
+    refreshes the fields that haven't been changed locally, and
+    `Model.fetch()` by primary key is served from the session without a
+    query. Models loaded without some of their fields (see
+    `FetchQueryBuilder.only()`) are never added to the session.
+
+    Models deleted by `DeleteQueryBuilder.execute()` are removed from the
+    session, and so are models updated by `UpdateQueryBuilder.execute()`
+    when the updated rows aren't returned with every field, since the
+    session can't refresh them. Inserts with `.copy()` don't return any rows,
+    so upserts sent with it aren't seen by the session.
+
+    The session only holds weak references to the models, so models that
+    aren't used anymore are dropped from it.
+
+    The session is also a unit of work: new models are added with `.add()`,
+    models are deleted with `.delete()`, and `.flush()` inserts, saves and
+    deletes them all in one transaction, with one statement per table for
+    each kind of change. `async with db.session()` flushes when the block
+    exits without an error.
+
+    Usage:
+    ```
+    with db.session():
+        user = await User.fetch(id_=1)
+        assert await User.fetch(id_=1) is user  # no query
+
+    async with db.session() as session:
+        user = await User.fetch(id_=1)
+        user.nick = "Circuit"
+        session.add(Game(name="Chess"))
+        session.delete(await Game.fetch(name="Checkers"))
+    # one INSERT, one UPDATE and one DELETE were sent here
+    ```
+    """
+
+    __slots__: Iterable[str] = (
+        "database",
+        "_identity",
+        "_token",
+        "_new",
+        "_tracked",
+        "_deleted",
+    )
+
+    def __init__(self, database: Database) -> None:
+        self.database = database
+        """The database this session is for."""
+
+        self._identity: WeakValueDictionary[
+            tuple[Type[Model], tuple[Any, ...]], Model
+        ] = WeakValueDictionary()
+        self._token: Token[Mapping[Any, Session]] | None = None
+        self._new: list[Model] = []
+        self._tracked: dict[int, Model] = {}
+        self._deleted: dict[int, Model] = {}
+
+    def get(self, model: Type[_T], *pk: Any) -> _T | None:
+        """Get a model from the session by its primary key.
+
+        ```
+        user = session.get(User, 1)
+        player = session.get(Player, user_id, game_id)
+        ```
+
+        Returns:
+            Model | None: The model, or None if it isn't in the session.
+        """
+
+        return cast("_T | None", self._identity.get((model, pk)))
+
+    def add(self, model: Model) -> None:
+        """Add a model to the session. Models that were loaded in this session
+        are kept until the next flush, so that their changes are saved even
+        if they aren't used anymore. Any other model is inserted by the next
+        flush.
+
+        Raises:
+            BadArgument: The model isn't a model of this database.
+        """
+
+        self._check_model(model)
+        if any(m is model for m in self._new):
+            return
+        self._deleted.pop(id(model), None)
+        if self._is_loaded(model):
+            self._tracked[id(model)] = model
+        else:
+            self._new.append(model)
+
+    def delete(self, model: Model) -> None:
+        """Delete the model in the next flush. Deleting a model that was added
+        to the session but not flushed yet just removes it from the session.
+
+        Raises:
+            BadArgument: The model isn't a model of this database, or its
+            primary key isn't set.
+        """
+
+        self._check_model(model)
+        for x, m in enumerate(self._new):
+            if m is model:
+                del self._new[x]
+                return
+        if model._pk_tuple() is None:
+            raise BadArgument("Can't delete a model without a primary key.")
+        self._tracked.pop(id(model), None)
+        self._deleted[id(model)] = model
+
+    async def flush(self) -> None:
+        """Send every pending change to the database in a single transaction.
+
+        New models are inserted with one `INSERT` per table, changed models
+        are saved with one `UPDATE` per table and set of changed fields, and
+        deleted models are deleted with one `DELETE` per table. Tables are
+        inserted into and updated in the order of their foreign keys
+        (referenced tables first), and deleted from in the reverse order.
+        Models with array fields are inserted and saved with one query per
+        model, since unnest() can't be used for arrays.
+
+        Raises:
+            ModelNotFound: A changed model no longer exists.
+        """
+
+        new: dict[Type[Model], list[Model]] = {}
+        for m in self._new:
+            new.setdefault(type(m), []).append(m)
+        deleted: dict[Type[Model], list[Model]] = {}
+        for m in self._deleted.values():
+            deleted.setdefault(type(m), []).append(m)
+        changed: dict[Type[Model], dict[int, Model]] = {}
+        for m in [*self._identity.values(), *self._tracked.values()]:
+            if m._changed_fields and id(m) not in self._deleted:
+                changed.setdefault(type(m), {})[id(m)] = m
+
+        if not (new or changed or deleted):
+            return
+
+        order = _dependency_order(self.database)
+        async with self.database.transaction():
+            for cls in order:
+                if cls in new:
+                    await cls.create_many(new[cls], returning=True)
+                    for m in new[cls]:
+                        m._changed_fields = 0
+                        self._add(m)
+                if cls in changed:
+                    await cls.save_many(changed[cls].values())
+            for cls in reversed(order):
+                if cls in deleted:
+                    await self._delete_many(cls, deleted[cls])
+
+        self._new.clear()
+        self._tracked.clear()
+        self._deleted.clear()
+
+    def __len__(self) -> int:
+        return len(self._identity)
+
+    def __enter__(self) -> Session:
+        self._token = _SESSIONS.set({**_SESSIONS.get(), self.database: self})
+        return self
+
+    async def __aenter__(self) -> Session:
+        return self.__enter__()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        try:
+            if exc_type is None:
+                await self.flush()
+        finally:
+            self.__exit__(exc_type, exc, tb)
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        assert self._token is not None
+        _SESSIONS.reset(self._token)
+        self._token = None
+
+    def _merge(self, model: _T) -> _T:
+        """Return the model already in the session with the same primary key
+        (refreshed with the values of `model`), or add `model`. Models
+        without a value for every field are returned as they are."""
+
+        pk = model._pk_tuple()
+        if pk is None or not _is_complete(model):
+            return model
+
+        key = (type(model), pk)
+        existing = cast("_T | None", self._identity.get(key))
+        if existing is None or existing is model:
+            self._identity[key] = model
+            return model
+
+        existing._refresh(model._raw_values)
+        return existing
+
+    def _check_model(self, model: Model) -> None:
+        if model.database is not self.database:
+            raise BadArgument(
+                f"{type(model).__name__} is not a model of this database."
+            )
+
+    def _is_loaded(self, model: Model) -> bool:
+        pk = model._pk_tuple()
+        return pk is not None and (
+            self._identity.get((type(model), pk)) is model
+        )
+
+    async def _delete_many(
+        self, cls: Type[Model], models: Sequence[Model]
+    ) -> None:
+        pks = [cast("tuple[Any, ...]", m._pk_tuple()) for m in models]
+        columns = [[pk[x] for pk in pks] for x in range(len(cls.primary_key))]
+        await cls.delete_query().where(
+            in_rows(cls.primary_key, columns)
+        ).execute(returning=False)
+
+    def _add(self, model: Model) -> None:
+        pk = model._pk_tuple()
+        if pk is not None and _is_complete(model):
+            self._identity[(type(model), pk)] = model
+
+    def _evict(
+        self, cls: Type[Model], rows: Iterable[Mapping[str, Any]]
+    ) -> None:
+        """Remove the models with the primary keys of the rows, because the
+        rows were deleted or changed without the session seeing the new
+        values."""
+
+        names = [f.name for f in cls.primary_key]
+        for row in rows:
+            model = self._identity.pop(
+                (cls, tuple(row[n] for n in names)), None
+            )
+            if model is not None:
+                self._tracked.pop(id(model), None)
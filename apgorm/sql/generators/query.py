@@ -2,8 +2,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Literal, Sequence, Type, overload
 
+from apgorm.constraints.unique import Unique
+from apgorm.exceptions import BadArgument
 from apgorm.field import BaseField
-from apgorm.sql.sql import SQL, Block, join, raw, wrap
+from apgorm.sql.sql import SQL, Block, Parameter, and_, join, raw, wrap
+from apgorm.types.array import Array
 from apgorm.types.boolean import Bool
 from apgorm.undefined import UNDEF
 
@@ -50,7 +53,7 @@ def select(
     if count:
         sql += Block(raw("COUNT(*)"))
     elif fields is not None:
-        sql += join(raw(","), *fields, wrap=True)
+        sql += join(raw(","), *fields)
     else:
         sql += Block(raw("*"))
 
@@ -65,7 +68,7 @@ def select(
         sql += raw("DESC" if reverse else "ASC")
 
     if limit is not None:
-        sql += Block(raw("LIMIT"), raw(str(limit)))
+        sql += Block(raw("LIMIT"), Parameter(limit))
 
     return wrap(sql)
 
@@ -116,6 +119,8 @@ def insert(
     values: Sequence[SQL[Any]],
     return_fields: Sequence[BaseField[Any, Any, Any] | Block[Any]]
     | None = None,
+    *,
+    on_conflict: Block[Any] | None = None,
 ) -> Block[Any]:
     tablename = into if isinstance(into, Block) else raw(into.tablename)
 
@@ -128,6 +133,9 @@ def insert(
     else:
         sql += Block[Any](raw("DEFAULT VALUES"))
 
+    if on_conflict is not None:
+        sql += on_conflict
+
     if return_fields is not None:
         sql += raw("RETURNING")
         if isinstance(return_fields, (BaseField, Block)):
@@ -136,3 +144,184 @@ def insert(
             sql += join(raw(","), *return_fields)
 
     return wrap(sql)
+
+
+def on_conflict(
+    target: Sequence[BaseField[Any, Any, Any]] | Unique,
+    update: dict[str, SQL[Any]] | None = None,
+) -> Block[Any]:
+    """ON CONFLICT ... DO UPDATE SET ..., or DO NOTHING if `update` is None.
+
+    Use `excluded(field)` to refer to the value that would have been
+    inserted."""
+
+    if isinstance(target, Unique):
+        sql = Block[Any](raw("ON CONFLICT ON CONSTRAINT"), raw(target.name))
+    else:
+        sql = Block[Any](
+            raw("ON CONFLICT"),
+            join(raw(","), *(raw(f.name) for f in target), wrap=True),
+        )
+
+    if update is None:
+        sql += raw("DO NOTHING")
+    else:
+        sql += Block[Any](
+            raw("DO UPDATE SET"),
+            join(
+                raw(","),
+                *(Block[Any](raw(k), raw("="), v) for k, v in update.items()),
+            ),
+        )
+
+    return sql
+
+
+def excluded(name: str) -> Block[Any]:
+    """The value that would have been inserted for a field, for use inside
+    ON CONFLICT ... DO UPDATE."""
+
+    return raw(f"EXCLUDED.{name}")
+
+
+_SERIAL_TYPES = {
+    "SMALLSERIAL": "SMALLINT",
+    "SERIAL": "INTEGER",
+    "BIGSERIAL": "BIGINT",
+}
+
+
+def _array_cast(field: BaseField[Any, Any, Any]) -> Block[Any]:
+    if isinstance(field.sql_type, Array):
+        # unnest() would flatten the arrays into a single column
+        raise BadArgument(
+            f"Can't insert {field.full_name} with unnest(), since it is an "
+            "array."
+        )
+    type_ = field.sql_type._sql
+    return raw("::" + _SERIAL_TYPES.get(type_, type_) + "[]")
+
+
+def _unnest(
+    fields: Sequence[BaseField[Any, Any, Any]],
+    columns: Sequence[Sequence[Any]],
+    *,
+    ordinality: bool = False,
+) -> Block[Any]:
+    # with ordinality, the position of each row is added as _ordinality
+    arrays = [
+        Block[Any](Parameter(list(column)), _array_cast(f))
+        for f, column in zip(fields, columns)
+    ]
+    names = [raw(f.name) for f in fields]
+    sql = Block[Any](raw("unnest"), join(raw(","), *arrays, wrap=True))
+    if ordinality:
+        sql += raw("WITH ORDINALITY")
+        names.append(raw("_ordinality"))
+    sql += Block[Any](raw("AS _v"), join(raw(","), *names, wrap=True))
+    return sql
+
+
+def in_rows(
+    fields: Sequence[BaseField[Any, Any, Any]],
+    columns: Sequence[Sequence[Any]],
+) -> Block[Bool]:
+    """Matches rows whose values for `fields` are one of the given rows, with
+    each column sent as a single array parameter.
+
+    `field = ANY($1)` for a single field, and
+    `(a, b) IN (SELECT * FROM unnest($1, $2) ...)` for multiple fields."""
+
+    if len(fields) == 1:
+        array = Block[Any](Parameter(list(columns[0])), _array_cast(fields[0]))
+        return fields[0].eq(Block[Any](raw("ANY"), wrap(array)))
+    return Block[Bool](
+        join(raw(","), *fields, wrap=True),
+        raw("IN"),
+        wrap(raw("SELECT * FROM"), _unnest(fields, columns)),
+        wrap=True,
+    )
+
+
+def insert_many(
+    into: Model | Type[Model],
+    fields: Sequence[BaseField[Any, Any, Any]],
+    columns: Sequence[Sequence[Any]],
+    return_fields: Sequence[BaseField[Any, Any, Any] | Block[Any]]
+    | None = None,
+    *,
+    on_conflict: Block[Any] | None = None,
+) -> Block[Any]:
+    """INSERT INTO ... SELECT ... FROM unnest(...), inserting each column as a
+    single array parameter. Rows are inserted in the same order as the
+    columns."""
+
+    return insert_from(
+        into,
+        fields,
+        Block[Any](
+            _unnest(fields, columns, ordinality=True),
+            raw("ORDER BY _ordinality"),
+        ),
+        return_fields,
+        on_conflict=on_conflict,
+    )
+
+
+def insert_from(
+    into: Model | Type[Model],
+    fields: Sequence[BaseField[Any, Any, Any]],
+    from_: Block[Any],
+    return_fields: Sequence[BaseField[Any, Any, Any] | Block[Any]]
+    | None = None,
+    *,
+    on_conflict: Block[Any] | None = None,
+) -> Block[Any]:
+    """INSERT INTO ... SELECT ... FROM ..., copying the fields from another
+    table (or set-returning function)."""
+
+    names = [raw(f.name) for f in fields]
+    sql = Block[Any](raw("INSERT INTO"), raw(into.tablename))
+    sql += join(raw(","), *names, wrap=True)
+    sql += Block[Any](raw("SELECT"), join(raw(","), *names))
+    sql += Block[Any](raw("FROM"), from_)
+
+    if on_conflict is not None:
+        sql += on_conflict
+
+    if return_fields is not None:
+        sql += Block(raw("RETURNING"), join(raw(","), *return_fields))
+
+    return wrap(sql)
+
+
+def update_many(
+    table: Model | Type[Model],
+    pk: Sequence[BaseField[Any, Any, Any]],
+    fields: Sequence[BaseField[Any, Any, Any]],
+    columns: Sequence[Sequence[Any]],
+    return_fields: Sequence[BaseField[Any, Any, Any] | Block[Any]]
+    | None = None,
+) -> Block[Any]:
+    """UPDATE ... FROM unnest(...), updating each row whose primary key
+    matches. `columns` must contain the primary key values first, followed by
+    the values of `fields`."""
+
+    sql = Block[Any](raw("UPDATE"), raw(table.tablename), raw("SET"))
+    sql += join(
+        raw(","),
+        *(
+            Block[Any](raw(f.name), raw("="), raw(f"_v.{f.name}"))
+            for f in fields
+        ),
+    )
+
+    sql += Block[Any](raw("FROM"), _unnest([*pk, *fields], columns))
+    sql += Block[Any](
+        raw("WHERE"), and_(*(f.eq(raw(f"_v.{f.name}")) for f in pk))
+    )
+
+    if return_fields is not None:
+        sql += Block(raw("RETURNING"), join(raw(","), *return_fields))
+
+    return wrap(sql)
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from concurrent.futures import Executor
+from contextlib import asynccontextmanager
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -7,46 +10,354 @@ from typing import (
     Callable,
     Generic,
     Iterable,
+    List,
+    Literal,
+    Mapping,
+    Sequence,
+    Tuple,
     Type,
     TypeVar,
     cast,
+    overload,
 )
 
-from apgorm.connection import Connection
+import asyncpg
+
+from apgorm.connection import Connection, _bound_connection
+from apgorm.constraints.unique import Unique
+from apgorm.exceptions import BadArgument, InsertSkipped
+from apgorm.field import BaseField, ConverterField
+from apgorm.session import _current_session
+from apgorm.types.array import Array
 from apgorm.undefined import UNDEF
+from apgorm.utils.columns import column_array, import_numpy
 from apgorm.utils.lazy_list import LazyList
 
-from .generators.query import delete, insert, select, update
-from .sql import SQL, Block, and_, raw, sql, wrap
+from .generators.query import (
+    delete,
+    excluded,
+    insert,
+    insert_from,
+    insert_many,
+    on_conflict,
+    select,
+    update,
+    update_many,
+)
+from .sql import (
+    SQL,
+    Block,
+    Comparable,
+    Parameter,
+    Raw,
+    and_,
+    join,
+    raw,
+    sql,
+    wrap,
+)
 
 if TYPE_CHECKING:  # pragma: no cover
+    from numpy.typing import NDArray
+
+    from apgorm.database import Database
     from apgorm.model import Model
     from apgorm.types.boolean import Bool
 
 _T = TypeVar("_T", bound="Model")
+_C = TypeVar("_C")
+
+QUERY_CACHE_SIZE = 512
+"""The maximum number of rendered queries cached per model."""
+
+_SHAPE = Tuple[Tuple[Any, ...], List[Any]]
+
+
+def _record_model_converter(
+    model: Type[_T], merge: bool = True
+) -> Callable[[Mapping[str, Any]], _T]:
+    if merge:
+        return model._from_record
+    return partial(model._from_record, merge=False)
+
+
+def _records_model_converter(
+    model: Type[_T], merge: bool = True
+) -> Callable[[Sequence[Mapping[str, Any]]], Sequence[_T]]:
+    if merge:
+        return model._from_records
+    return partial(model._from_records, merge=False)
+
+
+@asynccontextmanager
+async def _transaction(
+    con: Connection | Database,
+) -> AsyncGenerator[Connection, None]:
+    if isinstance(con, Connection):
+        yield con
+    else:
+        async with con.transaction() as tcon:
+            yield tcon
+
+
+@asynccontextmanager
+async def _atomic(
+    con: Connection | Database,
+) -> AsyncGenerator[Connection, None]:
+    # like _transaction(), but also starts a transaction (or a savepoint) on
+    # connections, so that raising inside the block rolls everything back
+    async with con.transaction() as tcon:
+        yield con if isinstance(con, Connection) else tcon
+
+
+def _has_array(fields: Iterable[BaseField[Any, Any, Any]]) -> bool:
+    # unnest() can't be used for array columns, since it would flatten them
+    return any(isinstance(f.sql_type, Array) for f in fields)
+
+
+class _OnConflict:
+    __slots__: Iterable[str] = ("target", "update")
+
+    def __init__(
+        self,
+        target: Unique | Sequence[BaseField[Any, Any, Any]],
+        update: list[str] | dict[str, SQL[Any]] | None,
+    ) -> None:
+        self.target = target
+        self.update = update
+        """None for DO NOTHING, or the fields to set for DO UPDATE (an empty
+        list meaning every inserted field)."""
+
+    def target_key(self) -> tuple[str, ...]:
+        if isinstance(self.target, Unique):
+            return ("ON CONSTRAINT", self.target.name)
+        return tuple(f.name for f in self.target)
+
+    def target_names(self) -> Iterable[str]:
+        fields = (
+            self.target.fields
+            if isinstance(self.target, Unique)
+            else self.target
+        )
+        for f in fields:
+            if isinstance(f, BaseField):
+                yield f.name
+            elif isinstance(f, str):
+                yield f
+
+
+class _Keyset:
+    __slots__: Iterable[str] = ("by", "reverse")
+
+    def __init__(
+        self, by: Sequence[BaseField[Any, Any, Any]], reverse: bool
+    ) -> None:
+        self.by = by
+        self.reverse = reverse
+
+    def key(self) -> tuple[Any, ...]:
+        return tuple(f.name for f in self.by), self.reverse
+
+    def order_by(self) -> Block[Any]:
+        # select() only adds the direction after the last field
+        direction = raw("DESC" if self.reverse else "ASC")
+        return join(
+            raw(","), *[sql(f, direction) for f in self.by[:-1]], self.by[-1]
+        )
+
+    def where(self, after: Sequence[Any]) -> Block[Bool]:
+        return sql(
+            join(raw(","), *self.by, wrap=True),
+            raw("<" if self.reverse else ">"),
+            join(raw(","), *[Parameter(v) for v in after], wrap=True),
+        )
+
+
+class Page(Generic[_T]):
+    """A page of models returned by `FetchQueryBuilder.paginate()`."""
 
+    __slots__: Iterable[str] = ("models", "cursor")
 
-def _dict_model_converter(model: Type[_T]) -> Callable[[dict[str, Any]], _T]:
-    def converter(values: dict[str, Any]) -> _T:
-        return model._from_raw(**values)
+    def __init__(
+        self, models: LazyList[asyncpg.Record, _T], cursor: tuple[Any, ...]
+    ) -> None:
+        self.models = models
+        """The models on this page."""
+        self.cursor = cursor
+        """The values of the pagination fields for the last model on this
+        page. Pass it as `after` to `.paginate()` to resume after this page.
+        """
+
+
+def _optional_model_converter(
+    model: Type[_T], merge: bool = True
+) -> Callable[[Mapping[str, Any] | None], _T | None]:
+    def converter(values: Mapping[str, Any] | None) -> _T | None:
+        return None if values is None else model._from_record(values, merge)
 
     return converter
 
 
+def _converted_rows(
+    fields: Sequence[BaseField[Any, Any, Any]],
+    records: Sequence[Sequence[Any]],
+) -> list[tuple[Any, ...]]:
+    """Convert the values of each field column-by-column, and return the
+    converted rows."""
+
+    columns = [
+        (
+            f.converter.from_stored_many([r[x] for r in records])
+            if isinstance(f, ConverterField)
+            else [r[x] for r in records]
+        )
+        for x, f in enumerate(fields)
+    ]
+    return list(zip(*columns)) if columns else []
+
+
+def _stored_rows(
+    model: Type[Model], rows: Iterable[dict[str, Any]], defaults: bool
+) -> list[dict[str, Any]]:
+    """Apply validators and converters (and optionally defaults) to the
+    values of each row, column-by-column."""
+
+    rows = list(rows)
+    stored: list[dict[str, Any]] = [{} for _ in rows]
+    for f in model._all_fields.values():
+        present = [x for x, row in enumerate(rows) if f.name in row]
+        values: Sequence[Any] = [rows[x][f.name] for x in present]
+        for v in values:
+            f._validate(v)
+        if isinstance(f, ConverterField):
+            values = f.converter.to_stored_many(values)
+        for x, v in zip(present, values):
+            stored[x][f.name] = v
+
+        if defaults and len(present) != len(rows):
+            for row in stored:
+                if f.name in row:
+                    continue
+                if (d := f._get_default()) is not UNDEF.UNDEF:
+                    row[f.name] = d
+
+    return stored
+
+
+def _group_rows(
+    model: Type[Model], rows: Sequence[dict[str, Any]]
+) -> dict[tuple[str, ...], list[int]]:
+    """Group the indexes of rows by the fields they have values for."""
+
+    groups: dict[tuple[str, ...], list[int]] = {}
+    for x, row in enumerate(rows):
+        names = tuple(n for n in model._all_fields if n in row)
+        groups.setdefault(names, []).append(x)
+    return groups
+
+
+def _is_param(value: Any) -> bool:
+    return not isinstance(value, (Comparable, Raw))
+
+
+def _param_value(value: Any) -> Any:
+    return value.value if isinstance(value, Parameter) else value
+
+
+def _row_count(status: str) -> int:
+    # the status is the command tag, for example "UPDATE 3" or "DELETE 0"
+    return int(status.split()[-1])
+
+
+def _model_fields(
+    model: Type[Model], fields: Sequence[BaseField[Any, Any, Any]], name: str
+) -> list[BaseField[Any, Any, Any]]:
+    if not fields:
+        raise BadArgument(f"{name}() requires at least one field.")
+    for f in fields:
+        if model._all_fields.get(f.name) is not f:
+            raise BadArgument(
+                f"{f.full_name} is not a field of {model.tablename}."
+            )
+    return list(fields)
+
+
+def _returning_block(
+    model: Type[Model],
+    fields: list[BaseField[Any, Any, Any]] | None,
+    returning: bool,
+    pk: bool = False,
+) -> list[BaseField[Any, Any, Any]] | None:
+    # with pk, the primary key is always returned, so that the session can
+    # find the models of the changed rows
+    if not returning:
+        return list(model.primary_key) if pk else None
+    if fields is None:
+        return list(model._all_fields.values())
+    if pk:
+        return fields + [
+            f for f in model.primary_key if not any(f is r for r in fields)
+        ]
+    return fields
+
+
+def _returning_key(
+    fields: list[BaseField[Any, Any, Any]] | None, returning: bool, pk: bool
+) -> tuple[Any, ...]:
+    if not returning or fields is None:
+        return (returning, pk)
+    return (tuple(f.name for f in fields), pk)
+
+
 class BaseQueryBuilder(Generic[_T]):
     """Base class for query builders."""
 
-    __slots__: Iterable[str] = ("model", "con")
+    __slots__: Iterable[str] = ("model", "con", "_merge")
 
     def __init__(self, model: Type[_T], con: Connection | None = None) -> None:
         self.model = model
-        self.con = con or model.database
+        self.con = con or _bound_connection(model.database) or model.database
+        # whether models built from the results are merged into the open
+        # session. Model methods that update their own values disable it, so
+        # that the values aren't merged with the local changes.
+        self._merge = True
 
     def _get_block(self) -> Block[Any]:
         """Convert the data in the query builder to a Block."""
 
         raise NotImplementedError  # pragma: no cover
 
+    def _get_shape(self, *args: Any, **kwargs: Any) -> _SHAPE | None:
+        """Return the shape of the query (a hashable key that uniquely
+        identifies the rendered SQL) and the parameters for the query, in the
+        order they would be rendered in. Returns None if the query can't be
+        cached."""
+
+        return None
+
+    def _render_batched(self) -> tuple[str, list[Any]]:
+        """Render the query for `Batch.add()`, which discards any rows the
+        query returns."""
+
+        raise BadArgument(f"{type(self).__name__} can't be batched.")
+
+    def _render(self, **kwargs: Any) -> tuple[str, list[Any]]:
+        """Render the query, reusing the cached SQL for queries with the same
+        shape so that only the parameters need to be collected."""
+
+        shape = self._get_shape(**kwargs)
+        if shape is None:
+            return self._get_block(**kwargs).render()
+
+        key, params = shape
+        cache = self.model._query_cache
+        query = cache.get(key)
+        if query is None:
+            query, params = self._get_block(**kwargs).render()
+            if len(cache) < QUERY_CACHE_SIZE:
+                cache[key] = query
+        return query, params
+
 
 _S = TypeVar("_S", bound="FilterQueryBuilder[Any]")
 
@@ -54,12 +365,13 @@ _S = TypeVar("_S", bound="FilterQueryBuilder[Any]")
 class FilterQueryBuilder(BaseQueryBuilder[_T]):
     """Base class for query builders that have "where logic"."""
 
-    __slots__: Iterable[str] = ("_filters",)
+    __slots__: Iterable[str] = ("_filters", "_filter_values")
 
     def __init__(self, model: Type[_T], con: Connection | None = None) -> None:
         super().__init__(model, con)
 
         self._filters: list[Block[Bool]] = []
+        self._filter_values: list[tuple[str, SQL[Any]]] = []
 
     def where(self: _S, *filters: Block[Bool], **values: SQL[Any]) -> _S:
         """Extend the current where logic.
@@ -80,27 +392,39 @@ class FilterQueryBuilder(BaseQueryBuilder[_T]):
         # can only contain A-Za-z_ characters, there's no possibly way
         # to perform sql injection, even if the keys are user input.
         self._filters.extend(filters)
-        for k, v in values.items():
-            self._filters.append(raw(k).eq(v))
+        self._filter_values.extend(values.items())
 
         return self
 
     def _where_logic(self) -> Block[Bool] | None:
-        if not self._filters:
+        if not (self._filters or self._filter_values):
+            return None
+        return and_(
+            *self._filters, *(raw(k).eq(v) for k, v in self._filter_values)
+        )
+
+    def _where_shape(self) -> _SHAPE | None:
+        if self._filters:
+            return None
+        if not all(_is_param(v) for _, v in self._filter_values):
             return None
-        return and_(*self._filters)
+        return (
+            tuple(k for k, _ in self._filter_values),
+            [_param_value(v) for _, v in self._filter_values],
+        )
 
 
 class FetchQueryBuilder(FilterQueryBuilder[_T]):
     """Query builder for fetching models."""
 
-    __slots__: Iterable[str] = ("_order_by_logic", "_reverse")
+    __slots__: Iterable[str] = ("_order_by_logic", "_reverse", "_fields")
 
     def __init__(self, model: Type[_T], con: Connection | None = None) -> None:
         super().__init__(model, con)
 
         self._order_by_logic: SQL[Any] | UNDEF = UNDEF.UNDEF
         self._reverse: bool = False
+        self._fields: list[BaseField[Any, Any, Any]] | None = None
 
     def order_by(
         self, logic: SQL[Any], reverse: bool = False
@@ -120,6 +444,56 @@ class FetchQueryBuilder(FilterQueryBuilder[_T]):
         self._reverse = reverse
         return self
 
+    def only(self, *fields: BaseField[Any, Any, Any]) -> FetchQueryBuilder[_T]:
+        """Only select the specified fields. Accessing any other field on the
+        fetched models raises UndefinedFieldValue until `Model.refetch()` is
+        called.
+
+        Example:
+        ```
+        users = await User.fetch_query().only(User.id_, User.name).fetchmany()
+        ```
+
+        Raises:
+            BadArgument: No fields were passed, or a field doesn't belong to
+            this model.
+
+        Returns:
+            FetchQueryBuilder: Returns the query builder to allow for chaining.
+        """
+
+        self._fields = _model_fields(self.model, fields, "only")
+        return self
+
+    def defer(
+        self, *fields: BaseField[Any, Any, Any]
+    ) -> FetchQueryBuilder[_T]:
+        """Select every field except the specified ones. Useful for skipping
+        large columns that aren't needed. Accessing a deferred field on the
+        fetched models raises UndefinedFieldValue until `Model.refetch()` is
+        called.
+
+        Example:
+        ```
+        posts = await Post.fetch_query().defer(Post.body).fetchmany()
+        ```
+
+        Raises:
+            BadArgument: No fields were passed, or a field doesn't belong to
+            this model.
+
+        Returns:
+            FetchQueryBuilder: Returns the query builder to allow for chaining.
+        """
+
+        deferred = {f.name for f in _model_fields(self.model, fields, "defer")}
+        self._fields = [
+            f
+            for f in self.model._all_fields.values()
+            if f.name not in deferred
+        ]
+        return self
+
     def exists(self) -> Block[Bool]:
         """Returns this query wrapped in EXISTS (). Useful for subqueries:
 
@@ -139,30 +513,205 @@ class FetchQueryBuilder(FilterQueryBuilder[_T]):
         return sql(raw("EXISTS"), wrap(self._get_block()))
 
     async def fetchmany(
-        self, limit: int | None = None
-    ) -> LazyList[dict[str, Any], _T]:
+        self,
+        limit: int | None = None,
+        *,
+        executor: Executor | None = None,
+        chunk_size: int = 10_000,
+    ) -> LazyList[asyncpg.Record, _T]:
         """Execute the query and return a list of models.
 
+        ```
+        with ProcessPoolExecutor() as pool:
+            rows = await Export.fetch_query().fetchmany(executor=pool)
+        ```
+
         Args:
             limit (int, optional): The maximum number of models to return.
             Defaults to None.
+            executor (Executor, optional): Build every model up front, and
+            convert the values of fields with cached converters (see
+            `Field.with_converter()`) in this executor, `chunk_size` rows at
+            a time. Use a `ProcessPoolExecutor` to spread CPU-heavy
+            converters across cores (the converters must be picklable).
+            Defaults to None (models are built lazily).
+            chunk_size (int): The number of rows sent to the executor at
+            once. Defaults to 10,000.
+
+        Raises:
+            TypeError: You specified a limit that wasn't an integer (must be a
+            python int).
+            BadArgument: chunk_size was less than 1.
+
+        Returns:
+            LazyList[asyncpg.Record, Model]: The list of models matching the
+            query.
+        """
+
+        if not (limit is None or isinstance(limit, int)):
+            # NOTE: limit is sent as a parameter, but a limit that isn't an
+            # int is most likely unvalidated user input, so fail early with a
+            # clear error.
+            raise TypeError("Limit can only be an int.")
+        if chunk_size < 1:
+            raise BadArgument("chunk_size must be at least 1.")
+        res = await self.con.fetchrecords(*self._render(limit=limit))
+        models = LazyList(
+            res, _record_model_converter(self.model), self.model._from_records
+        )
+        if executor is not None:
+            models._converted = await self.model._from_records_in(
+                executor, res, chunk_size
+            )
+        return models
+
+    async def fetch_columns(
+        self, *fields: BaseField[Any, Any, Any], limit: int | None = None
+    ) -> dict[str, NDArray[Any]]:
+        """Fetch only the specified fields, as a NumPy array for each field.
+        No models are built, and converters aren't applied.
+
+        Needs NumPy (`pip install apgorm[numpy]`).
+
+        ```
+        columns = await Sale.fetch_query().fetch_columns(Sale.id_, Sale.price)
+        total = columns["price"].sum()
+        ```
+
+        The dtype of each array depends on the type of the field: `SmallInt`
+        is int16, `Int` is int32, `BigInt` is int64, `Real` is float32,
+        `DoublePrecision` is float64 and `Boolean` is bool (and the same for
+        serials). Other types use the object dtype, and NULL values are
+        kept as None. If a nullable field of one of the types above has NULL
+        values, its array is a `numpy.ma.MaskedArray` with the NULLs masked.
+
+        Args:
+            limit (int, optional): The maximum number of rows to fetch.
+            Defaults to None.
+
+        Raises:
+            BadArgument: No fields were passed, or a field doesn't belong to
+            this model.
+            TypeError: You specified a limit that wasn't an integer (must be a
+            python int).
+            ImportError: NumPy isn't installed.
+
+        Returns:
+            dict[str, numpy.ndarray]: The array for each field, by field name.
+        """
+
+        import_numpy()
+        columns, res = await self._fetch_fields(fields, "fetch_columns", limit)
+        return {
+            f.name: column_array(f, [r[x] for r in res])
+            for x, f in enumerate(columns)
+        }
+
+    async def values(
+        self, *fields: BaseField[Any, Any, Any], limit: int | None = None
+    ) -> list[dict[str, Any]]:
+        """Fetch only the specified fields, as a dict for each row. No models
+        are built, but converters are applied.
+
+        ```
+        users = await User.fetch_query().values(User.id_, User.name)
+        # [{"id_": 1, "name": "Circuit"}, ...]
+        ```
+
+        Args:
+            limit (int, optional): The maximum number of rows to fetch.
+            Defaults to None.
+
+        Raises:
+            BadArgument: No fields were passed, or a field doesn't belong to
+            this model.
+            TypeError: You specified a limit that wasn't an integer (must be a
+            python int).
+
+        Returns:
+            list[dict[str, Any]]: The values of each row, by field name.
+        """
+
+        columns, res = await self._fetch_fields(fields, "values", limit)
+        if not any(isinstance(f, ConverterField) for f in columns):
+            return [dict(r) for r in res]
+        names = [f.name for f in columns]
+        return [dict(zip(names, row)) for row in _converted_rows(columns, res)]
+
+    async def values_list(
+        self, *fields: BaseField[Any, Any, Any], limit: int | None = None
+    ) -> list[tuple[Any, ...]]:
+        """Fetch only the specified fields, as a tuple for each row. No models
+        are built, but converters are applied.
+
+        ```
+        users = await User.fetch_query().values_list(User.id_, User.name)
+        # [(1, "Circuit"), ...]
+        ```
+
+        Args:
+            limit (int, optional): The maximum number of rows to fetch.
+            Defaults to None.
+
+        Raises:
+            BadArgument: No fields were passed, or a field doesn't belong to
+            this model.
+            TypeError: You specified a limit that wasn't an integer (must be a
+            python int).
+
+        Returns:
+            list[tuple[Any, ...]]: The values of each row, in the same order
+            as the fields.
+        """
+
+        columns, res = await self._fetch_fields(fields, "values_list", limit)
+        if not any(isinstance(f, ConverterField) for f in columns):
+            return [tuple(r) for r in res]
+        return _converted_rows(columns, res)
+
+    async def scalars(
+        self, field: BaseField[Any, Any, _C], *, limit: int | None = None
+    ) -> list[_C]:
+        """Fetch only the specified field, as a flat list. No models are
+        built, but the field's converter is applied.
+
+        ```
+        ids = await User.fetch_query().where(banned=True).scalars(User.id_)
+        # [1, 2, 3, ...]
+        ```
+
+        Args:
+            limit (int, optional): The maximum number of rows to fetch.
+            Defaults to None.
 
         Raises:
+            BadArgument: The field doesn't belong to this model.
             TypeError: You specified a limit that wasn't an integer (must be a
             python int).
 
         Returns:
-            LazyList[dict, Model]: The list of models matching the query.
+            list: The value of the field for each row.
         """
 
+        _, res = await self._fetch_fields((field,), "scalars", limit)
+        values = [r[0] for r in res]
+        if isinstance(field, ConverterField):
+            return list(field.converter.from_stored_many(values))
+        return values
+
+    async def _fetch_fields(
+        self,
+        fields: Sequence[BaseField[Any, Any, Any]],
+        name: str,
+        limit: int | None,
+    ) -> tuple[list[BaseField[Any, Any, Any]], list[asyncpg.Record]]:
+        columns = _model_fields(self.model, fields, name)
         if not (limit is None or isinstance(limit, int)):
-            # NOTE: although limit as a string would work, there is a good
-            # chance that it's a string because it was user input, meaning
-            # that allowing limit to be a string would create an SQL-injection
-            # vulnerability.
             raise TypeError("Limit can only be an int.")
-        res = await self.con.fetchmany(*self._get_block(limit).render())
-        return LazyList(res, _dict_model_converter(self.model))
+        res = await self.con.fetchrecords(
+            *self._render(limit=limit, columns=columns)
+        )
+        return columns, res
 
     async def fetchone(self) -> _T | None:
         """Fetch the first model found.
@@ -171,10 +720,10 @@ class FetchQueryBuilder(FilterQueryBuilder[_T]):
             Model | None: Returns the model, or None if none were found.
         """
 
-        res = await self.con.fetchrow(*self._get_block().render())
+        res = await self.con.fetchrecord(*self._render())
         if res is None:
             return None
-        return self.model._from_raw(**res)
+        return self.model._from_record(res, self._merge)
 
     async def count(self) -> int:
         """SELECT COUNT(*) ...
@@ -183,9 +732,7 @@ class FetchQueryBuilder(FilterQueryBuilder[_T]):
             int: The count.
         """
 
-        return cast(
-            int, await self.con.fetchval(*self._get_block(count=True).render())
-        )
+        return cast(int, await self.con.fetchval(*self._render(count=True)))
 
     async def cursor(self) -> AsyncGenerator[_T, None]:
         """Return an iterator of the resulting models.
@@ -196,13 +743,94 @@ class FetchQueryBuilder(FilterQueryBuilder[_T]):
 
         con = self.con if isinstance(self.con, Connection) else None
         async with self.model.database.cursor(
-            *self._get_block().render(), con=con
+            *self._render(), con=con
         ) as cursor:
             async for res in cursor:
-                yield self.model._from_raw(**res)
+                yield self.model._from_record(res)
+
+    async def paginate(
+        self,
+        page_size: int,
+        by: Sequence[BaseField[Any, Any, Any]] | None = None,
+        *,
+        after: Sequence[Any] | None = None,
+        reverse: bool = False,
+    ) -> AsyncGenerator[Page[_T], None]:
+        """Iterate over the models in pages, using keyset pagination
+        (`WHERE (a, b) > ($1, $2) ORDER BY a, b LIMIT n`).
+
+        Unlike OFFSET, each page costs the same no matter how far into the
+        results it is, as long as there is an index on the pagination fields.
+        Unlike `.cursor()`, no transaction is held open between pages.
+
+        Example:
+        ```
+        async for page in User.fetch_query().paginate(100, by=[User.name]):
+            for user in page.models:
+                ...
+            save_for_later(page.cursor)
+
+        # later, resume after the last page that was seen
+        async for page in User.fetch_query().paginate(
+            100, by=[User.name], after=cursor
+        ):
+            ...
+        ```
+
+        Args:
+            page_size (int): The maximum number of models per page.
+            by (Sequence[BaseField], optional): The fields to order and
+            paginate by. Together they must be unique and not null. Defaults
+            to the primary key of the model.
+            after (Sequence[Any], optional): A `Page.cursor` to resume after.
+            Defaults to None.
+            reverse (bool): If set, pages are ordered descending instead of
+            ascending. Defaults to False.
+
+        Raises:
+            TypeError: page_size wasn't an integer.
+            BadArgument: `.order_by()` was used, page_size was less than 1, a
+            field doesn't belong to this model, or `after` doesn't have a
+            value for each field.
+
+        Yields:
+            Page: The (next) page of models.
+        """
+
+        if not isinstance(page_size, int):
+            raise TypeError("page_size can only be an int.")
+        if page_size < 1:
+            raise BadArgument("page_size must be at least 1.")
+        if self._order_by_logic is not UNDEF.UNDEF:
+            raise BadArgument("paginate() can't be used with order_by().")
+        if by is None:
+            by = self.model.primary_key
+        fields = _model_fields(self.model, by, "paginate")
+        if after is not None and len(after) != len(fields):
+            raise BadArgument("after must have a value for each field.")
+
+        keyset = _Keyset(fields, reverse)
+        converter = _record_model_converter(self.model)
+        while True:
+            res = await self.con.fetchrecords(
+                *self._render(limit=page_size, keyset=keyset, after=after)
+            )
+            if not res:
+                return
+            after = tuple(res[-1][f.name] for f in fields)
+            yield Page(
+                LazyList(res, converter, self.model._from_records), after
+            )
+            if len(res) < page_size:
+                return
 
     def _get_block(
-        self, limit: int | None = None, count: bool = False
+        self,
+        limit: int | None = None,
+        count: bool = False,
+        keyset: _Keyset | None = None,
+        after: Sequence[Any] | None = None,
+        columns: list[BaseField[Any, Any, Any]] | None = None,
     ) -> Block[Any]:
         if count:
             return select(
@@ -211,47 +839,206 @@ class FetchQueryBuilder(FilterQueryBuilder[_T]):
                 count=True,
                 limit=limit,
             )
+        if keyset is None:
+            return select(
+                from_=self.model,
+                fields=self._fields if columns is None else columns,
+                where=self._where_logic(),
+                order_by=self._order_by_logic,
+                reverse=self._reverse,
+                limit=limit,
+            )
+
+        fields = self._fields
+        if fields is not None:
+            fields = fields + [f for f in keyset.by if f not in fields]
+        where = self._where_logic()
+        if after is not None:
+            seek = keyset.where(after)
+            where = seek if where is None else and_(where, seek)
         return select(
             from_=self.model,
-            where=self._where_logic(),
-            order_by=self._order_by_logic,
-            reverse=self._reverse,
+            fields=fields,
+            where=where,
+            order_by=keyset.order_by(),
+            reverse=keyset.reverse,
             limit=limit,
         )
 
+    def _get_shape(
+        self,
+        limit: int | None = None,
+        count: bool = False,
+        keyset: _Keyset | None = None,
+        after: Sequence[Any] | None = None,
+        columns: list[BaseField[Any, Any, Any]] | None = None,
+    ) -> _SHAPE | None:
+        where = self._where_shape()
+        if where is None:
+            return None
+
+        order_by = self._order_by_logic
+        order_key: Any
+        if count or order_by is UNDEF.UNDEF:
+            order_key = None
+        elif isinstance(order_by, BaseField):
+            order_key = order_by.full_name
+        else:
+            return None
+
+        fields = self._fields if columns is None else columns
+        if count or fields is None:
+            fields_key = None
+        else:
+            fields_key = tuple(f.name for f in fields)
+
+        filter_keys, params = where
+        if keyset is not None:
+            order_key = (keyset.key(), after is not None)
+            params = params + list(after or ())
+        if limit is not None:
+            params = params + [limit]
+        return (
+            (
+                "select",
+                self.model.tablename,
+                fields_key,
+                filter_keys,
+                order_key,
+                self._reverse,
+                limit is not None,
+                count,
+            ),
+            params,
+        )
+
 
 class DeleteQueryBuilder(FilterQueryBuilder[_T]):
     """Query builder for deleting models."""
 
-    __slots__: Iterable[str] = ()
+    __slots__: Iterable[str] = ("_returning",)
+
+    def __init__(self, model: Type[_T], con: Connection | None = None) -> None:
+        super().__init__(model, con)
+
+        self._returning: list[BaseField[Any, Any, Any]] | None = None
+
+    def returning(
+        self, *fields: BaseField[Any, Any, Any]
+    ) -> DeleteQueryBuilder[_T]:
+        """Only return the specified fields from `.execute()`. Accessing any
+        other field on the returned models raises UndefinedFieldValue.
+
+        Example:
+        ```
+        deleted = await User.delete_query().where(banned=True).returning(
+            User.id_
+        ).execute()
+        ```
+
+        Raises:
+            BadArgument: No fields were passed, or a field doesn't belong to
+            this model.
+
+        Returns:
+            DeleteQueryBuilder: Returns the query builder to allow for
+            chaining.
+        """
+
+        self._returning = _model_fields(self.model, fields, "returning")
+        return self
+
+    @overload
+    async def execute(
+        self, returning: Literal[True] = ...
+    ) -> LazyList[asyncpg.Record, _T]:
+        ...
 
-    async def execute(self) -> LazyList[dict[str, Any], _T]:
+    @overload
+    async def execute(self, returning: Literal[False]) -> int:
+        ...
+
+    async def execute(
+        self, returning: bool = True
+    ) -> LazyList[asyncpg.Record, _T] | int:
         """Execute the deletion query.
 
+        Args:
+            returning (bool): Whether to return the deleted models. If False,
+            no rows are sent back and only the number of deleted rows is
+            returned. Defaults to True.
+
         Returns:
-            LazyList[dict, Model]: List of models deleted.
+            LazyList[asyncpg.Record, Model] | int: List of models deleted, or
+            the number of models deleted.
         """
 
-        res = await self.con.fetchmany(*self._get_block().render())
-        return LazyList(res, _dict_model_converter(self.model))
+        session = _current_session(self.model.database)
+        if not returning and session is None:
+            status = await self.con.execute(*self._render(returning=False))
+            return _row_count(status)
 
-    def _get_block(self) -> Block[Any]:
+        res = await self.con.fetchrecords(
+            *self._render(returning=returning, pk=session is not None)
+        )
+        if session is not None:
+            session._evict(self.model, res)
+        if not returning:
+            return len(res)
+        # the deleted models aren't merged into the session
+        return LazyList(
+            res,
+            _record_model_converter(self.model, False),
+            _records_model_converter(self.model, False),
+        )
+
+    def _render_batched(self) -> tuple[str, list[Any]]:
+        return self._render(returning=False)
+
+    def _get_block(
+        self, returning: bool = True, pk: bool = False
+    ) -> Block[Any]:
         return delete(
             self.model,
             self._where_logic(),
-            list(self.model._all_fields.values()),
+            _returning_block(self.model, self._returning, returning, pk),
+        )
+
+    def _get_shape(
+        self, returning: bool = True, pk: bool = False
+    ) -> _SHAPE | None:
+        where = self._where_shape()
+        if where is None:
+            return None
+        filter_keys, params = where
+        return (
+            (
+                "delete",
+                self.model.tablename,
+                filter_keys,
+                _returning_key(self._returning, returning, pk),
+            ),
+            params,
         )
 
 
 class UpdateQueryBuilder(FilterQueryBuilder[_T]):
     """Query builder for updating models."""
 
-    __slots__: Iterable[str] = ("_set_values",)
+    __slots__: Iterable[str] = (
+        "_set_values",
+        "_set_names",
+        "_bulk_rows",
+        "_returning",
+    )
 
     def __init__(self, model: Type[_T], con: Connection | None = None) -> None:
         super().__init__(model, con)
 
         self._set_values: dict[Block[Any], SQL[Any]] = {}
+        self._set_names: list[str] = []
+        self._bulk_rows: list[dict[str, Any]] = []
+        self._returning: list[BaseField[Any, Any, Any]] | None = None
 
     def set(self, **values: SQL[Any]) -> UpdateQueryBuilder[_T]:
         """Specify changes in the model.
@@ -267,36 +1054,239 @@ class UpdateQueryBuilder(FilterQueryBuilder[_T]):
         """
 
         self._set_values.update({raw(k): v for k, v in values.items()})
+        self._set_names.extend(values.keys())
+        return self
+
+    def returning(
+        self, *fields: BaseField[Any, Any, Any]
+    ) -> UpdateQueryBuilder[_T]:
+        """Only return the specified fields from `.execute()`. Accessing any
+        other field on the returned models raises UndefinedFieldValue.
+
+        Example:
+        ```
+        updated = await User.update_query().set(nickname=None).returning(
+            User.id_, User.nickname
+        ).execute()
+        ```
+
+        Raises:
+            BadArgument: No fields were passed, or a field doesn't belong to
+            this model.
+
+        Returns:
+            UpdateQueryBuilder: Returns the query builder to allow for
+            chaining.
+        """
+
+        self._returning = _model_fields(self.model, fields, "returning")
         return self
 
-    async def execute(self) -> LazyList[dict[str, Any], _T]:
+    @overload
+    async def execute(
+        self, returning: Literal[True] = ...
+    ) -> LazyList[asyncpg.Record, _T]:
+        ...
+
+    @overload
+    async def execute(self, returning: Literal[False]) -> int:
+        ...
+
+    async def execute(
+        self, returning: bool = True
+    ) -> LazyList[asyncpg.Record, _T] | int:
         """Execute the query.
 
+        Args:
+            returning (bool): Whether to return the updated models. If False,
+            no rows are sent back and only the number of updated rows is
+            returned. Defaults to True.
+
         Returns:
-            LazyList[dict, Model]: List of updated models.
+            LazyList[asyncpg.Record, Model] | int: List of updated models, or
+            the number of models updated.
         """
 
-        res = await self.con.fetchmany(*self._get_block().render())
-        return LazyList(res, _dict_model_converter(self.model))
+        session = _current_session(self.model.database)
+        if not returning and session is None:
+            status = await self.con.execute(*self._render(returning=False))
+            return _row_count(status)
 
-    def _get_block(self) -> Block[Any]:
+        res = await self.con.fetchrecords(
+            *self._render(returning=returning, pk=session is not None)
+        )
+        if session is not None and (
+            not returning or self._returning is not None
+        ):
+            # without every field, the session can't refresh the models
+            session._evict(self.model, res)
+        if not returning:
+            return len(res)
+        return LazyList(
+            res,
+            _record_model_converter(self.model, self._merge),
+            _records_model_converter(self.model, self._merge),
+        )
+
+    def bulk(self, rows: Iterable[dict[str, Any]]) -> UpdateQueryBuilder[_T]:
+        """Add rows to be updated by `.execute_many()`.
+
+        Each row is a dict containing the primary key of the row to update,
+        and the new values for any other fields. Validators and converters
+        are applied column-by-column, without creating any models.
+
+        ```
+        await User.update_query().bulk(
+            {"username": name, "nickname": nick} for name, nick in nicks
+        ).execute_many()
+        ```
+
+        Returns:
+            UpdateQueryBuilder: Returns the query builder to allow for
+            chaining.
+        """
+
+        return self._bulk_stored(
+            _stored_rows(self.model, rows, defaults=False)
+        )
+
+    async def execute_many(self) -> LazyList[asyncpg.Record | None, _T | None]:
+        """Update the rows added with `.bulk()` using
+        `UPDATE ... FROM unnest(...) WHERE pk = ... RETURNING *`.
+
+        Rows are grouped by which fields they have values for, and each group
+        is sent as a single query. Groups with array fields are sent with one
+        `UPDATE` per row instead, since unnest() would flatten the arrays. If
+        the query builder wasn't given a connection, all groups are updated
+        inside one transaction.
+
+        Raises:
+            BadArgument: `.where()` was used, or a row is missing a primary
+            key value or has no values to update.
+
+        Returns:
+            LazyList[asyncpg.Record | None, Model | None]: The updated models,
+            in the same order as the rows. If no row with a matching primary
+            key was found, the model will be None.
+        """
+
+        if self._filters or self._filter_values:
+            raise BadArgument("execute_many() can't be used with where().")
+
+        pk = self.model.primary_key
+        pk_names = [f.name for f in pk]
+        return_fields = list(self.model._all_fields.values())
+        results: list[Mapping[str, Any] | None] = [None] * len(self._bulk_rows)
+        async with _transaction(self.con) as con:
+            for names, indexes in self._bulk_groups().items():
+                fields = [
+                    self.model._all_fields[n]
+                    for n in names
+                    if n not in pk_names
+                ]
+                if not fields or not set(pk_names).issubset(names):
+                    raise BadArgument(
+                        "Each row must have a value for every primary key "
+                        "field and at least one other field."
+                    )
+
+                if _has_array([*pk, *fields]):
+                    res = []
+                    for x in indexes:
+                        row = self._bulk_rows[x]
+                        res.extend(
+                            await con.fetchrecords(
+                                *update(
+                                    self.model,
+                                    {raw(f.name): row[f.name] for f in fields},
+                                    and_(*(f.eq(row[f.name]) for f in pk)),
+                                    return_fields,
+                                ).render()
+                            )
+                        )
+                else:
+                    columns = [
+                        [self._bulk_rows[x][f.name] for x in indexes]
+                        for f in [*pk, *fields]
+                    ]
+                    res = await con.fetchrecords(
+                        *update_many(
+                            self.model, pk, fields, columns, return_fields
+                        ).render()
+                    )
+
+                # UPDATE ... FROM doesn't keep the order of the rows
+                found = {tuple(r[n] for n in pk_names): r for r in res}
+                for x in indexes:
+                    results[x] = found.get(
+                        tuple(self._bulk_rows[x][n] for n in pk_names)
+                    )
+
+        return LazyList(
+            results, _optional_model_converter(self.model, self._merge)
+        )
+
+    def _render_batched(self) -> tuple[str, list[Any]]:
+        return self._render(returning=False)
+
+    def _get_block(
+        self, returning: bool = True, pk: bool = False
+    ) -> Block[Any]:
         return update(
             self.model,
             {k: v for k, v in self._set_values.items()},
             where=self._where_logic(),
-            return_fields=list(self.model._all_fields.values()),
+            return_fields=_returning_block(
+                self.model, self._returning, returning, pk
+            ),
+        )
+
+    def _get_shape(
+        self, returning: bool = True, pk: bool = False
+    ) -> _SHAPE | None:
+        where = self._where_shape()
+        set_values = list(self._set_values.values())
+        if where is None or not all(_is_param(v) for v in set_values):
+            return None
+        filter_keys, params = where
+        return (
+            (
+                "update",
+                self.model.tablename,
+                tuple(self._set_names),
+                filter_keys,
+                _returning_key(self._returning, returning, pk),
+            ),
+            [_param_value(v) for v in set_values] + params,
         )
 
+    def _bulk_stored(
+        self, rows: Iterable[dict[str, Any]]
+    ) -> UpdateQueryBuilder[_T]:
+        self._bulk_rows.extend(rows)
+        return self
+
+    def _bulk_groups(self) -> dict[tuple[str, ...], list[int]]:
+        return _group_rows(self.model, self._bulk_rows)
+
 
 class InsertQueryBuilder(BaseQueryBuilder[_T]):
     """Query builder for creating a model."""
 
-    __slots__: Iterable[str] = ("_set_values",)
+    __slots__: Iterable[str] = (
+        "_set_values",
+        "_set_names",
+        "_bulk_rows",
+        "_on_conflict",
+    )
 
     def __init__(self, model: Type[_T], con: Connection | None = None) -> None:
         super().__init__(model, con)
 
         self._set_values: dict[Block[Any], SQL[Any]] = {}
+        self._set_names: list[str] = []
+        self._bulk_rows: list[dict[str, Any]] = []
+        self._on_conflict: _OnConflict | None = None
 
     def set(self, **values: SQL[Any]) -> InsertQueryBuilder[_T]:
         """Specify values to be set in the database.
@@ -311,20 +1301,288 @@ class InsertQueryBuilder(BaseQueryBuilder[_T]):
         """
 
         self._set_values.update({raw(k): v for k, v in values.items()})
+        self._set_names.extend(values.keys())
+        return self
+
+    def on_conflict(
+        self,
+        target: Unique
+        | BaseField[Any, Any, Any]
+        | Sequence[BaseField[Any, Any, Any]]
+        | None = None,
+        *,
+        do_update: bool
+        | Iterable[BaseField[Any, Any, Any] | str]
+        | dict[str, SQL[Any]] = False,
+        do_nothing: bool = False,
+    ) -> InsertQueryBuilder[_T]:
+        """Specify what to do if the insert conflicts with an existing row
+        (`INSERT ... ON CONFLICT`). Works with `.execute()`, `.execute_many()`
+        and `.copy()`.
+
+        ```
+        # insert the user, or update the nickname if they already exist
+        await User.insert_query().set(
+            username="Circuit", nickname="Circ"
+        ).on_conflict(do_update=[User.nickname]).execute()
+
+        # insert any users that don't already exist
+        await User.insert_query().bulk(rows).on_conflict(
+            User.email_unique, do_nothing=True
+        ).copy()
+        ```
+
+        Args:
+            target (Unique | BaseField | Sequence[BaseField], optional): The
+            unique constraint or the fields of the unique index that might
+            conflict. Defaults to the primary key of the model.
+
+        Kwargs:
+            do_update (bool | Iterable[BaseField | str] | dict[str, SQL]): If
+            True, update every inserted field (except the target fields) to
+            the new value. If a list of fields, only update those fields. If a
+            dict, set each field to the given value (use
+            `raw("EXCLUDED.field")` to refer to the value that would have been
+            inserted).
+            do_nothing (bool): Skip rows that conflict. No model is returned
+            for skipped rows.
+
+        Raises:
+            BadArgument: Both or neither of do_update and do_nothing were
+            specified, or the target is a constraint on another model.
+
+        Returns:
+            InsertQueryBuilder: Returns the query builder to allow for
+            chaining.
+        """
+
+        if bool(do_update is not False) == bool(do_nothing):
+            raise BadArgument("Specify one of do_update or do_nothing.")
+
+        if target is None:
+            target = self.model.primary_key
+        elif isinstance(target, BaseField):
+            target = (target,)
+        elif isinstance(target, Unique) and not any(
+            c is target for c in self.model._all_constraints.values()
+        ):
+            raise BadArgument(
+                f"{target!r} is not a constraint on {self.model.__name__}."
+            )
+
+        update: list[str] | dict[str, SQL[Any]] | None
+        if do_nothing:
+            update = None
+        elif do_update is True:
+            update = []  # every inserted field
+        elif isinstance(do_update, dict):
+            update = do_update
+        else:
+            update = [
+                f.name if isinstance(f, BaseField) else f
+                for f in cast(
+                    "Iterable[BaseField[Any, Any, Any] | str]", do_update
+                )
+            ]
+            if not update:
+                raise BadArgument("do_update can't be empty.")
+
+        self._on_conflict = _OnConflict(target, update)
         return self
 
+    def bulk(self, rows: Iterable[dict[str, Any]]) -> InsertQueryBuilder[_T]:
+        """Add rows to be inserted by `.execute_many()` or `.copy()`.
+
+        Each row is a dict of values, the same as what you would pass to
+        `Model(**values)`. Validators, converters, and defaults are applied
+        column-by-column, without creating any models.
+
+        ```
+        await User.insert_query().bulk(
+            {"username": name} for name in names
+        ).copy()
+        ```
+
+        Returns:
+            InsertQueryBuilder: Returns the query builder to allow for
+            chaining.
+        """
+
+        return self._bulk_stored(_stored_rows(self.model, rows, defaults=True))
+
+    async def execute_many(self) -> LazyList[asyncpg.Record, _T]:
+        """Insert the rows added with `.bulk()` using
+        `INSERT ... SELECT ... FROM unnest(...) RETURNING *`.
+
+        Rows are grouped by which fields they have values for, and each group
+        is sent as a single query. Groups with array fields are sent with one
+        `INSERT` per row instead, since unnest() would flatten the arrays. If
+        the query builder wasn't given a connection, all groups are inserted
+        inside one transaction.
+
+        Returns:
+            LazyList[asyncpg.Record, Model]: The inserted models, in the same
+            order as the rows. If `.on_conflict(do_nothing=True)` was used,
+            skipped rows are left out. Rows without a value for every primary
+            key field can't be matched back, so if some of them were skipped,
+            the rest of their group is returned at the end.
+        """
+
+        return_fields = list(self.model._all_fields.values())
+        results: list[Mapping[str, Any] | None] = [None] * len(self._bulk_rows)
+        async with _transaction(self.con) as con:
+            for names, indexes in self._bulk_groups().items():
+                conflict = self._conflict_block(names)
+                if not names:
+                    query = insert(
+                        self.model, [], [], return_fields, on_conflict=conflict
+                    ).render()
+                    for x in indexes:
+                        results[x] = await con.fetchrecord(*query)
+                    continue
+
+                fields = [self.model._all_fields[n] for n in names]
+                if _has_array(fields):
+                    res = []
+                    for x in indexes:
+                        res.extend(
+                            await con.fetchrecords(
+                                *insert(
+                                    self.model,
+                                    [raw(n) for n in names],
+                                    [self._bulk_rows[x][n] for n in names],
+                                    return_fields,
+                                    on_conflict=conflict,
+                                ).render()
+                            )
+                        )
+                else:
+                    columns = [
+                        [self._bulk_rows[x][n] for x in indexes] for n in names
+                    ]
+                    res = await con.fetchrecords(
+                        *insert_many(
+                            self.model,
+                            fields,
+                            columns,
+                            return_fields,
+                            on_conflict=conflict,
+                        ).render()
+                    )
+                self._place_returned(results, names, indexes, res)
+
+        return LazyList(
+            [r for r in results if r is not None],
+            _record_model_converter(self.model, self._merge),
+            _records_model_converter(self.model, self._merge),
+        )
+
+    def _place_returned(
+        self,
+        results: list[Mapping[str, Any] | None],
+        names: tuple[str, ...],
+        indexes: list[int],
+        rows: Sequence[Mapping[str, Any]],
+    ) -> None:
+        pk = [f.name for f in self.model.primary_key]
+        if all(n in names for n in pk):
+            # match the rows back to their position by primary key, so
+            # skipped rows don't shift the others
+            positions: dict[tuple[Any, ...], int] = {}
+            for x in indexes:
+                positions.setdefault(
+                    tuple(self._bulk_rows[x][n] for n in pk), x
+                )
+            for row in rows:
+                pos = positions.pop(tuple(row[n] for n in pk), None)
+                if pos is None:
+                    results.append(row)
+                else:
+                    results[pos] = row
+        elif len(rows) == len(indexes):
+            # rows are inserted and returned in the order of the unnest()
+            for x, row in zip(indexes, rows):
+                results[x] = row
+        else:
+            # some rows were skipped, so there's no way to tell which rows
+            # were returned
+            results.extend(rows)
+
+    async def copy(self) -> int:
+        """Insert the rows added with `.bulk()` using the COPY protocol.
+
+        This is the fastest way to insert many rows, but nothing is returned,
+        so values generated by the database (like serials) can't be seen.
+        Like `.execute_many()`, rows are grouped by which fields they have
+        values for.
+
+        Returns:
+            int: The number of rows inserted.
+        """
+
+        count = 0
+        async with _transaction(self.con) as con:
+            for names, indexes in self._bulk_groups().items():
+                conflict = self._conflict_block(names)
+                if not names:
+                    query = insert(
+                        self.model, [], [], [raw("1")], on_conflict=conflict
+                    ).render()
+                    for _ in indexes:
+                        count += len(await con.fetchrecords(*query))
+                    continue
+
+                records = [
+                    tuple(self._bulk_rows[x][n] for n in names)
+                    for x in indexes
+                ]
+                if conflict is None:
+                    count += await con.copy_records_to_table(
+                        self.model.tablename, records, names
+                    )
+                else:
+                    count += await self._copy_upsert(
+                        con, names, records, conflict
+                    )
+        return count
+
     async def execute(self) -> _T:
         """Execute the query.
 
         Returns:
             Model: The model that was inserted.
+
+        Raises:
+            InsertSkipped: The row was skipped by
+            `.on_conflict(do_nothing=True)`. Use `.execute_or_none()` for
+            inserts that may be skipped.
         """
 
-        res = await self.con.fetchrow(*self._get_block().render())
-        assert res is not None
-        return self.model._from_raw(**res)
+        res = await self.execute_or_none()
+        if res is None:
+            raise InsertSkipped(
+                self.model,
+                dict(zip(self._set_names, self._set_values.values())),
+            )
+        return res
 
-    def _get_block(self) -> Block[Any]:
+    async def execute_or_none(self) -> _T | None:
+        """Execute the query, returning None if the row was skipped by
+        `.on_conflict(do_nothing=True)`.
+
+        Returns:
+            Model | None: The model that was inserted, if any.
+        """
+
+        res = await self.con.fetchrecord(*self._render())
+        if res is None:
+            return None
+        return self.model._from_record(res, self._merge)
+
+    def _render_batched(self) -> tuple[str, list[Any]]:
+        return self._render(returning=False)
+
+    def _get_block(self, returning: bool = True) -> Block[Any]:
         value_names = list(self._set_values.keys())
         value_values = list(self._set_values.values())
 
@@ -332,5 +1590,110 @@ class InsertQueryBuilder(BaseQueryBuilder[_T]):
             self.model,
             value_names,
             value_values,
-            return_fields=list(self.model._all_fields.values()),
+            return_fields=list(self.model._all_fields.values())
+            if returning
+            else None,
+            on_conflict=self._conflict_block(self._set_names),
         )
+
+    def _get_shape(self, returning: bool = True) -> _SHAPE | None:
+        set_values = list(self._set_values.values())
+        if not all(_is_param(v) for v in set_values):
+            return None
+
+        conflict_key: tuple[Any, ...] | None = None
+        conflict_params: list[Any] = []
+        if (oc := self._on_conflict) is not None:
+            if isinstance(oc.update, dict):
+                if not all(_is_param(v) for v in oc.update.values()):
+                    return None
+                update_key: Any = tuple(oc.update)
+                conflict_params = [_param_value(v) for v in oc.update.values()]
+            else:
+                update_key = None if oc.update is None else tuple(oc.update)
+            conflict_key = (oc.target_key(), update_key)
+
+        return (
+            (
+                "insert",
+                self.model.tablename,
+                tuple(self._set_names),
+                conflict_key,
+                returning,
+            ),
+            [_param_value(v) for v in set_values] + conflict_params,
+        )
+
+    def _conflict_block(self, names: Sequence[str]) -> Block[Any] | None:
+        oc = self._on_conflict
+        if oc is None:
+            return None
+
+        if oc.update is None:
+            return on_conflict(oc.target, None)
+        if isinstance(oc.update, dict):
+            return on_conflict(oc.target, oc.update)
+
+        if oc.update:
+            update_names = oc.update
+        else:
+            target_names = set(oc.target_names())
+            update_names = [n for n in names if n not in target_names]
+        if not update_names:
+            # nothing to update, but a no-op DO UPDATE still returns the
+            # existing row, unlike DO NOTHING
+            update_names = list(oc.target_names())[:1]
+        if not update_names:
+            return on_conflict(oc.target, None)
+        return on_conflict(oc.target, {n: excluded(n) for n in update_names})
+
+    async def _copy_upsert(
+        self,
+        con: Connection,
+        names: Sequence[str],
+        records: list[tuple[Any, ...]],
+        conflict: Block[Any],
+    ) -> int:
+        # COPY doesn't support ON CONFLICT, so the rows are copied into a
+        # temporary table first and then inserted from there. The table is
+        # always referred to through pg_temp, so that a permanent table with
+        # the same name can never be used (or dropped) instead.
+        name = f"_apgorm_copy_{self.model.tablename}"
+        temp = f"pg_temp.{name}"
+        fields = [self.model._all_fields[n] for n in names]
+        await con.execute(f"DROP TABLE IF EXISTS {temp}", [])
+        await con.execute(
+            *sql(
+                raw(f"CREATE TEMPORARY TABLE {temp} AS SELECT"),
+                join(raw(","), *(raw(n) for n in names)),
+                raw("FROM"),
+                raw(self.model.tablename),
+                raw("WITH NO DATA"),
+            ).render()
+        )
+        await con.copy_records_to_table(name, records, names, schema="pg_temp")
+        count = await con.fetchval(
+            *sql(
+                raw("WITH _inserted AS"),
+                insert_from(
+                    self.model,
+                    fields,
+                    raw(temp),
+                    [raw("1")],
+                    on_conflict=conflict,
+                ),
+                raw("SELECT COUNT(*) FROM _inserted"),
+            ).render()
+        )
+        await con.execute(f"DROP TABLE {temp}", [])
+        return cast(int, count)
+
+    def _bulk_stored(
+        self, rows: Iterable[dict[str, Any]]
+    ) -> InsertQueryBuilder[_T]:
+        # rows that already contain stored values (like Model._raw_values)
+        self._bulk_rows.extend(rows)
+        return self
+
+    def _bulk_groups(self) -> dict[tuple[str, ...], list[int]]:
+        return _group_rows(self.model, self._bulk_rows)
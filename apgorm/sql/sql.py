@@ -5,8 +5,10 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Generator,
     Generic,
     Iterable,
+    Iterator,
     Type,
     TypeVar,
     Union,
@@ -221,7 +223,13 @@ class Comparable:
 
 
 class Block(Comparable, Generic[_SQLT_CO]):
-    """Represents a list of raw sql and parameters."""
+    """Represents a tree of raw sql, parameters, and other Blocks.
+
+    Nesting a Block stores a shallow snapshot of it (its direct pieces, not
+    its whole subtree), so nesting Blocks is cheap and changing a Block
+    after nesting it doesn't change its parent. The tree is only flattened
+    once, when it is rendered.
+    """
 
     __slots__: Iterable[str] = ("_pieces", "_wrap")
 
@@ -240,7 +248,7 @@ class Block(Comparable, Generic[_SQLT_CO]):
         ```
         """
 
-        self._pieces: list[Raw | Parameter[Any]] = []
+        self._pieces: list[Raw | Parameter[Any] | Block[Any]] = []
 
         if len(pieces) == 1 and isinstance(pieces[0], Block):
             block = pieces[0]
@@ -254,7 +262,7 @@ class Block(Comparable, Generic[_SQLT_CO]):
                 if isinstance(p, Comparable):
                     p = p._get_block()
                 if isinstance(p, Block):
-                    self._pieces.extend(p.get_pieces())
+                    self._add_block(p)
                 elif isinstance(p, (Raw, Parameter)):
                     self._pieces.append(p)
                 else:
@@ -285,17 +293,57 @@ class Block(Comparable, Generic[_SQLT_CO]):
     def get_pieces(
         self, force_wrap: bool | None = None
     ) -> list[Raw | Parameter[Any]]:
+        """Return the flattened list of raw sql and parameters."""
+
         wrap = self._wrap if force_wrap is None else force_wrap
+        return list(self._iter_pieces(wrap))
+
+    def _iter_pieces(
+        self, wrap: bool
+    ) -> Generator[Raw | Parameter[Any], None, None]:
+        # walks the tree with an explicit stack, so that deeply nested
+        # Blocks can't hit the recursion limit
+        if wrap:
+            yield _OPEN
+        stack: list[tuple[Iterator[Raw | Parameter[Any] | Block[Any]], bool]]
+        stack = [(iter(self._pieces), False)]
+        while stack:
+            pieces, wrapped = stack[-1]
+            for piece in pieces:
+                if isinstance(piece, Block):
+                    if piece._wrap:
+                        yield _OPEN
+                    stack.append((iter(piece._pieces), piece._wrap))
+                    break
+                yield piece
+            else:
+                stack.pop()
+                if wrapped:
+                    yield _CLOSE
         if wrap:
-            return [Raw("("), *self._pieces, Raw(")")]
-        return self._pieces
+            yield _CLOSE
+
+    def _add_block(self, block: Block[Any]) -> None:
+        # trivial blocks (like the ones created by raw()) are inlined, since
+        # walking into them costs more than copying their single piece
+        if not block._wrap and len(block._pieces) <= 1:
+            self._pieces.extend(block._pieces)
+            return
+
+        # nested Blocks are already snapshots, so copying the direct pieces
+        # is enough to stop later changes to `block` (or `block` being added
+        # to itself) from reaching this tree
+        snapshot: Block[Any] = Block.__new__(Block)
+        snapshot._wrap = block._wrap
+        snapshot._pieces = block._pieces.copy()
+        self._pieces.append(snapshot)
 
     def _get_block(self) -> Block[Any]:
         return self
 
     def __iadd__(self, other: object) -> Block[Any]:
         if isinstance(other, Block):
-            self._pieces.extend(other.get_pieces())
+            self._add_block(other)
         elif isinstance(other, Parameter):
             self._pieces.append(other)
         else:
@@ -304,6 +352,10 @@ class Block(Comparable, Generic[_SQLT_CO]):
         return self
 
 
+_OPEN = Raw("(")
+_CLOSE = Raw(")")
+
+
 class Renderer:
     __slots__: Iterable[str] = ("_curr_value_id",)
 
@@ -318,12 +370,27 @@ class Renderer:
     def render(self, sql: Block[Any]) -> tuple[str, list[Any]]:
         sql_pieces: list[str] = []
         params: list[Any] = []
-
-        for piece in sql.get_pieces(force_wrap=False):
-            if isinstance(piece, Raw):
-                sql_pieces.append(str(piece))
+        add_sql = sql_pieces.append
+
+        # same walk as Block._iter_pieces, inlined since this is hot
+        stack: list[tuple[Iterator[Raw | Parameter[Any] | Block[Any]], bool]]
+        stack = [(iter(sql._pieces), False)]
+        while stack:
+            pieces, wrapped = stack[-1]
+            for piece in pieces:
+                if isinstance(piece, Raw):
+                    add_sql(piece.data)
+                elif isinstance(piece, Block):
+                    if piece._wrap:
+                        add_sql("(")
+                    stack.append((iter(piece._pieces), piece._wrap))
+                    break
+                else:
+                    add_sql(f"${self._next_value_id}")
+                    params.append(piece.value)
             else:
-                sql_pieces.append(f"${self._next_value_id}")
-                params.append(piece.value)
+                stack.pop()
+                if wrapped:
+                    add_sql(")")
 
         return " ".join(sql_pieces), params
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Sequence
+
+from apgorm.types.boolean import Boolean
+from apgorm.types.numeric import (
+    BigInt,
+    BigSerial,
+    DoublePrecision,
+    Int,
+    Real,
+    Serial,
+    SmallInt,
+    SmallSerial,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from numpy.typing import NDArray
+
+    from apgorm.field import BaseField
+
+
+DTYPES: dict[type, str] = {
+    SmallInt: "int16",
+    Int: "int32",
+    BigInt: "int64",
+    SmallSerial: "int16",
+    Serial: "int32",
+    BigSerial: "int64",
+    Real: "float32",
+    DoublePrecision: "float64",
+    Boolean: "bool",
+}
+"""The NumPy dtype for each SqlType. Other types use the object dtype."""
+
+
+def import_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "NumPy is needed for columnar fetches, install it with "
+            "`pip install apgorm[numpy]`."
+        ) from None
+    return numpy
+
+
+def dtype(field: BaseField[Any, Any, Any]) -> str:
+    for cls in type(field.sql_type).__mro__:
+        if cls in DTYPES:
+            return DTYPES[cls]
+    return "object"
+
+
+def column_array(
+    field: BaseField[Any, Any, Any], values: Sequence[Any]
+) -> NDArray[Any]:
+    """Build a contiguous array from the values of a column. Numeric and
+    bool columns with NULL values are returned as masked arrays, with the
+    NULLs masked."""
+
+    numpy = import_numpy()
+    kind = dtype(field)
+    if kind == "object":
+        # filled one by one so that sequences (like arrays) aren't turned
+        # into extra dimensions
+        array = numpy.empty(len(values), dtype=kind)
+        for x, v in enumerate(values):
+            array[x] = v
+        return array  # type: ignore
+    if field.not_null or None not in values:
+        return numpy.fromiter(  # type: ignore
+            values, dtype=kind, count=len(values)
+        )
+
+    mask = numpy.fromiter(
+        (v is None for v in values), dtype="bool", count=len(values)
+    )
+    filled = numpy.fromiter(
+        (0 if v is None else v for v in values), dtype=kind, count=len(values)
+    )
+    return numpy.ma.MaskedArray(filled, mask=mask)  # type: ignore
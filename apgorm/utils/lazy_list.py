@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from typing import (
     Any,
+    AsyncGenerator,
     Callable,
     Generator,
     Generic,
@@ -11,8 +14,36 @@ from typing import (
     overload,
 )
 
+from ..exceptions import BadArgument
+
 _IN = TypeVar("_IN")
 _OUT = TypeVar("_OUT")
+_MISSING: Any = object()
+
+
+class ConversionStats:
+    """Counters for chunked conversion with `LazyList.materialize()` and
+    `async for`, used to tune the chunk size."""
+
+    __slots__: Iterable[str] = ("chunks", "rows", "blocking_time", "max_block")
+
+    def __init__(self) -> None:
+        self.chunks = 0
+        """The number of chunks converted."""
+        self.rows = 0
+        """The number of values converted."""
+        self.blocking_time = 0.0
+        """The total time spent converting, in seconds. The event loop is
+        blocked while a chunk is converted."""
+        self.max_block = 0.0
+        """The longest time spent converting a single chunk, in seconds."""
+
+    def __repr__(self) -> str:
+        return (
+            f"ConversionStats(chunks={self.chunks}, rows={self.rows}, "
+            f"blocking_time={self.blocking_time:.6f}, "
+            f"max_block={self.max_block:.6f})"
+        )
 
 
 class LazyList(Generic[_IN, _OUT]):
@@ -20,17 +51,37 @@ class LazyList(Generic[_IN, _OUT]):
 
     Incredible useful for casting `list[asyncpg.Record]` to `list[dict]`, and
     then `list[dict]` to `list[Model]`, especially when there are many rows.
+
+    Each value is converted at most once, so reading the same index twice
+    returns the same object. Slices share the converted values with the list
+    they were taken from.
+
+    Args:
+        data (Sequence | LazyList): The values to convert.
+        converter (Callable): Converts a single value.
+        many (Callable, optional): Converts many values at once, used by
+        `.to_list()`. Defaults to calling `converter` for each value.
     """
 
-    __slots__: Iterable[str] = ("_data", "_converter")
+    __slots__: Iterable[str] = (
+        "_data",
+        "_converter",
+        "_many",
+        "_converted",
+        "_indexes",
+    )
 
     def __init__(
         self,
         data: Sequence[_IN] | LazyList[Any, _IN],
         converter: Callable[[_IN], _OUT],
+        many: Callable[[Sequence[_IN]], Sequence[_OUT]] | None = None,
     ) -> None:
         self._data = data
         self._converter = converter
+        self._many = many
+        self._converted: list[Any] | None = None
+        self._indexes = range(len(data))
 
     @overload
     def __getitem__(self, index: int) -> _OUT:
@@ -42,15 +93,25 @@ class LazyList(Generic[_IN, _OUT]):
 
     def __getitem__(self, index: int | slice) -> LazyList[_IN, _OUT] | _OUT:
         if isinstance(index, int):
-            return self._converter(self._data[index])
-        return LazyList(self._data[index], self._converter)
+            return self._convert(self._indexes[index])
+
+        view: LazyList[_IN, _OUT] = LazyList.__new__(LazyList)
+        view._data = self._data
+        view._converter = self._converter
+        view._many = self._many
+        view._converted = self._get_converted()
+        view._indexes = self._indexes[index]
+        return view
 
     def __iter__(self) -> Generator[_OUT, None, None]:
-        for r in self._data:
-            yield self._converter(r)
+        for x in self._indexes:
+            yield self._convert(x)
+
+    def __aiter__(self) -> AsyncGenerator[_OUT, None]:
+        return self.iterate()
 
     def __len__(self) -> int:
-        return len(self._data)
+        return len(self._indexes)
 
     def __repr__(self) -> str:
         if len(self) == 6:
@@ -62,3 +123,95 @@ class LazyList(Generic[_IN, _OUT]):
         return "LazyList([{}{}])".format(
             ", ".join(repr(c) for c in list(self[0:5])), ddd
         )
+
+    def to_list(self) -> list[_OUT]:
+        """Convert every value that hasn't been converted yet in one pass.
+
+        Returns:
+            list: The converted values.
+        """
+
+        converted = self._get_converted()
+        missing = [x for x in self._indexes if converted[x] is _MISSING]
+        if missing:
+            values = [self._data[x] for x in missing]
+            if self._many is None:
+                results: Sequence[_OUT] = [self._converter(v) for v in values]
+            else:
+                results = self._many(values)
+            for x, r in zip(missing, results):
+                converted[x] = r
+        return [converted[x] for x in self._indexes]
+
+    async def materialize(
+        self, chunk_size: int = 1000, *, stats: ConversionStats | None = None
+    ) -> list[_OUT]:
+        """Like `.to_list()`, but converts `chunk_size` values at a time and
+        lets other tasks run between chunks, so that converting a large list
+        doesn't block the event loop.
+
+        Args:
+            chunk_size (int): The number of values to convert at once.
+            Defaults to 1000.
+            stats (ConversionStats, optional): Updated with the time spent
+            converting each chunk.
+
+        Returns:
+            list: The converted values.
+        """
+
+        values: list[_OUT] = []
+        async for chunk in self._chunks(chunk_size, stats):
+            values.extend(chunk)
+        return values
+
+    async def iterate(
+        self, chunk_size: int = 1000, *, stats: ConversionStats | None = None
+    ) -> AsyncGenerator[_OUT, None]:
+        """Iterate over the converted values, converting `chunk_size` values
+        at a time and letting other tasks run between chunks.
+
+        `async for value in lazy_list` is the same as
+        `async for value in lazy_list.iterate()`.
+
+        Args:
+            chunk_size (int): The number of values to convert at once.
+            Defaults to 1000.
+            stats (ConversionStats, optional): Updated with the time spent
+            converting each chunk.
+        """
+
+        async for chunk in self._chunks(chunk_size, stats):
+            for value in chunk:
+                yield value
+
+    async def _chunks(
+        self, chunk_size: int, stats: ConversionStats | None
+    ) -> AsyncGenerator[list[_OUT], None]:
+        if chunk_size < 1:
+            raise BadArgument("chunk_size must be at least 1.")
+
+        for start in range(0, len(self), chunk_size):
+            if start:
+                await asyncio.sleep(0)
+            began = time.perf_counter()
+            chunk = self[start : start + chunk_size].to_list()
+            if stats is not None:
+                took = time.perf_counter() - began
+                stats.chunks += 1
+                stats.rows += len(chunk)
+                stats.blocking_time += took
+                stats.max_block = max(stats.max_block, took)
+            yield chunk
+
+    def _get_converted(self) -> list[Any]:
+        if self._converted is None:
+            self._converted = [_MISSING] * len(self._data)
+        return self._converted
+
+    def _convert(self, x: int) -> _OUT:
+        converted = self._get_converted()
+        value: _OUT = converted[x]
+        if value is _MISSING:
+            value = converted[x] = self._converter(self._data[x])
+        return value
@@ -0,0 +1,80 @@
+"""Benchmark for Model.fetch() latency with and without autocommit.
+
+Needs a Postgres server to connect to. Connection options are read from the
+standard libpq environment variables (PGHOST, PGPORT, PGUSER, PGPASSWORD,
+PGDATABASE).
+
+Run with `python -m benchmarks.autocommit`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import apgorm
+from apgorm.types import Int, VarChar
+
+ROWS = 1000
+CALLS = 5000
+
+
+class BenchUser(apgorm.Model):
+    id_ = Int().field()
+    name = VarChar(32).field()
+
+    primary_key = (id_,)
+
+
+class BenchDatabase(apgorm.Database):
+    apgorm_bench_users = BenchUser
+
+
+def percentile(latencies: list[float], p: float) -> float:
+    return latencies[min(len(latencies) - 1, int(len(latencies) * p))]
+
+
+async def bench(db: BenchDatabase, autocommit: bool) -> None:
+    db.autocommit = autocommit
+    latencies: list[float] = []
+    for x in range(CALLS):
+        start = time.perf_counter()
+        await BenchUser.fetch(id_=x % ROWS)
+        latencies.append(time.perf_counter() - start)
+
+    latencies.sort()
+    print(
+        f"autocommit={str(autocommit):<5} "
+        f"p50 {percentile(latencies, 0.5) * 1e3:7.3f}ms "
+        f"p99 {percentile(latencies, 0.99) * 1e3:7.3f}ms "
+        f"mean {statistics.mean(latencies) * 1e3:7.3f}ms"
+    )
+
+
+async def main() -> None:
+    with TemporaryDirectory() as folder:
+        db = BenchDatabase(Path(folder))
+        await db.connect(min_size=1, max_size=1)
+        try:
+            await db.execute(
+                "DROP TABLE IF EXISTS apgorm_bench_users; "
+                "CREATE TABLE apgorm_bench_users "
+                "(id_ INTEGER PRIMARY KEY, name VARCHAR(32) NOT NULL)",
+                [],
+            )
+            await BenchUser.create_many(
+                BenchUser(id_=x, name=str(x)) for x in range(ROWS)
+            )
+
+            for autocommit in (False, True, False, True):
+                await bench(db, autocommit)
+        finally:
+            await db.execute("DROP TABLE IF EXISTS apgorm_bench_users", [])
+            await db.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,73 @@
+"""Benchmark for building models and reading their fields.
+
+Doesn't need a database. Run with `python -m benchmarks.models`.
+"""
+
+from __future__ import annotations
+
+import timeit
+import tracemalloc
+
+import apgorm
+from apgorm.types import Int, Serial, Text, VarChar
+
+ROWS = 100_000
+
+
+class BenchUser(apgorm.Model):
+    id_ = Serial().field()
+    name = VarChar(32).field()
+    nick = Text().nullablefield()
+    score = Int().field(default=0)
+
+    primary_key = (id_,)
+
+
+RECORDS = [
+    {"id_": x, "name": str(x), "nick": None, "score": x} for x in range(ROWS)
+]
+
+
+def construct() -> list[BenchUser]:
+    return [BenchUser(id_=x, name="name") for x in range(ROWS)]
+
+
+def hydrate() -> list[BenchUser]:
+    return [BenchUser._from_record(r) for r in RECORDS]
+
+
+def access(users: list[BenchUser]) -> int:
+    return sum(u.score for u in users)
+
+
+def edit(users: list[BenchUser]) -> int:
+    for u in users:
+        u.score = 1
+    return sum(len(u._get_changed_fields()) for u in users)
+
+
+def memory() -> float:
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    users = hydrate()
+    size = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del users
+    return size / ROWS
+
+
+def main() -> None:
+    users = hydrate()
+    for name, func in (
+        ("construct", construct),
+        ("hydrate", hydrate),
+        ("access", lambda: access(users)),
+        ("edit", lambda: edit(users)),
+    ):
+        t = min(timeit.repeat(func, number=1, repeat=5))
+        print(f"{name:>9} {ROWS} models: {t * 1e3:8.2f}ms")
+    print(f"{'memory':>9} per model: {memory():8.1f} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Benchmark for building and rendering queries with many predicates.
+
+Run with `python -m benchmarks.render`.
+"""
+
+from __future__ import annotations
+
+import timeit
+from typing import Any, Callable
+
+from apgorm import Block, and_, or_, raw
+from apgorm.sql.generators.query import select
+
+
+def flat(predicates: int) -> Block[Any]:
+    return select(
+        from_=raw("users"),
+        where=and_(*(raw("userid").eq(x) for x in range(predicates))),
+    )
+
+
+def nested(predicates: int) -> Block[Any]:
+    where = raw("userid").eq(0)
+    for x in range(1, predicates):
+        where = or_(and_(where, raw("userid").neq(x)), raw("name").eq(x))
+    return select(from_=raw("users"), where=where)
+
+
+def bench(name: str, build: Callable[[int], Block[Any]]) -> None:
+    for predicates in (10, 100, 500, 1000):
+        number = max(1, 2000 // predicates)
+        b = timeit.timeit(lambda: build(predicates), number=number)
+        block = build(predicates)
+        r = timeit.timeit(block.render, number=number)
+        print(
+            f"{name:>6} {predicates:>5} predicates: "
+            f"build {b / number * 1e3:8.3f}ms "
+            f"render {r / number * 1e3:8.3f}ms"
+        )
+
+
+def main() -> None:
+    bench("flat", flat)
+    bench("nested", nested)
+
+
+if __name__ == "__main__":
+    main()
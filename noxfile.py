@@ -4,7 +4,7 @@ import nox
 @nox.session
 def pytest_and_mypy(session: nox.Session) -> None:
     session.install("poetry")
-    session.run("poetry", "install")
+    session.run("poetry", "install", "--all-extras")
 
     session.run("mypy", ".")
     session.run(
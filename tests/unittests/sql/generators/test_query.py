@@ -5,7 +5,7 @@ import pytest
 import apgorm
 from apgorm.sql.generators import query
 from apgorm.sql.sql import Block
-from apgorm.types import VarChar
+from apgorm.types import Array, Int, Serial, VarChar
 
 
 class MyModel(apgorm.Model):
@@ -41,7 +41,7 @@ def test_select_table_fields(fields):
         for f in fields
     ]
     fs = " , ".join(fs)
-    assert q.render() == (f"SELECT ( {fs} ) FROM mymodel", [])
+    assert q.render() == (f"SELECT {fs} FROM mymodel", [])
 
 
 def test_where_logic():
@@ -52,3 +52,116 @@ def test_where_logic():
 def test_count():
     q = query.select(from_=MyModel, count=True)
     assert q.render() == ("SELECT COUNT(*) FROM mymodel", [])
+
+
+class SerialModel(apgorm.Model):
+    id_ = Serial().field()
+    name = VarChar(32).field()
+    tags = Array(Int()).field()
+    primary_key = (id_,)
+
+
+class SerialDatabase(apgorm.Database):
+    serialmodel = SerialModel
+
+
+SERIAL_DB = SerialDatabase(None)
+
+
+def test_insert_many():
+    q = query.insert_many(
+        SerialModel,
+        [SerialModel.id_, SerialModel.name],
+        [(1, 2), ("a", "b")],
+        return_fields=[SerialModel.id_],
+    )
+    assert q.render() == (
+        "INSERT INTO serialmodel ( id_ , name ) SELECT id_ , name FROM unnest "
+        "( $1 ::INTEGER[] , $2 ::VARCHAR(32)[] ) WITH ORDINALITY "
+        "AS _v ( id_ , name , _ordinality ) ORDER BY _ordinality "
+        "RETURNING serialmodel.id_",
+        [[1, 2], ["a", "b"]],
+    )
+
+
+def test_insert_many_array():
+    with pytest.raises(apgorm.exceptions.BadArgument):
+        query.insert_many(SerialModel, [SerialModel.tags], [[[1]]])
+
+
+def test_update_many():
+    q = query.update_many(
+        SerialModel,
+        [SerialModel.id_],
+        [SerialModel.name],
+        [(1, 2), ("a", "b")],
+        return_fields=[SerialModel.id_],
+    )
+    assert q.render() == (
+        "UPDATE serialmodel SET name = _v.name FROM unnest "
+        "( $1 ::INTEGER[] , $2 ::VARCHAR(32)[] ) AS _v ( id_ , name ) "
+        "WHERE ( serialmodel.id_ = _v.id_ ) RETURNING serialmodel.id_",
+        [[1, 2], ["a", "b"]],
+    )
+
+
+def test_on_conflict_fields():
+    q = query.on_conflict(
+        [SerialModel.id_], {"name": query.excluded("name"), "tags": [1]}
+    )
+    assert q.render() == (
+        "ON CONFLICT ( id_ ) DO UPDATE SET name = EXCLUDED.name , tags = $1",
+        [[1]],
+    )
+
+
+def test_on_conflict_constraint():
+    unique = apgorm.Unique(SerialModel.name)
+    unique.name = "name_unique"
+    q = query.on_conflict(unique)
+    assert q.render() == (
+        "ON CONFLICT ON CONSTRAINT name_unique DO NOTHING",
+        [],
+    )
+
+
+def test_insert_on_conflict():
+    q = query.insert(
+        SerialModel,
+        [apgorm.raw("name")],
+        ["a"],
+        on_conflict=query.on_conflict([SerialModel.id_]),
+    )
+    assert q.render() == (
+        "INSERT INTO serialmodel ( name ) VALUES ( $1 ) "
+        "ON CONFLICT ( id_ ) DO NOTHING",
+        ["a"],
+    )
+
+
+def test_insert_from():
+    q = query.insert_from(
+        SerialModel,
+        [SerialModel.name],
+        apgorm.raw("other"),
+        on_conflict=query.on_conflict([SerialModel.id_]),
+    )
+    assert q.render() == (
+        "INSERT INTO serialmodel ( name ) SELECT name FROM other "
+        "ON CONFLICT ( id_ ) DO NOTHING",
+        [],
+    )
+
+
+def test_in_rows():
+    q = query.in_rows([SerialModel.id_], [[1, 2]])
+    assert q.render() == ("serialmodel.id_ = ANY ( $1 ::INTEGER[] )", [[1, 2]])
+
+
+def test_in_rows_composite():
+    q = query.in_rows([SerialModel.id_, SerialModel.name], [[1], ["a"]])
+    assert q.render() == (
+        "( serialmodel.id_ , serialmodel.name ) IN ( SELECT * FROM unnest "
+        "( $1 ::INTEGER[] , $2 ::VARCHAR(32)[] ) AS _v ( id_ , name ) )",
+        [[1], ["a"]],
+    )
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import sys
+from enum import IntEnum
+
 import pytest
 
+import apgorm
 from apgorm import (
     DeleteQueryBuilder,
     FetchQueryBuilder,
     InsertQueryBuilder,
     UpdateQueryBuilder,
 )
-from apgorm.sql.query_builder import _dict_model_converter
+from apgorm.sql.query_builder import _record_model_converter
+from apgorm.types import Array, Int, Serial, VarChar
 
 ALL_BUILDERS = [
     DeleteQueryBuilder,
@@ -20,11 +25,11 @@ FILTER_BUILDERS = [DeleteQueryBuilder, FetchQueryBuilder, UpdateQueryBuilder]
 
 
 def test_model_converter(mocker):
-    c = _dict_model_converter(m := mocker.Mock())
+    c = _record_model_converter(m := mocker.Mock())
     ret = c({"hello": "world"})
 
-    assert m._from_raw.return_value is ret
-    m._from_raw.assert_called_once_with(hello="world")
+    assert m._from_record.return_value is ret
+    m._from_record.assert_called_once_with({"hello": "world"})
 
 
 @pytest.mark.parametrize("type_", ALL_BUILDERS)
@@ -104,10 +109,658 @@ async def test_fqb_fetchmany_exc(mocker):
 @pytest.mark.asyncio
 async def test_fqb_fetchmany(mocker):
     q = FetchQueryBuilder(m := mocker.Mock(), c := mocker.AsyncMock())
-    c.fetchmany.return_value = [{"hello": "world"}]
+    c.fetchrecords.return_value = [{"hello": "world"}]
 
     ll = await q.fetchmany()
     cnv = ll[0]
     assert ll._data == [{"hello": "world"}]
-    assert cnv is m._from_raw.return_value
-    m._from_raw.assert_called_once_with(hello="world")
+    assert cnv is m._from_record.return_value
+    m._from_record.assert_called_once_with({"hello": "world"})
+    assert ll[0] is cnv
+    assert ll.to_list() == [cnv]
+    m._from_records.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_fqb_fetchmany_executor(mocker):
+    q = FetchQueryBuilder(m := mocker.Mock(), c := mocker.AsyncMock())
+    c.fetchrecords.return_value = [{"hello": "world"}]
+    m._from_records_in = mocker.AsyncMock(return_value=["model"])
+
+    ll = await q.fetchmany(executor=(e := mocker.Mock()), chunk_size=5)
+
+    assert ll[0] == "model"
+    m._from_records_in.assert_called_once_with(e, [{"hello": "world"}], 5)
+    m._from_record.assert_not_called()
+    with pytest.raises(apgorm.exceptions.BadArgument):
+        await q.fetchmany(executor=e, chunk_size=0)
+
+
+@pytest.mark.asyncio
+async def test_fqb_fetch_columns(mocker):
+    numpy = pytest.importorskip("numpy")
+    con = mocker.AsyncMock(spec=apgorm.Connection)
+    con.fetchrecords.return_value = [(1, "a"), (2, "b")]
+    q = FetchQueryBuilder(CachedModel, con).where(name="a")
+
+    columns = await q.fetch_columns(CachedModel.id_, CachedModel.name)
+
+    assert con.fetchrecords.call_args.args[0].startswith(
+        "SELECT cached.id_ , cached.name FROM"
+    )
+    assert columns["id_"].dtype == numpy.int32
+    assert columns["id_"].tolist() == [1, 2]
+    assert columns["name"].tolist() == ["a", "b"]
+    with pytest.raises(apgorm.exceptions.BadArgument):
+        await q.fetch_columns()
+    with pytest.raises(TypeError):
+        await q.fetch_columns(CachedModel.id_, limit="1")
+
+
+@pytest.mark.asyncio
+async def test_fqb_fetch_columns_no_numpy(mocker):
+    mocker.patch.dict(sys.modules, {"numpy": None})
+    con = mocker.AsyncMock(spec=apgorm.Connection)
+
+    with pytest.raises(ImportError):
+        await FetchQueryBuilder(CachedModel, con).fetch_columns(
+            CachedModel.id_
+        )
+    con.fetchrecords.assert_not_called()
+
+
+class CachedModel(apgorm.Model):
+    id_ = Int().field()
+    name = VarChar(32).field()
+    primary_key = (id_,)
+
+
+class CacheDatabase(apgorm.Database):
+    cached = CachedModel
+
+
+CACHE_DB = CacheDatabase(None)
+
+
+@pytest.fixture
+def clear_cache():
+    CachedModel._query_cache.clear()
+    yield
+    CachedModel._query_cache.clear()
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        lambda: FetchQueryBuilder(CachedModel).where(id_=1, name="a"),
+        lambda: FetchQueryBuilder(CachedModel)
+        .where(id_=1)
+        .order_by(CachedModel.name, reverse=True),
+        lambda: DeleteQueryBuilder(CachedModel).where(id_=1),
+        lambda: UpdateQueryBuilder(CachedModel).set(name="a").where(id_=1),
+        lambda: InsertQueryBuilder(CachedModel).set(id_=1, name="a"),
+    ],
+)
+def test_render_cached(query, clear_cache, mocker):
+    first = query()
+    expected = first._get_block().render()
+    assert first._render() == expected
+    assert len(CachedModel._query_cache) == 1
+
+    second = query()
+    spy = mocker.spy(type(second), "_get_block")
+    assert second._render() == expected
+    assert len(CachedModel._query_cache) == 1
+    spy.assert_not_called()
+
+
+def test_fqb_only():
+    q = FetchQueryBuilder(CachedModel).only(CachedModel.name)
+
+    assert q._render() == ("SELECT cached.name FROM cached", [])
+    assert q._render(count=True) == ("SELECT COUNT(*) FROM cached", [])
+
+
+def test_fqb_defer():
+    q = FetchQueryBuilder(CachedModel).defer(CachedModel.name)
+
+    assert q._render() == ("SELECT cached.id_ FROM cached", [])
+
+
+@pytest.mark.parametrize("method", ["only", "defer"])
+def test_fqb_only_bad_argument(method):
+    q = FetchQueryBuilder(CachedModel)
+    with pytest.raises(apgorm.exceptions.BadArgument):
+        getattr(q, method)()
+    with pytest.raises(apgorm.exceptions.BadArgument):
+        getattr(q, method)(BulkModel.id_)
+
+
+@pytest.mark.asyncio
+async def test_fqb_paginate(mocker, clear_cache):
+    con = mocker.AsyncMock(spec=apgorm.Connection)
+    con.fetchrecords.side_effect = [
+        [{"id_": 1, "name": "a"}, {"id_": 2, "name": "a"}],
+        [{"id_": 3, "name": "b"}],
+    ]
+    q = FetchQueryBuilder(CachedModel, con).where(name="a")
+
+    pages = [
+        p async for p in q.paginate(2, by=[CachedModel.name, CachedModel.id_])
+    ]
+
+    assert [[m.id_ for m in p.models] for p in pages] == [[1, 2], [3]]
+    assert [p.cursor for p in pages] == [("a", 2), ("b", 3)]
+    assert [c.args for c in con.fetchrecords.call_args_list] == [
+        (
+            "SELECT * FROM cached WHERE ( name = $1 ) "
+            "ORDER BY cached.name ASC , cached.id_ ASC LIMIT $2",
+            ["a", 2],
+        ),
+        (
+            "SELECT * FROM cached WHERE ( ( name = $1 ) AND "
+            "( cached.name , cached.id_ ) > ( $2 , $3 ) ) "
+            "ORDER BY cached.name ASC , cached.id_ ASC LIMIT $4",
+            ["a", "a", 2, 2],
+        ),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_fqb_paginate_resume(mocker):
+    con = mocker.AsyncMock(spec=apgorm.Connection)
+    con.fetchrecords.side_effect = [[{"id_": 4}, {"id_": 3}], []]
+    q = FetchQueryBuilder(CachedModel, con).only(CachedModel.name)
+
+    pages = [p async for p in q.paginate(2, after=[5], reverse=True)]
+
+    assert [p.cursor for p in pages] == [(3,)]
+    assert con.fetchrecords.call_args_list[0].args == (
+        "SELECT cached.name , cached.id_ FROM cached "
+        "WHERE ( ( cached.id_ ) < ( $1 ) ) ORDER BY cached.id_ DESC LIMIT $2",
+        [5, 2],
+    )
+    assert con.fetchrecords.call_args_list[1].args[1] == [3, 2]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(page_size=0),
+        dict(page_size=1, by=[]),
+        dict(page_size=1, after=[1, 2]),
+        dict(page_size=1, order_by=True),
+    ],
+)
+@pytest.mark.asyncio
+async def test_fqb_paginate_bad_argument(mocker, kwargs):
+    q = FetchQueryBuilder(CachedModel, mocker.AsyncMock())
+    if kwargs.pop("order_by", False):
+        q.order_by(CachedModel.id_)
+
+    with pytest.raises(apgorm.exceptions.BadArgument):
+        await q.paginate(**kwargs).__anext__()
+
+
+def test_render_cached_binds_new_params(clear_cache):
+    FetchQueryBuilder(CachedModel).where(id_=1)._render()
+    q = FetchQueryBuilder(CachedModel).where(id_=apgorm.Parameter(2))
+
+    assert q._render() == ("SELECT * FROM cached WHERE ( id_ = $1 )", [2])
+
+
+def test_render_cached_limit(clear_cache):
+    FetchQueryBuilder(CachedModel).where(id_=1)._render(limit=5)
+    q = FetchQueryBuilder(CachedModel).where(id_=1)
+
+    assert q._render(limit=10) == (
+        "SELECT * FROM cached WHERE ( id_ = $1 ) LIMIT $2",
+        [1, 10],
+    )
+    assert len(CachedModel._query_cache) == 1
+
+
+def test_render_cache_shape(clear_cache):
+    FetchQueryBuilder(CachedModel).where(id_=1)._render()
+    FetchQueryBuilder(CachedModel).where(name=1)._render()
+    FetchQueryBuilder(CachedModel).where(id_=1)._render(limit=5)
+    FetchQueryBuilder(CachedModel).where(id_=1)._render(count=True)
+    FetchQueryBuilder(CachedModel).where(id_=1).only(CachedModel.id_)._render()
+
+    assert len(CachedModel._query_cache) == 5
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        lambda: FetchQueryBuilder(CachedModel).where(CachedModel.id_.eq(1)),
+        lambda: FetchQueryBuilder(CachedModel).where(id_=CachedModel.name),
+        lambda: FetchQueryBuilder(CachedModel).order_by(apgorm.raw("name")),
+        lambda: UpdateQueryBuilder(CachedModel).set(name=apgorm.raw("id_")),
+    ],
+)
+def test_render_not_cached(query, clear_cache):
+    q = query()
+    assert q._render() == q._get_block().render()
+    assert len(CachedModel._query_cache) == 0
+
+
+class Color(IntEnum):
+    RED = 0
+    BLUE = 1
+
+
+class BulkModel(apgorm.Model):
+    id_ = Serial().field()
+    name = VarChar(32).field()
+    color = Int().field(default=0).with_converter(apgorm.IntEFConverter(Color))
+    nick = VarChar(32).nullablefield(default_factory=lambda: "nick")
+    primary_key = (id_,)
+
+
+class TaggedModel(apgorm.Model):
+    id_ = Int().field()
+    tags = Array(VarChar(32)).field()
+    primary_key = (id_,)
+
+
+class BulkDatabase(apgorm.Database):
+    bulk = BulkModel
+    tagged = TaggedModel
+
+
+BULK_DB = BulkDatabase(None)
+
+
+class FakeRecord(dict):
+    # asyncpg records can be indexed by name or position
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            return list(self.values())[key]
+        return super().__getitem__(key)
+
+
+@pytest.mark.asyncio
+async def test_fqb_values(mocker):
+    con = mocker.AsyncMock(spec=apgorm.Connection)
+    con.fetchrecords.return_value = [FakeRecord(name="a", color=1)]
+    q = FetchQueryBuilder(BulkModel, con)
+
+    assert await q.values(BulkModel.name, BulkModel.color) == [
+        {"name": "a", "color": Color.BLUE}
+    ]
+    assert con.fetchrecords.call_args.args[0].startswith(
+        "SELECT bulk.name , bulk.color FROM"
+    )
+    assert await q.values(BulkModel.name, limit=1) == [
+        {"name": "a", "color": 1}
+    ]
+    assert con.fetchrecords.call_args.args[1] == [1]
+
+
+@pytest.mark.asyncio
+async def test_fqb_values_list(mocker):
+    con = mocker.AsyncMock(spec=apgorm.Connection)
+    con.fetchrecords.return_value = [("a", 1), ("b", 0)]
+    q = FetchQueryBuilder(BulkModel, con)
+
+    assert await q.values_list(BulkModel.name, BulkModel.color) == [
+        ("a", Color.BLUE),
+        ("b", Color.RED),
+    ]
+    assert await q.values_list(BulkModel.name) == [("a", 1), ("b", 0)]
+
+    con.fetchrecords.return_value = []
+    assert await q.values_list(BulkModel.color) == []
+
+
+@pytest.mark.asyncio
+async def test_fqb_scalars(mocker):
+    con = mocker.AsyncMock(spec=apgorm.Connection)
+    con.fetchrecords.return_value = [(1,), (0,)]
+    q = FetchQueryBuilder(BulkModel, con)
+
+    assert await q.scalars(BulkModel.id_) == [1, 0]
+    assert await q.scalars(BulkModel.color) == [Color.BLUE, Color.RED]
+    with pytest.raises(apgorm.exceptions.BadArgument):
+        await q.scalars(CachedModel.id_)
+    with pytest.raises(TypeError):
+        await q.scalars(BulkModel.id_, limit="1")
+
+
+def test_iqb_bulk():
+    q = InsertQueryBuilder(BulkModel).bulk(
+        [{"name": "a", "color": Color.BLUE}, {"name": "b", "nick": None}]
+    )
+
+    assert q._bulk_rows == [
+        {"name": "a", "color": 1, "nick": "nick"},
+        {"name": "b", "color": 0, "nick": None},
+    ]
+
+
+def test_iqb_bulk_validates():
+    BulkModel.name.add_validator(lambda v: v != "bad")
+    try:
+        with pytest.raises(apgorm.exceptions.InvalidFieldValue):
+            InsertQueryBuilder(BulkModel).bulk([{"name": "bad"}])
+    finally:
+        BulkModel.name._validators.clear()
+
+
+def test_iqb_bulk_groups():
+    q = InsertQueryBuilder(BulkModel)._bulk_stored(
+        [{"name": "a"}, {"id_": 1, "name": "b"}, {"name": "c"}, {}]
+    )
+
+    assert q._bulk_groups() == {
+        ("name",): [0, 2],
+        ("id_", "name"): [1],
+        (): [3],
+    }
+
+
+@pytest.mark.asyncio
+async def test_iqb_execute_many(mocker):
+    con = mocker.AsyncMock(spec=apgorm.Connection)
+    con.fetchrecords.side_effect = [[{"id_": 1}, {"id_": 3}], [{"id_": 2}]]
+    q = InsertQueryBuilder(BulkModel, con)._bulk_stored(
+        [{"name": "a"}, {"id_": 2, "name": "b"}, {"name": "c"}]
+    )
+
+    res = await q.execute_many()
+
+    assert [m.id_ for m in res] == [1, 2, 3]
+    query, params = con.fetchrecords.call_args_list[0].args
+    assert "unnest" in query
+    assert params == [["a", "c"]]
+
+
+@pytest.mark.asyncio
+async def test_iqb_execute_many_array(mocker):
+    con = mocker.AsyncMock(spec=apgorm.Connection)
+    con.fetchrecords.side_effect = [
+        [{"id_": 1, "tags": ["a"]}],
+        [{"id_": 2, "tags": ["b", "c"]}],
+    ]
+    q = InsertQueryBuilder(TaggedModel, con)._bulk_stored(
+        [{"id_": 1, "tags": ["a"]}, {"id_": 2, "tags": ["b", "c"]}]
+    )
+
+    res = await q.execute_many()
+
+    assert [m.tags for m in res] == [["a"], ["b", "c"]]
+    assert [c.args for c in con.fetchrecords.call_args_list] == [
+        (
+            "INSERT INTO tagged ( id_ , tags ) VALUES ( $1 , $2 ) "
+            "RETURNING tagged.id_ , tagged.tags",
+            params,
+        )
+        for params in ([1, ["a"]], [2, ["b", "c"]])
+    ]
+
+
+@pytest.mark.asyncio
+async def test_iqb_copy(mocker):
+    con = mocker.AsyncMock(spec=apgorm.Connection)
+    con.copy_records_to_table.return_value = 2
+    con.fetchrecords.return_value = [{"?column?": 1}]
+    q = InsertQueryBuilder(BulkModel, con)._bulk_stored(
+        [{"name": "a"}, {"name": "b"}, {}]
+    )
+
+    assert await q.copy() == 3
+    con.copy_records_to_table.assert_called_once_with(
+        "bulk", [("a",), ("b",)], ("name",)
+    )
+    con.fetchrecords.assert_called_once()
+
+
+def test_uqb_bulk():
+    q = UpdateQueryBuilder(BulkModel).bulk([{"id_": 1, "color": Color.BLUE}])
+
+    assert q._bulk_rows == [{"id_": 1, "color": 1}]
+
+
+@pytest.mark.asyncio
+async def test_uqb_execute_many(mocker):
+    con = mocker.AsyncMock(spec=apgorm.Connection)
+    con.fetchrecords.side_effect = [
+        [{"id_": 3, "name": "c"}, {"id_": 1, "name": "a"}],
+        [{"id_": 2, "name": "b"}],
+    ]
+    q = UpdateQueryBuilder(BulkModel, con)._bulk_stored(
+        [
+            {"id_": 1, "name": "a"},
+            {"id_": 2, "nick": None},
+            {"id_": 3, "name": "c"},
+            {"id_": 4, "name": "d"},
+        ]
+    )
+
+    res = list(await q.execute_many())
+
+    assert [m.name if m else None for m in res] == ["a", "b", "c", None]
+    query, params = con.fetchrecords.call_args_list[0].args
+    assert "unnest" in query
+    assert params == [[1, 3, 4], ["a", "c", "d"]]
+
+
+@pytest.mark.asyncio
+async def test_uqb_execute_many_array(mocker):
+    con = mocker.AsyncMock(spec=apgorm.Connection)
+    con.fetchrecords.side_effect = [[{"id_": 1, "tags": ["a"]}], []]
+    q = UpdateQueryBuilder(TaggedModel, con)._bulk_stored(
+        [{"id_": 1, "tags": ["a"]}, {"id_": 2, "tags": ["b"]}]
+    )
+
+    res = list(await q.execute_many())
+
+    assert res[0] is not None and res[0].tags == ["a"]
+    assert res[1] is None
+    assert con.fetchrecords.call_args_list[0].args == (
+        "UPDATE tagged SET tags = $1 WHERE ( tagged.id_ = $2 ) "
+        "RETURNING tagged.id_ , tagged.tags",
+        [["a"], 1],
+    )
+
+
+@pytest.mark.parametrize(
+    "rows", [[{"name": "a"}], [{"id_": 1}], [{"id_": 1, "name": "a"}]]
+)
+@pytest.mark.asyncio
+async def test_uqb_execute_many_bad_argument(mocker, rows):
+    q = UpdateQueryBuilder(
+        BulkModel, mocker.AsyncMock(spec=apgorm.Connection)
+    )._bulk_stored(rows)
+    if len(rows[0]) == 2:
+        q.where(id_=1)
+
+    with pytest.raises(apgorm.exceptions.BadArgument):
+        await q.execute_many()
+
+
+@pytest.mark.parametrize(
+    "query,status",
+    [
+        (lambda con: DeleteQueryBuilder(CachedModel, con), "DELETE 3"),
+        (
+            lambda con: UpdateQueryBuilder(CachedModel, con).set(name="a"),
+            "UPDATE 3",
+        ),
+    ],
+)
+@pytest.mark.asyncio
+async def test_execute_not_returning(query, status, mocker):
+    con = mocker.AsyncMock(spec=apgorm.Connection)
+    con.execute.return_value = status
+
+    assert await query(con).where(id_=1).execute(returning=False) == 3
+    assert "RETURNING" not in con.execute.call_args.args[0]
+    con.fetchrecords.assert_not_called()
+
+
+@pytest.mark.parametrize("type_", [DeleteQueryBuilder, UpdateQueryBuilder])
+@pytest.mark.asyncio
+async def test_execute_returning_fields(type_, mocker, clear_cache):
+    con = mocker.AsyncMock(spec=apgorm.Connection)
+    con.fetchrecords.return_value = [{"id_": 1}]
+    q = type_(CachedModel, con).where(id_=1).returning(CachedModel.id_)
+    if isinstance(q, UpdateQueryBuilder):
+        q.set(name="a")
+
+    (res,) = list(await q.execute())
+
+    assert res.id_ == 1
+    with pytest.raises(apgorm.exceptions.UndefinedFieldValue):
+        res.name
+    assert con.fetchrecords.call_args.args[0].endswith("RETURNING cached.id_")
+
+    type_(CachedModel).where(id_=1)._render()
+    type_(CachedModel).where(id_=1)._render(returning=False)
+    assert len(CachedModel._query_cache) == 3
+
+
+@pytest.mark.parametrize("fields", [(), (CachedModel.id_, BulkModel.id_)])
+@pytest.mark.parametrize("type_", [DeleteQueryBuilder, UpdateQueryBuilder])
+def test_returning_bad_argument(type_, fields):
+    with pytest.raises(apgorm.exceptions.BadArgument):
+        type_(CachedModel).returning(*fields)
+
+
+class UpsertModel(apgorm.Model):
+    id_ = Int().field()
+    name = VarChar(32).field()
+    nick = VarChar(32).field()
+    name_unique = apgorm.Unique(name)
+    primary_key = (id_,)
+
+
+class UpsertDatabase(apgorm.Database):
+    upsert = UpsertModel
+
+
+UPSERT_DB = UpsertDatabase(None)
+
+
+@pytest.mark.parametrize(
+    "kwargs,expected",
+    [
+        (
+            dict(do_update=True),
+            "ON CONFLICT ( id_ ) DO UPDATE SET name = EXCLUDED.name , "
+            "nick = EXCLUDED.nick",
+        ),
+        (
+            dict(target=UpsertModel.name, do_update=[UpsertModel.nick]),
+            "ON CONFLICT ( name ) DO UPDATE SET nick = EXCLUDED.nick",
+        ),
+        (
+            dict(target=UpsertModel.name_unique, do_update=["id_"]),
+            "ON CONFLICT ON CONSTRAINT name_unique "
+            "DO UPDATE SET id_ = EXCLUDED.id_",
+        ),
+        (
+            dict(do_update={"nick": "new"}),
+            "ON CONFLICT ( id_ ) DO UPDATE SET nick = $4",
+        ),
+        (dict(do_nothing=True), "ON CONFLICT ( id_ ) DO NOTHING"),
+    ],
+)
+def test_iqb_on_conflict(kwargs, expected):
+    q = InsertQueryBuilder(UpsertModel).set(id_=1, name="a", nick="b")
+    assert q.on_conflict(**kwargs) is q
+
+    query, params = q._get_block().render()
+    assert expected in query
+    assert params[:3] == [1, "a", "b"]
+
+
+def test_iqb_on_conflict_nothing_to_update():
+    q = InsertQueryBuilder(UpsertModel).set(id_=1).on_conflict(do_update=True)
+
+    assert "DO UPDATE SET id_ = EXCLUDED.id_" in q._get_block().render()[0]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(),
+        dict(do_update=True, do_nothing=True),
+        dict(do_update=[]),
+        dict(target=apgorm.Unique(UpsertModel.nick), do_nothing=True),
+    ],
+)
+def test_iqb_on_conflict_bad_argument(kwargs):
+    with pytest.raises(apgorm.exceptions.BadArgument):
+        InsertQueryBuilder(UpsertModel).on_conflict(**kwargs)
+
+
+def test_iqb_on_conflict_cache(clear_cache):
+    UpsertModel._query_cache.clear()
+
+    def query(**kwargs):
+        q = InsertQueryBuilder(UpsertModel).set(id_=1, name="a")
+        return q.on_conflict(**kwargs)._render()
+
+    assert query(do_nothing=True) == query(do_nothing=True)
+    assert query(do_update={"nick": "x"}) == query(do_update={"nick": "x"})
+    query(do_update=True)
+    query(target=UpsertModel.name_unique, do_update=True)
+    query(target=UpsertModel.name_unique, do_update=[UpsertModel.nick])
+
+    assert len(UpsertModel._query_cache) == 5
+
+
+@pytest.mark.asyncio
+async def test_iqb_execute_skipped(mocker):
+    con = mocker.AsyncMock(spec=apgorm.Connection)
+    con.fetchrecord.return_value = None
+    q = InsertQueryBuilder(UpsertModel, con).set(id_=1)
+    q.on_conflict(do_nothing=True)
+
+    assert await q.execute_or_none() is None
+    with pytest.raises(apgorm.exceptions.InsertSkipped):
+        await q.execute()
+
+
+@pytest.mark.asyncio
+async def test_iqb_execute_many_matches_pk(mocker):
+    con = mocker.AsyncMock(spec=apgorm.Connection)
+    con.fetchrecords.return_value = [
+        {"id_": 3, "name": "c", "nick": "c"},
+        {"id_": 1, "name": "a", "nick": "a"},
+    ]
+    q = InsertQueryBuilder(UpsertModel, con).bulk(
+        {"id_": x, "name": n, "nick": n}
+        for x, n in [(1, "a"), (2, "b"), (3, "c")]
+    )
+    q.on_conflict(do_nothing=True)
+
+    res = await q.execute_many()
+
+    # the skipped row is left out, and the others keep their order
+    assert [m.id_ for m in res] == [1, 3]
+
+
+@pytest.mark.asyncio
+async def test_iqb_copy_on_conflict(mocker):
+    con = mocker.AsyncMock(spec=apgorm.Connection)
+    con.fetchval.return_value = 1
+    q = InsertQueryBuilder(UpsertModel, con)._bulk_stored(
+        [{"id_": 1, "name": "a"}]
+    )
+    q.on_conflict(do_nothing=True)
+
+    assert await q.copy() == 1
+    con.copy_records_to_table.assert_called_once_with(
+        "_apgorm_copy_upsert", [(1, "a")], ("id_", "name"), schema="pg_temp"
+    )
+    assert "ON CONFLICT" in con.fetchval.call_args.args[0]
+    assert "FROM pg_temp._apgorm_copy_upsert" in con.fetchval.call_args.args[0]
+    assert [c.args[0] for c in con.execute.call_args_list] == [
+        "DROP TABLE IF EXISTS pg_temp._apgorm_copy_upsert",
+        "CREATE TEMPORARY TABLE pg_temp._apgorm_copy_upsert AS SELECT id_ , "
+        "name FROM upsert WITH NO DATA",
+        "DROP TABLE pg_temp._apgorm_copy_upsert",
+    ]
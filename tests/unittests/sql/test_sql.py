@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import pytest
+
+from apgorm import Block, Parameter, Raw, and_, join, raw, sql, wrap
+
+
+def test_render_nested():
+    q = sql(raw("SELECT"), wrap(1, raw("+"), wrap(2)), raw("WHERE"), and_(3))
+
+    assert q.render() == ("SELECT ( $1 + ( $2 ) ) WHERE ( $3 )", [1, 2, 3])
+
+
+def test_render_ignores_outer_wrap():
+    assert wrap(raw("x"), 1).render() == ("x $1", [1])
+
+
+def test_get_pieces():
+    q = sql(raw("a"), wrap(1))
+
+    assert [str(p) for p in q.get_pieces() if isinstance(p, Raw)] == [
+        "a",
+        "(",
+        ")",
+    ]
+    assert [p.value for p in q.get_pieces() if isinstance(p, Parameter)] == [1]
+    assert len(q.get_pieces(force_wrap=True)) == 6
+
+
+def test_children_are_nested():
+    child = sql(raw("child"), 1)
+    parent = sql(raw("a"), child, child)
+
+    assert isinstance(parent._pieces[1], Block)
+    assert parent.render() == ("a child $1 child $2", [1, 1])
+
+
+def test_children_are_snapshots():
+    child = sql(raw("a"), 1)
+    parent = sql(raw("SELECT"), child)
+    child += raw("b")
+
+    assert parent.render() == ("SELECT a $1", [1])
+    assert child.render() == ("a $1 b", [1])
+
+
+def test_iadd_self():
+    q = sql(raw("x"), 1)
+    q += q
+
+    assert q.render() == ("x $1 x $2", [1, 1])
+
+
+def test_trivial_children_are_inlined():
+    parent = sql(raw("a"), raw("b"), sql())
+
+    assert all(isinstance(p, Raw) for p in parent._pieces)
+    assert parent.render() == ("a b", [])
+
+
+def test_iadd():
+    q = raw("a")
+    q += wrap(raw("b"))
+    q += Parameter(1)
+
+    assert q.render() == ("a ( b ) $1", [1])
+
+    with pytest.raises(TypeError):
+        q += "c"
+
+
+def test_join():
+    q = join(raw(","), *range(300), wrap=True)
+    query, params = q.render()
+
+    assert params == list(range(300))
+    assert query.count(",") == 299
+
+
+def test_deep_nesting():
+    q = raw("x").eq(0)
+    for x in range(5000):
+        q = and_(q, raw("x").eq(x))
+
+    query, params = q.render()
+    assert len(params) == 5001
+    assert query.count("(") == query.count(")")
+    assert isinstance(q, Block)
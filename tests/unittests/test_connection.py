@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+
+import asyncpg
 import pytest
 
-from apgorm import Connection, LazyList, Pool
+from apgorm import Connection, LazyList, Pool, StatementStats
+from apgorm.connection import StatementCache
 
 
 @pytest.fixture
@@ -33,6 +37,16 @@ async def test_connection_fetchrow(async_mocked_con):
     async_mocked_con.fetchrow.assert_called_once_with("SELECT $1", 1)
 
 
+@pytest.mark.asyncio
+async def test_connection_fetchrecord(async_mocked_con):
+    con = Connection(async_mocked_con)
+
+    res = await con.fetchrecord("SELECT $1", [1])
+
+    assert res is async_mocked_con.fetchrow.return_value
+    async_mocked_con.fetchrow.assert_called_once_with("SELECT $1", 1)
+
+
 @pytest.mark.asyncio
 async def test_connection_fetchmany(async_mocked_con):
     con = Connection(async_mocked_con)
@@ -45,6 +59,16 @@ async def test_connection_fetchmany(async_mocked_con):
     async_mocked_con.fetch.assert_called_once_with("SELECT $1", 1)
 
 
+@pytest.mark.asyncio
+async def test_connection_fetchrecords(async_mocked_con):
+    con = Connection(async_mocked_con)
+
+    res = await con.fetchrecords("SELECT $1", [1])
+
+    assert res is async_mocked_con.fetch.return_value
+    async_mocked_con.fetch.assert_called_once_with("SELECT $1", 1)
+
+
 @pytest.mark.asyncio
 async def test_connection_fetchval(async_mocked_con):
     con = Connection(async_mocked_con)
@@ -64,6 +88,68 @@ def test_connection_cursor(mocker):
     mocked_con.cursor.assert_called_once_with("SELECT $1", 1)
 
 
+@pytest.mark.asyncio
+async def test_connection_executemany(async_mocked_con):
+    con = Connection(async_mocked_con)
+
+    await con.executemany("SELECT $1", [[1], [2]])
+
+    async_mocked_con.executemany.assert_called_once_with(
+        "SELECT $1", [[1], [2]]
+    )
+
+
+@pytest.fixture
+def batch_con(mocker, async_mocked_con):
+    transaction = mocker.AsyncMock()
+    async_mocked_con.transaction = mocker.Mock(return_value=transaction)
+    return async_mocked_con
+
+
+@pytest.mark.asyncio
+async def test_batch(batch_con):
+    con = Connection(batch_con)
+
+    async with con.batch() as batch:
+        futures = [
+            batch.add("A $1", [1]),
+            batch.add("A $1", [2]),
+            batch.add("B"),
+            batch.add("A $1", [3]),
+        ]
+        assert len(batch) == 4
+        batch_con.execute.assert_not_called()
+
+    batch_con.transaction.assert_called_once_with()
+    batch_con.executemany.assert_called_once_with("A $1", [[1], [2]])
+    assert batch_con.execute.call_args_list == [(("B",),), (("A $1", 3),)]
+    assert [f.result() for f in futures] == [None] * 4
+    assert len(batch) == 0
+
+
+@pytest.mark.asyncio
+async def test_batch_error(batch_con):
+    batch_con.execute.side_effect = RuntimeError
+    batch = Connection(batch_con).batch()
+    futures = [batch.add("A"), batch.add("B")]
+
+    with pytest.raises(RuntimeError):
+        await batch.send()
+    assert all(isinstance(f.exception(), RuntimeError) for f in futures)
+
+
+@pytest.mark.asyncio
+async def test_batch_not_sent_on_error(batch_con):
+    with pytest.raises(RuntimeError):
+        async with Connection(batch_con).batch() as batch:
+            future = batch.add("A")
+            raise RuntimeError
+
+    batch_con.execute.assert_not_called()
+    with pytest.raises(asyncio.CancelledError):
+        await future
+
+
 def test_connection_transaction(mocker):
     mocked_con = mocker.Mock()
     con = Connection(mocked_con)
@@ -93,3 +179,137 @@ async def test_pool(mocker, async_mocked_con):
     mocked_pool.close.assert_called_once()
     mocked_pac.__aenter__.assert_called_once()
     mocked_pac.__aexit__.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_connection_copy_records_to_table(async_mocked_con):
+    async_mocked_con.copy_records_to_table.return_value = "COPY 2"
+    con = Connection(async_mocked_con)
+
+    res = await con.copy_records_to_table("users", [(1,), (2,)], ["id"])
+
+    assert res == 2
+    async_mocked_con.copy_records_to_table.assert_called_once_with(
+        "users", records=[(1,), (2,)], columns=["id"], schema_name=None
+    )
+
+
+@pytest.fixture
+def prepared_con(mocker):
+    subcon = mocker.AsyncMock(spec=asyncpg.Connection)
+    subcon.add_termination_listener = mocker.Mock()
+    subcon.is_in_transaction = mocker.Mock(return_value=False)
+
+    stmt = subcon.prepare.return_value = mocker.AsyncMock()
+    stmt.fetchrow.return_value = {"hello": "world"}
+    stmt.fetch.return_value = [{"hello": "world"}]
+    stmt.fetchval.return_value = "hello, world"
+    stmt.get_statusmsg = mocker.Mock(return_value="UPDATE 1")
+
+    # cached statements are wrapped again each time they are used
+    mocker.patch(
+        "asyncpg.prepared_stmt.PreparedStatement",
+        side_effect=lambda con, query, state: stmt,
+    )
+    return subcon
+
+
+@pytest.mark.asyncio
+async def test_connection_prepared(prepared_con):
+    stats = StatementStats()
+    con = Connection(prepared_con, StatementCache(2, stats))
+    stmt = prepared_con.prepare.return_value
+
+    assert await con.fetchrow("SELECT $1", [1]) == {"hello": "world"}
+    assert list(await con.fetchmany("SELECT $1", [1])) == [{"hello": "world"}]
+    assert await con.fetchrecord("SELECT $1", [1]) == {"hello": "world"}
+    assert await con.fetchrecords("SELECT $1", [1]) == [{"hello": "world"}]
+    assert await con.fetchval("SELECT $1", [1]) == "hello, world"
+    assert await con.execute("UPDATE $1", [1]) == "UPDATE 1"
+
+    prepared_con.fetchrow.assert_not_called()
+    assert stmt.fetchrow.call_count == 2
+    assert prepared_con.prepare.call_count == 2
+    assert (stats.hits, stats.misses, stats.evictions) == (4, 2, 0)
+    assert stats.hit_rate == 4 / 6
+
+
+@pytest.mark.asyncio
+async def test_connection_prepared_execute_no_params(prepared_con):
+    con = Connection(prepared_con, StatementCache(2, StatementStats()))
+
+    await con.execute("CREATE TABLE a (); CREATE TABLE b ();")
+
+    prepared_con.prepare.assert_not_called()
+    prepared_con.execute.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_connection_prepared_outdated(prepared_con):
+    stmt = prepared_con.prepare.return_value
+    stmt.fetchval.side_effect = [asyncpg.InvalidCachedStatementError(""), 1]
+    con = Connection(prepared_con, StatementCache(2, StatementStats()))
+
+    assert await con.fetchval("SELECT 1") == 1
+    assert prepared_con.prepare.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_statement_cache_evicts(prepared_con):
+    stats = StatementStats()
+    cache = StatementCache(2, stats)
+
+    for query in ["a", "b", "a", "c", "b"]:
+        await cache.get(prepared_con, query)
+
+    assert [c.args[0] for c in prepared_con.prepare.call_args_list] == [
+        "a",
+        "b",
+        "c",
+        "b",
+    ]
+    assert (stats.hits, stats.misses, stats.evictions) == (1, 4, 2)
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_statement_cache_rebind_fallback(mocker, prepared_con):
+    # if asyncpg's internals change, statements are prepared again
+    mocker.patch(
+        "asyncpg.prepared_stmt.PreparedStatement", side_effect=TypeError
+    )
+    stats = StatementStats()
+    cache = StatementCache(2, stats)
+
+    for query in ["a", "a"]:
+        assert await cache.get(prepared_con, query) is (
+            prepared_con.prepare.return_value
+        )
+
+    assert prepared_con.prepare.call_count == 2
+    assert (stats.hits, stats.misses, stats.evictions) == (0, 2, 0)
+    assert len(cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_statement_cache(mocker, prepared_con):
+    mocked_pac = mocker.AsyncMock()
+    mocked_pac.__aenter__.return_value = prepared_con
+    mocked_pool = mocker.Mock()
+    mocked_pool.acquire.return_value = mocked_pac
+
+    pool = Pool(mocked_pool, prepare_cache=10)
+    async with pool.acquire() as first:
+        pass
+    async with pool.acquire() as second:
+        pass
+
+    assert first.statements is not None
+    assert first.statements is second.statements
+    assert first.statements.stats is pool.stats
+    assert Pool(mocked_pool)._statement_cache(prepared_con) is None
+
+    # the cache is dropped when the connection is closed
+    (listener,) = prepared_con.add_termination_listener.call_args.args
+    listener(prepared_con)
+    assert pool._caches == {}
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from enum import IntEnum, IntFlag
 
-from apgorm import IntEFConverter
+from apgorm import Converter, IntEFConverter
 
 
 class IE(IntEnum):
@@ -27,3 +27,27 @@ def test_intefconverter_as_intflag() -> None:
     ifc = IntEFConverter(IF)
     assert ifc.from_stored((IF.ONE | IF.TWO).value) == (IF.ONE | IF.TWO)
     assert ifc.to_stored(IF.ONE | IF.THREE) == (IF.ONE | IF.THREE).value
+
+
+def test_intefconverter_many() -> None:
+    iec = IntEFConverter(IE)
+    ifc = IntEFConverter(IF)
+    assert iec.from_stored_many([3, 1]) == [IE.THREE, IE.ONE]
+    assert iec.to_stored_many([IE.TWO]) == [2]
+    assert ifc.from_stored_many([(IF.ONE | IF.TWO).value, 1]) == [
+        IF.ONE | IF.TWO,
+        IF.ONE,
+    ]
+
+
+def test_converter_many_defaults() -> None:
+    class StrConverter(Converter[int, str]):
+        def from_stored(self, value: int) -> str:
+            return str(value)
+
+        def to_stored(self, value: str) -> int:
+            return int(value)
+
+    c = StrConverter()
+    assert c.from_stored_many([1, 2]) == ["1", "2"]
+    assert c.to_stored_many(["1", "2"]) == [1, 2]
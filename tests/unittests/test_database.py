@@ -83,9 +83,13 @@ def db(mocker: MockerFixture) -> PatchedDBMethods:
     tc.__aexit__.return_value = None
     con.transaction.return_value = tc
     con.execute = areturn()
+    con.executemany = areturn()
     con.fetchrow = areturn({"hello": "world"})
     con.fetchmany = areturn([{"hello": "world"}])
+    con.fetchrecord = areturn({"hello": "world"})
+    con.fetchrecords = areturn([{"hello": "world"}])
     con.fetchval = areturn("hello, world")
+    con.copy_records_to_table = areturn(2)
 
     curr = mocker.Mock()
     con.cursor.return_value = curr
@@ -113,6 +117,7 @@ async def test_connect(mocker: MockerFixture):
 
     cn.assert_called_once_with(hello="world")
     assert DB.pool.pool is fut.result()
+    assert DB.pool.prepare_cache == 0
 
 
 @pytest.mark.asyncio
@@ -135,7 +140,32 @@ async def test_execute(db: PatchedDBMethods):
 
     assert_transaction(db)
     db.con.execute.assert_called_once_with("HELLO $1", ["world"])
-    assert ret is None
+    assert ret == db.con.execute.return_value
+
+
+@pytest.mark.asyncio
+async def test_executemany(db: PatchedDBMethods):
+    await DB.executemany("HELLO $1", [["a"], ["b"]])
+
+    assert_transaction(db)
+    db.con.executemany.assert_called_once_with("HELLO $1", [["a"], ["b"]])
+
+
+@pytest.mark.asyncio
+async def test_batch(db: PatchedDBMethods):
+    async with DB.batch() as batch:
+        batch.add(User.update_query().where(name="a").set(nick="b"))
+        batch.add(User.delete_query().where(name="c"))
+        batch.add(User.insert_query().set(name="d"))
+        with pytest.raises(apgorm.exceptions.BadArgument):
+            batch.add(User.fetch_query())
+
+    assert_transaction(db)
+    assert [c.args for c in db.con.execute.call_args_list] == [
+        ("UPDATE users SET nick = $1 WHERE ( name = $2 )", ["b", "a"]),
+        ("DELETE FROM users WHERE ( name = $1 )", ["c"]),
+        ("INSERT INTO users ( name ) VALUES ( $1 )", ["d"]),
+    ]
 
 
 @pytest.mark.asyncio
@@ -147,6 +177,15 @@ async def test_fetchrow(db: PatchedDBMethods):
     assert ret == db.con.fetchrow.return_value
 
 
+@pytest.mark.asyncio
+async def test_fetchrecord(db: PatchedDBMethods):
+    ret = await DB.fetchrecord("HELLO $1", ["world"])
+
+    assert_transaction(db)
+    db.con.fetchrecord.assert_called_once_with("HELLO $1", ["world"])
+    assert ret == db.con.fetchrecord.return_value
+
+
 @pytest.mark.asyncio
 async def test_fetchmany(db: PatchedDBMethods):
     ret = await DB.fetchmany("HELLO $1", ["world"])
@@ -156,6 +195,15 @@ async def test_fetchmany(db: PatchedDBMethods):
     assert ret == db.con.fetchmany.return_value
 
 
+@pytest.mark.asyncio
+async def test_fetchrecords(db: PatchedDBMethods):
+    ret = await DB.fetchrecords("HELLO $1", ["world"])
+
+    assert_transaction(db)
+    db.con.fetchrecords.assert_called_once_with("HELLO $1", ["world"])
+    assert ret == db.con.fetchrecords.return_value
+
+
 @pytest.mark.asyncio
 async def test_fetchval(db: PatchedDBMethods):
     ret = await DB.fetchval("HELLO $1", ["world"])
@@ -165,6 +213,41 @@ async def test_fetchval(db: PatchedDBMethods):
     assert ret == db.con.fetchval.return_value
 
 
+@pytest.mark.parametrize(
+    "method",
+    [
+        "execute",
+        "fetchrow",
+        "fetchrecord",
+        "fetchmany",
+        "fetchrecords",
+        "fetchval",
+    ],
+)
+@pytest.mark.asyncio
+async def test_autocommit_per_call(db: PatchedDBMethods, method: str):
+    ret = await getattr(DB, method)("HELLO $1", ["world"], autocommit=True)
+
+    db.pool.acquire.assert_called_once_with()
+    db.con.transaction.assert_not_called()
+    getattr(db.con, method).assert_called_once_with("HELLO $1", ["world"])
+    assert ret == getattr(db.con, method).return_value
+
+
+@pytest.mark.asyncio
+async def test_autocommit_per_database(
+    db: PatchedDBMethods, mocker: MockerFixture
+):
+    assert DB.autocommit is False
+    mocker.patch.object(DB, "autocommit", True)
+
+    await DB.fetchrow("HELLO $1", ["world"])
+    db.con.transaction.assert_not_called()
+
+    await DB.fetchrow("HELLO $1", ["world"], autocommit=False)
+    db.con.transaction.assert_called_once_with()
+
+
 @pytest.mark.asyncio
 async def test_cursor(db: PatchedDBMethods):
     async with DB.cursor("HELLO $1", ["world"]) as curr:
@@ -183,3 +266,61 @@ async def test_cursor_with_con(db: PatchedDBMethods):
 
     assert_transaction(db)
     db.con.cursor.assert_called_once_with("HELLO $1", ["world"])
+
+
+@pytest.mark.asyncio
+async def test_copy_records_to_table(db: PatchedDBMethods):
+    ret = await DB.copy_records_to_table("users", [("a",)], ["name"])
+
+    assert_transaction(db)
+    db.con.copy_records_to_table.assert_called_once_with(
+        "users", [("a",)], ["name"]
+    )
+    assert ret == 2
+
+
+@pytest.mark.asyncio
+async def test_transaction(db: PatchedDBMethods):
+    async with DB.transaction() as con:
+        assert con is db.con
+
+    assert_transaction(db)
+
+
+@pytest.mark.asyncio
+async def test_transaction_binds_connection(
+    db: PatchedDBMethods, mocker: MockerFixture
+):
+    mocker.patch.object(User, "database", DB)
+
+    async with DB.transaction() as con:
+        assert apgorm.FetchQueryBuilder(User).con is con
+        assert await DB.fetchval("HELLO", []) == db.con.fetchval.return_value
+
+        async with DB.transaction() as nested:
+            assert nested is con
+
+        with DB.detach():
+            assert apgorm.FetchQueryBuilder(User).con is DB
+            async with DB.transaction():
+                pass
+
+        assert apgorm.FetchQueryBuilder(User).con is con
+
+    assert apgorm.FetchQueryBuilder(User).con is DB
+    # one connection for the outer transaction, one for the detached one
+    assert db.pool.acquire.call_count == 2
+    # outer transaction, savepoint, detached transaction
+    assert db.con.transaction.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_transaction_not_shared_between_databases(
+    db: PatchedDBMethods, mocker: MockerFixture
+):
+    other = mocker.Mock()
+
+    async with DB.transaction():
+        assert apgorm.FetchQueryBuilder(mocker.Mock(database=other)).con is (
+            other
+        )
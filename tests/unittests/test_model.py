@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import IntEnum
 from typing import Any
@@ -95,6 +97,8 @@ def db(mocker: MockerFixture) -> PatchedDBMethods:
     con.execute = areturn()
     con.fetchrow = areturn({"hello": "world"})
     con.fetchmany = areturn([{"hello": "world"}])
+    con.fetchrecord = areturn({"hello": "world"})
+    con.fetchrecords = areturn([{"hello": "world"}])
     con.fetchval = areturn("hello, world")
 
     curr = mocker.Mock()
@@ -132,6 +136,15 @@ def test_validate_in_init():
     User._from_raw(status=UserStatus.INVISIBLE.value)
 
 
+def test_from_record():
+    user = User._from_record({"userid": 1, "name": "name", "status": 0})
+
+    assert user.name == "name"
+    assert user.status is UserStatus.OFFLINE
+    assert user._raw_values == {"userid": 1, "name": "name", "status": 0}
+    assert user._changed_fields == 0
+
+
 def test_gets_default():
     user = User()
 
@@ -140,6 +153,186 @@ def test_gets_default():
     assert "name" not in user._raw_values
 
 
+def test_generated_init():
+    user = User(name="name", unknown="ignored")
+
+    assert User.__init__.__qualname__ == "User.__init__"
+    assert user._raw_values == {
+        "name": "name",
+        "status": 0,
+        "default_fact": "hello, world",
+    }
+    assert user._changed_fields == 0
+    assert not hasattr(user, "__dict__")
+    with pytest.raises(TypeError):
+        User("name")
+
+
+def test_custom_init():
+    class Custom(apgorm.Model):
+        __slots__ = ("extra",)
+
+        id_ = Int().field()
+        primary_key = (id_,)
+
+        def __init__(self, **values: Any) -> None:
+            super().__init__(**values)
+            self.extra = True
+
+    custom = Custom(id_=1)
+
+    assert custom.id_ == 1
+    assert custom.extra
+
+
+def test_inherited_custom_init():
+    class Base(apgorm.Model):
+        __slots__ = ("extra",)
+
+        def __init__(self, **values: Any) -> None:
+            super().__init__(**values)
+            self.extra = True
+
+    class Sub(Base):
+        id_ = Int().field()
+        primary_key = (id_,)
+
+    sub = Sub(id_=1)
+
+    assert Sub.__init__ is Base.__init__
+    assert sub.id_ == 1
+    assert sub.extra
+
+
+def test_custom_init_keeps_dict():
+    class Custom(apgorm.Model):
+        id_ = Int().field()
+        primary_key = (id_,)
+
+        def __init__(self, **values: Any) -> None:
+            super().__init__(**values)
+            self.extra = True
+
+    assert Custom(id_=1).extra
+
+
+def test_slots_opt_out():
+    class Loose(apgorm.Model, slots=False):
+        id_ = Int().field()
+        primary_key = (id_,)
+
+    loose = Loose(id_=1)
+    loose.extra = True
+
+    assert loose.extra
+    with pytest.raises(AttributeError):
+        User().extra = True  # type: ignore
+
+
+def test_class_kwargs_forwarded():
+    class Base(apgorm.Model):
+        tag: str | None = None
+
+        def __init_subclass__(cls, tag: str | None = None, **kwargs: Any):
+            super().__init_subclass__(**kwargs)
+            cls.tag = tag
+
+    class Tagged(Base, tag="tagged"):
+        id_ = Int().field()
+        primary_key = (id_,)
+
+    assert Tagged.tag == "tagged"
+    assert Tagged(id_=1).id_ == 1
+
+
+def test_generated_init_is_regenerated():
+    class Sub(User):
+        extra = VarChar(32).field(default="extra")
+
+    assert Sub.__init__ is not User.__init__
+    assert Sub()._raw_values == {"extra": "extra"}
+
+
+def test_cached_converter(mocker: MockerFixture):
+    class Cached(apgorm.Model):
+        id_ = Int().field()
+        status = (
+            Int()
+            .field()
+            .with_converter(apgorm.IntEFConverter(UserStatus), cache=True)
+        )
+        primary_key = (id_,)
+
+    spy = mocker.spy(apgorm.IntEFConverter, "from_stored")
+    model = Cached._from_raw(id_=1, status=2)
+
+    assert model.status is UserStatus.ONLINE
+    assert model.status is UserStatus.ONLINE
+    assert spy.call_count == 1
+
+    model.status = UserStatus.DND
+    assert model.status is UserStatus.DND
+    model._update_raw({"status": 0})
+    assert model.status is UserStatus.OFFLINE
+    assert spy.call_count == 3
+
+
+def test_from_records(mocker: MockerFixture):
+    class Cached(apgorm.Model):
+        id_ = Int().field()
+        status = (
+            Int()
+            .field()
+            .with_converter(apgorm.IntEFConverter(UserStatus), cache=True)
+        )
+        primary_key = (id_,)
+
+    many = mocker.spy(apgorm.IntEFConverter, "from_stored_many")
+    single = mocker.spy(apgorm.IntEFConverter, "from_stored")
+    models = Cached._from_records([{"id_": 1, "status": 2}, {"id_": 2}])
+
+    assert models[0].status is UserStatus.ONLINE
+    assert models[1]._converted is None
+    assert many.call_args.args[1] == [2]
+    single.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_from_records_in(mocker: MockerFixture):
+    class Cached(apgorm.Model):
+        id_ = Int().field()
+        status = (
+            Int()
+            .field()
+            .with_converter(apgorm.IntEFConverter(UserStatus), cache=True)
+        )
+        primary_key = (id_,)
+
+    many = mocker.spy(apgorm.IntEFConverter, "from_stored_many")
+    records = [{"id_": 1, "status": 2}, {"id_": 2}, {"id_": 3, "status": 0}]
+    with ThreadPoolExecutor() as executor:
+        models = await Cached._from_records_in(executor, records, 2)
+
+    assert [m.id_ for m in models] == [1, 2, 3]
+    assert models[0]._converted == {"status": UserStatus.ONLINE}
+    assert models[1]._converted is None
+    assert models[2]._converted == {"status": UserStatus.OFFLINE}
+    assert [c.args[1] for c in many.call_args_list] == [[2], [0]]
+
+    with ThreadPoolExecutor() as executor:
+        users = await User._from_records_in(executor, [{"userid": 1}], 2)
+    assert users[0]._raw_values == {"userid": 1}
+
+
+def test_changed_fields():
+    user = User._from_raw(userid=1, name="name", status=0)
+    user.status = UserStatus.ONLINE
+    user.nick = "nick"
+
+    assert user._changed_fields == 1 << User.nick._index | 1 << 3
+    assert user._get_changed_fields() == {"nick": "nick", "status": 2}
+
+
 @pytest.mark.asyncio
 async def test_delete(db: PatchedDBMethods, mocker: MockerFixture):
     async def new_execute(self: apgorm.DeleteQueryBuilder):
@@ -193,3 +386,159 @@ async def test_save_none_to_save(db: PatchedDBMethods, mocker: MockerFixture):
     await user.save()
 
     spy.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_many(db: PatchedDBMethods, mocker: MockerFixture):
+    copy = mocker.patch.object(apgorm.InsertQueryBuilder, "copy")
+    users = [User(name="a"), User(name="b")]
+
+    ret = await User.create_many(users)
+
+    assert all(r is u for r, u in zip(ret, users))
+    copy.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_create_many_returning(
+    db: PatchedDBMethods, mocker: MockerFixture
+):
+    async def new_execute_many(self: apgorm.InsertQueryBuilder):
+        assert [r["name"] for r in self._bulk_rows] == ["a", "b"]
+        return [User._from_raw(userid=1), User._from_raw(userid=2)]
+
+    mocker.patch.object(
+        apgorm.InsertQueryBuilder, "execute_many", new_execute_many
+    )
+    users = [User(name="a"), User(name="b")]
+
+    await User.create_many(users, returning=True)
+
+    assert [u.userid for u in users] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_save_many(db: PatchedDBMethods, mocker: MockerFixture):
+    async def new_execute_many(self: apgorm.UpdateQueryBuilder):
+        assert self._bulk_rows == [{"userid": 1, "name": "New Name"}]
+        return [User._from_raw(userid=1, name="New Name", nick="updated")]
+
+    mocker.patch.object(
+        apgorm.UpdateQueryBuilder, "execute_many", new_execute_many
+    )
+
+    user = User(userid=1)
+    user.name = "New Name"
+    unchanged = User(userid=2)
+    await User.save_many([user, unchanged])
+
+    assert user.nick == "updated"
+    assert not user._changed_fields
+
+
+@pytest.mark.asyncio
+async def test_save_many_not_found(
+    db: PatchedDBMethods, mocker: MockerFixture
+):
+    async def new_execute_many(self: apgorm.UpdateQueryBuilder):
+        return [None]
+
+    mocker.patch.object(
+        apgorm.UpdateQueryBuilder, "execute_many", new_execute_many
+    )
+
+    user = User(userid=1)
+    user.name = "New Name"
+    with pytest.raises(apgorm.exceptions.ModelNotFound):
+        await User.save_many([user])
+
+
+@pytest.mark.asyncio
+async def test_save_many_partly_not_found(
+    db: PatchedDBMethods, mocker: MockerFixture
+):
+    async def new_execute_many(self: apgorm.UpdateQueryBuilder):
+        return [User._from_raw(userid=1, name="New Name", nick="saved"), None]
+
+    mocker.patch.object(
+        apgorm.UpdateQueryBuilder, "execute_many", new_execute_many
+    )
+
+    found = User(userid=1)
+    found.name = "New Name"
+    missing = User(userid=2)
+    missing.name = "Other Name"
+    with pytest.raises(apgorm.exceptions.ModelNotFound):
+        await User.save_many([found, missing])
+
+    # raised inside the transaction, so the update of `found` is rolled back
+    assert_transaction(db)
+    aexit = db.con.transaction.return_value.__aexit__
+    assert aexit.call_args.args[0] is apgorm.exceptions.ModelNotFound
+    assert found._changed_fields and missing._changed_fields
+    assert "nick" not in found._raw_values
+
+
+@pytest.mark.asyncio
+async def test_refetch_deferred(db: PatchedDBMethods, mocker: MockerFixture):
+    async def new_fetchone(self: apgorm.FetchQueryBuilder):
+        assert [f.name for f in self._fields] == ["nick", "default_fact"]
+        return User._from_raw(nick="nick", default_fact="fact")
+
+    mocker.patch.object(apgorm.FetchQueryBuilder, "fetchone", new_fetchone)
+
+    user = User._from_raw(userid=1, name="name", status=0)
+    await user.refetch(deferred=True)
+
+    assert user.name == "name"
+    assert user.nick == "nick"
+    assert user.default_fact == "fact"
+
+    spy = mocker.spy(apgorm.FetchQueryBuilder, "fetchone")
+    await user.refetch(deferred=True)
+    spy.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_load(db: PatchedDBMethods):
+    db.con.fetchrecords.return_value = [
+        {"userid": 2, "name": "two", "status": 0},
+        {"userid": 1, "name": "one", "status": 0},
+    ]
+
+    one, two, again = await asyncio.gather(
+        User.load(1), User.load(2), User.load(1)
+    )
+
+    assert (one.name, two.name) == ("one", "two")
+    assert again is one
+    db.con.fetchrecords.assert_called_once_with(
+        "SELECT * FROM users WHERE ( users.userid = ANY ( $1 ::INTEGER[] ) )",
+        [[1, 2]],
+    )
+
+
+@pytest.mark.asyncio
+async def test_load_composite(db: PatchedDBMethods):
+    db.con.fetchrecords.return_value = [{"userid": 1, "gameid": 2}]
+
+    player, missing = await asyncio.gather(
+        Player.load(1, 2), Player.load(1, 3), return_exceptions=True
+    )
+
+    assert isinstance(player, Player)
+    assert isinstance(missing, apgorm.exceptions.ModelNotFound)
+    assert db.con.fetchrecords.call_args.args[1] == [[1, 1], [2, 3]]
+
+
+@pytest.mark.asyncio
+async def test_load_error(db: PatchedDBMethods):
+    db.con.fetchrecords.side_effect = RuntimeError
+
+    results = await asyncio.gather(
+        User.load(1), User.load(2), return_exceptions=True
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+    with pytest.raises(apgorm.exceptions.BadArgument):
+        await Player.load(1)
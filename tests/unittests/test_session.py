@@ -0,0 +1,359 @@
+from __future__ import annotations
+
+import gc
+from contextlib import asynccontextmanager
+
+import pytest
+from pytest_mock import MockerFixture
+
+import apgorm
+from apgorm.connection import _BOUND, _bind_connection
+from apgorm.session import _dependency_order
+from apgorm.types import Array, Int, VarChar
+
+
+class User(apgorm.Model):
+    id_ = Int().field()
+    name = VarChar(32).field()
+
+    primary_key = (id_,)
+
+
+class Player(apgorm.Model):
+    user_id = Int().field()
+    game_id = Int().field()
+
+    primary_key = (user_id, game_id)
+
+
+class Post(apgorm.Model):
+    id_ = Int().field()
+    tags = Array(VarChar(32)).field()
+
+    primary_key = (id_,)
+
+
+class Database(apgorm.Database):
+    users = User
+    players = Player
+    posts = Post
+
+
+DB = Database(None)
+
+
+def test_merge():
+    with DB.session() as session:
+        user = User._from_record({"id_": 1, "name": "old"})
+        user.name = "changed"
+        again = User._from_record({"id_": 1, "name": "new"})
+
+        assert again is user
+        assert user.name == "changed"
+        assert session.get(User, 1) is user
+        assert len(session) == 1
+
+        player = Player._from_record({"user_id": 1, "game_id": 2})
+        assert session.get(Player, 1, 2) is player
+
+    assert User._from_record({"id_": 1, "name": "new"}) is not user
+
+
+def test_merge_refreshes_clean_fields():
+    with DB.session():
+        user = User._from_record({"id_": 1, "name": "old"})
+        User._from_record({"id_": 1, "name": "new"})
+
+        assert user.name == "new"
+
+
+def test_merge_extra_columns():
+    with DB.session():
+        user = User._from_record({"id_": 1, "name": "old", "extra": 1})
+        again = User._from_record({"id_": 1, "name": "new", "extra": 2})
+
+        assert again is user
+        assert user.name == "new"
+
+
+def test_merge_without_pk():
+    with DB.session() as session:
+        first = User._from_record({"name": "name"})
+        assert User._from_record({"name": "name"}) is not first
+        assert len(session) == 0
+
+
+def test_weak_references():
+    with DB.session() as session:
+        User._from_record({"id_": 1, "name": "name"})
+        gc.collect()
+
+        assert session.get(User, 1) is None
+        assert len(session) == 0
+
+
+def test_sessions_are_per_database():
+    other = Database(None)
+    User.database = (
+        Player.database
+    ) = Post.database = DB  # Database() took them
+
+    with other.session() as session:
+        user = User._from_record({"id_": 1, "name": "name"})
+        assert session.get(User, 1) is None
+        assert user is not User._from_record({"id_": 1, "name": "name"})
+
+
+@pytest.mark.asyncio
+async def test_fetch_from_session(mocker: MockerFixture):
+    spy = mocker.patch.object(apgorm.FetchQueryBuilder, "fetchone")
+    with DB.session():
+        user = User._from_record({"id_": 1, "name": "name"})
+
+        assert await User.fetch(id_=1) is user
+        spy.assert_not_called()
+
+        await User.fetch(name="name")
+        spy.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_create_and_delete(mocker: MockerFixture):
+    row = {"id_": 1, "name": "name"}
+    mocker.patch.object(Database, "fetchrecord", return_value=row)
+    mocker.patch.object(Database, "fetchrecords", return_value=[row])
+
+    with DB.session() as session:
+        user = await User(name="name").create()
+        assert session.get(User, 1) is user
+
+        deleted = await user.delete()
+        assert deleted is not user
+        assert deleted.name == "name"
+        assert session.get(User, 1) is None
+
+
+@pytest.mark.asyncio
+async def test_partial_models_not_merged(mocker: MockerFixture):
+    mocker.patch.object(Database, "fetchrecords", return_value=[{"id_": 1}])
+    fetchrecord = mocker.patch.object(
+        Database, "fetchrecord", return_value={"id_": 1, "name": "name"}
+    )
+
+    with DB.session() as session:
+        (partial,) = await User.fetch_query().only(User.id_).fetchmany()
+        assert session.get(User, 1) is None
+
+        user = await User.fetch(id_=1)
+        fetchrecord.assert_called_once()
+        assert user is not partial
+        assert user.name == "name"
+        assert session.get(User, 1) is user
+
+
+@pytest.mark.asyncio
+async def test_delete_query_evicts(mocker: MockerFixture):
+    fetchrecords = mocker.patch.object(
+        Database, "fetchrecords", return_value=[{"id_": 1, "name": "name"}]
+    )
+    mocker.patch.object(Database, "fetchrecord", return_value=None)
+
+    with DB.session() as session:
+        user = User._from_record({"id_": 1, "name": "name"})
+        (deleted,) = await User.delete_query().where(name="name").execute()
+        assert deleted is not user
+        assert session.get(User, 1) is None
+        with pytest.raises(apgorm.exceptions.ModelNotFound):
+            await User.fetch(id_=1)
+
+        # without returning, only the primary keys are returned
+        user = User._from_record({"id_": 1, "name": "name"})
+        fetchrecords.return_value = [{"id_": 1}]
+        count = await User.delete_query().where(name="name").execute(False)
+        assert count == 1
+        assert session.get(User, 1) is None
+        assert fetchrecords.call_args.args[0] == (
+            "DELETE FROM users WHERE ( name = $1 ) RETURNING users.id_"
+        )
+
+
+@pytest.mark.asyncio
+async def test_update_query_evicts(mocker: MockerFixture):
+    fetchrecords = mocker.patch.object(
+        Database, "fetchrecords", return_value=[{"id_": 1}]
+    )
+
+    with DB.session() as session:
+        user = User._from_record({"id_": 1, "name": "name"})
+        q = User.update_query().where(name="name").set(name="new")
+        assert await q.execute(returning=False) == 1
+        assert session.get(User, 1) is None
+        assert fetchrecords.call_args.args[0] == (
+            "UPDATE users SET name = $1 WHERE ( name = $2 ) "
+            "RETURNING users.id_"
+        )
+
+        # rows returned with every field refresh the model instead
+        user = User._from_record({"id_": 1, "name": "name"})
+        fetchrecords.return_value = [{"id_": 1, "name": "new"}]
+        (updated,) = await q.execute()
+        assert updated is user
+        assert user.name == "new"
+
+
+@pytest.mark.asyncio
+async def test_save_and_refetch_overwrite(mocker: MockerFixture):
+    fetchrecords = mocker.patch.object(Database, "fetchrecords")
+    fetchrecord = mocker.patch.object(Database, "fetchrecord")
+
+    with DB.session() as session:
+        user = User._from_record({"id_": 1, "name": "name"})
+
+        user.name = "changed"
+        fetchrecords.return_value = [{"id_": 1, "name": "normalized"}]
+        await user.save()
+        assert user.name == "normalized"
+        assert user._changed_fields == 0
+
+        user.name = "local"
+        fetchrecord.return_value = {"id_": 1, "name": "database"}
+        await user.refetch()
+        assert user.name == "database"
+        assert session.get(User, 1) is user
+
+
+def test_dependency_order():
+    class Parent(apgorm.Model):
+        id_ = Int().field()
+        primary_key = (id_,)
+
+    class Child(apgorm.Model):
+        parent = Int().field()
+        parent_fk = apgorm.ForeignKey(parent, Parent.id_)
+        primary_key = (parent,)
+
+    class Raw(apgorm.Model):
+        parent = Int().field()
+        parent_fk = apgorm.ForeignKey(["parent"], ["id_"], ref_table="child")
+        primary_key = (parent,)
+
+    class Ordered(apgorm.Database):
+        raw = Raw
+        child = Child
+        parent = Parent
+
+    order = _dependency_order(Ordered(None))
+    assert order[:3] == [Parent, Child, Raw]
+
+
+def test_add_and_delete():
+    with DB.session() as session:
+        loaded = User._from_record({"id_": 1, "name": "name"})
+        new = User(name="new")
+
+        session.add(loaded)
+        session.add(new)
+        session.add(new)
+        assert session._new == [new]
+        assert list(session._tracked.values()) == [loaded]
+
+        session.delete(new)
+        session.delete(loaded)
+        assert session._new == []
+        assert list(session._deleted.values()) == [loaded]
+
+        with pytest.raises(apgorm.exceptions.BadArgument):
+            session.delete(User(name="no pk"))
+
+        other = Database(None)
+        User.database = Player.database = Post.database = DB
+        with pytest.raises(apgorm.exceptions.BadArgument):
+            other.session().add(loaded)
+
+
+@pytest.mark.asyncio
+async def test_flush(mocker: MockerFixture):
+    @asynccontextmanager
+    async def transaction(self: apgorm.Database):
+        yield
+
+    async def create_many(models, con=None, *, returning=False):
+        for x, m in enumerate(models):
+            m._update_raw({"id_": 10 + x})
+        return models
+
+    async def save_many(models, con=None):
+        for m in models:
+            m._changed_fields = 0
+
+    mocker.patch.object(Database, "transaction", transaction)
+    create = mocker.patch.object(
+        User, "create_many", side_effect=create_many, autospec=True
+    )
+    save = mocker.patch.object(
+        User, "save_many", side_effect=save_many, autospec=True
+    )
+    delete = mocker.patch.object(
+        Database, "fetchrecords", return_value=[{"id_": 2}]
+    )
+
+    async with DB.session() as session:
+        user = User._from_record({"id_": 1, "name": "name"})
+        user.name = "changed"
+        deleted = User._from_record({"id_": 2, "name": "name"})
+        new = User(name="new")
+        new.name = "newer"
+
+        session.add(new)
+        session.delete(deleted)
+
+    assert create.call_args.args[0] == [new]
+    assert list(save.call_args.args[0]) == [user]
+    assert delete.call_args.args[0].startswith("DELETE FROM users")
+    assert session.get(User, 10) is new
+    assert session.get(User, 2) is None
+    assert new._changed_fields == 0
+
+    await session.flush()
+    assert create.call_count == save.call_count == delete.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_no_flush_on_error(mocker: MockerFixture):
+    flush = mocker.patch.object(apgorm.Session, "flush")
+    with pytest.raises(RuntimeError):
+        async with DB.session():
+            raise RuntimeError
+    flush.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_flush_array_fields(mocker: MockerFixture):
+    con = mocker.AsyncMock(spec=apgorm.Connection)
+    con.transaction = mocker.Mock(return_value=mocker.AsyncMock())
+    con.fetchrecords.side_effect = [
+        [{"id_": 2, "tags": ["new"]}],
+        [{"id_": 1, "tags": ["changed"]}],
+    ]
+
+    @asynccontextmanager
+    async def transaction(self: apgorm.Database):
+        token = _bind_connection(self, con)
+        try:
+            yield con
+        finally:
+            _BOUND.reset(token)
+
+    mocker.patch.object(Database, "transaction", transaction)
+
+    async with DB.session() as session:
+        post = Post._from_record({"id_": 1, "tags": ["old"]})
+        post.tags = ["changed"]
+        session.add(Post(id_=2, tags=["new"]))
+
+    inserted, updated = [c.args for c in con.fetchrecords.call_args_list]
+    assert inserted[0].startswith("INSERT INTO posts ( id_ , tags ) VALUES")
+    assert inserted[1] == [2, ["new"]]
+    assert updated[0].startswith("UPDATE posts SET tags = $1")
+    assert updated[1] == [["changed"], 1]
+    assert post._changed_fields == 0
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import pytest
+
+from apgorm.types import Array, BigInt, Boolean, DoublePrecision, Int, Serial
+from apgorm.utils.columns import column_array, dtype
+
+numpy = pytest.importorskip("numpy")
+
+
+@pytest.mark.parametrize(
+    "type_,expected",
+    [
+        (Int(), "int32"),
+        (Serial(), "int32"),
+        (BigInt(), "int64"),
+        (DoublePrecision(), "float64"),
+        (Boolean(), "bool"),
+        (Array(Int()), "object"),
+    ],
+)
+def test_dtype(type_, expected):
+    assert dtype(type_.field()) == expected
+
+
+def test_column_array():
+    ints = column_array(Int().field(), [1, 2, 3])
+    assert ints.dtype == numpy.int32
+    assert ints.tolist() == [1, 2, 3]
+
+    arrays = column_array(Array(Int()).field(), [[1, 2], [3, 4]])
+    assert arrays.shape == (2,)
+    assert arrays[1] == [3, 4]
+
+
+def test_column_array_nulls():
+    field = DoublePrecision().nullablefield()
+    assert not isinstance(column_array(field, [1.0]), numpy.ma.MaskedArray)
+
+    floats = column_array(field, [1.0, None])
+    assert isinstance(floats, numpy.ma.MaskedArray)
+    assert floats.mask.tolist() == [False, True]
+    assert floats.dtype == numpy.float64
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
-from apgorm import LazyList
+import asyncio
+
+import pytest
+
+from apgorm import ConversionStats, LazyList
+from apgorm.exceptions import BadArgument
 
 
 def test_lazy_list():
@@ -19,3 +24,47 @@ def test_lazy_list():
 
     mll = LazyList([0, 1, 2, 3, 4], str)
     assert repr(mll)
+
+
+def test_lazy_list_memoized(mocker):
+    converter = mocker.Mock(side_effect=lambda v: [v])
+    ll = LazyList([0, 1, 2, 3], converter)
+
+    assert ll[1] is ll[1]
+    assert ll[1:3][0] is ll[1]
+    assert ll[::-1][2] is ll[1]
+    assert list(ll[1:][1:]) == [[2], [3]]
+    assert list(ll) == [[0], [1], [2], [3]]
+    assert converter.call_count == 4
+
+
+def test_lazy_list_to_list(mocker):
+    many = mocker.Mock(side_effect=lambda vs: [str(v) for v in vs])
+    ll = LazyList([0, 1, 2, 3], str, many)
+
+    first = ll[0]
+    assert ll[:3].to_list() == ["0", "1", "2"]
+    many.assert_called_once_with([1, 2])
+    assert ll.to_list()[0] is first
+    many.assert_called_with([3])
+
+    assert LazyList([0, 1], str).to_list() == ["0", "1"]
+
+
+@pytest.mark.asyncio
+async def test_lazy_list_materialize(mocker):
+    sleep = mocker.spy(asyncio, "sleep")
+    stats = ConversionStats()
+    ll = LazyList(range(5), str)
+
+    assert await ll.materialize(2, stats=stats) == ["0", "1", "2", "3", "4"]
+    assert sleep.call_count == 2
+    assert (stats.chunks, stats.rows) == (3, 5)
+    assert stats.blocking_time >= stats.max_block > 0
+    assert repr(stats)
+
+    assert [v async for v in ll] == ["0", "1", "2", "3", "4"]
+    assert [v async for v in ll[3:].iterate(1)] == ["3", "4"]
+
+    with pytest.raises(BadArgument):
+        await ll.materialize(0)